@@ -1,5 +1,8 @@
 from django.contrib import admin
-from categories.models import Category, SubCategory, CategoryTranslation, SubCategoryTranslation
+from django.db.models import Prefetch
+from categories.models import (
+    Category, CategoryCodeMapping, CategoryTranslation, SubCategory, SubCategoryTranslation
+)
 
 
 class CategoryTranslationInline(admin.TabularInline):
@@ -22,6 +25,9 @@ class CategoryAdmin(admin.ModelAdmin):
     ordering = ["id"]
     inlines = [CategoryTranslationInline]
 
+    def get_queryset(self, request):
+        return super().get_queryset(request).with_translations("ko", "en")
+
     def get_korean_name(self, obj):
         return obj.get_name("ko") or "-"
 
@@ -42,6 +48,11 @@ class SubCategoryAdmin(admin.ModelAdmin):
     ordering = ["category", "id"]
     inlines = [SubCategoryTranslationInline]
 
+    def get_queryset(self, request):
+        return super().get_queryset(request).with_translations("ko", "en").prefetch_related(
+            Prefetch("category", queryset=Category.objects.with_translations("ko"))
+        )
+
     def get_korean_name(self, obj):
         return obj.get_name("ko") or "-"
 
@@ -66,4 +77,13 @@ class SubCategoryTranslationAdmin(admin.ModelAdmin):
     list_display = ["id", "sub_category", "lang", "name", "created_at"]
     list_filter = ["lang"]
     search_fields = ["name"]
-    ordering = ["sub_category", "lang"]
\ No newline at end of file
+    ordering = ["sub_category", "lang"]
+
+
+@admin.register(CategoryCodeMapping)
+class CategoryCodeMappingAdmin(admin.ModelAdmin):
+    list_display = ["id", "content_type_id", "cat_code", "category", "sub_category", "updated_at"]
+    list_filter = ["content_type_id", "category"]
+    search_fields = ["cat_code"]
+    ordering = ["content_type_id", "cat_code"]
+    list_select_related = ["category", "sub_category"]
@@ -0,0 +1,55 @@
+from collections import Counter
+
+from categories.models import CategoryCodeMapping
+
+
+class CategoryCodeMapper:
+    """TourAPI 분류 코드 → (category_id, sub_category_id) 메모리 조회표 (동기화 한 번에 한 번 빌드)
+
+    아이템마다 DB 조회 없이 가장 구체적인 매핑을 찾고, 매핑이 없는 코드는 모아서 보고
+    """
+
+    def __init__(self, mappings):
+        # {(관광 타입 ID, 분류 코드): (category_id, sub_category_id)}
+        self.mappings = dict(mappings)
+        # {(관광 타입 ID, 가장 구체적인 분류 코드): 아이템 수}
+        self.unmapped = Counter()
+
+    @classmethod
+    def load(cls):
+        return cls(
+            ((content_type_id, cat_code), (category_id, sub_category_id))
+            for content_type_id, cat_code, category_id, sub_category_id in CategoryCodeMapping.objects.values_list(
+                "content_type_id", "cat_code", "category_id", "sub_category_id"
+            )
+        )
+
+    def __bool__(self):
+        return bool(self.mappings)
+
+    def candidates(self, content_type_id, cat_codes):
+        """구체적인 순서로 찾아볼 (관광 타입 ID, 분류 코드) 키"""
+        for type_id in [content_type_id, ""]:
+            for cat_code in cat_codes:
+                yield type_id, cat_code
+        yield content_type_id, ""
+
+    def resolve(self, item):
+        """TourAPI 아이템 → (category_id, sub_category_id) (매핑이 없으면 (None, None)이고 보고에 추가)"""
+        content_type_id = str(item.get("contenttypeid") or "")
+        # cat3 → cat2 → cat1 (비어 있는 단계는 건너뜀)
+        cat_codes = [code for code in (item.get("cat3"), item.get("cat2"), item.get("cat1")) if code]
+
+        for key in self.candidates(content_type_id, cat_codes):
+            if key in self.mappings:
+                return self.mappings[key]
+
+        self.unmapped[(content_type_id, cat_codes[0] if cat_codes else "")] += 1
+        return None, None
+
+    def report(self):
+        """매핑이 없는 코드 목록 (많은 순) → [{"content_type_id", "cat_code", "count"}]"""
+        return [
+            {"content_type_id": content_type_id, "cat_code": cat_code, "count": count}
+            for (content_type_id, cat_code), count in self.unmapped.most_common()
+        ]
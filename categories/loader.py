@@ -0,0 +1,170 @@
+import json
+from pathlib import Path
+
+from categories.models import Category, CategoryTranslation, SubCategory, SubCategoryTranslation
+from helper.translation_helper import TranslationDiff
+from outbox.changes import collect, record
+from outbox.models import CatalogChange
+
+# 카테고리 기본 데이터 파일 (내용을 바꾸면 version도 올리기)
+DATA_FILE = Path(__file__).resolve().parent / "data" / "categories.json"
+SUPPORTED_VERSIONS = {1}
+
+
+def read_dataset(path=DATA_FILE):
+    """카테고리 데이터 파일 읽기 (형식이 맞지 않으면 ValueError)"""
+    with open(path, encoding="utf-8") as f:
+        dataset = json.load(f)
+
+    if dataset.get("version") not in SUPPORTED_VERSIONS:
+        raise ValueError(f"지원하지 않는 카테고리 데이터 버전: {dataset.get('version')}")
+
+    category_names = set()
+    for category in dataset["categories"]:
+        name = category["translations"]["ko"]
+        if name in category_names:
+            raise ValueError(f"중복된 카테고리: {name}")
+        category_names.add(name)
+
+        subcategory_names = [subcategory["translations"]["ko"] for subcategory in category["subcategories"]]
+        if len(subcategory_names) != len(set(subcategory_names)):
+            raise ValueError(f"중복된 서브카테고리가 있는 카테고리: {name}")
+    return dataset
+
+
+def name_fields(translations):
+    """{lang: 이름} → {lang: {"name": 이름}} 번역 필드 형태로"""
+    return {lang: {"name": name} for lang, name in translations.items()}
+
+
+class CategoryPlan:
+    """데이터 파일과 현재 카테고리를 비교한 변경 계획 (DB를 바꾸지 않고 계산, apply()로 반영)
+
+    카테고리는 한국어 이름, 서브카테고리는 (카테고리, 한국어 이름)으로 같은 행인지 판단
+    prune이면 데이터 파일에 없는 카테고리/서브카테고리 삭제 (아니면 남겨둠)
+    """
+
+    def __init__(self, dataset, prune=False):
+        self.prune = prune
+
+        categories = dict(CategoryTranslation.objects.filter(lang="ko").values_list("name", "category_id"))
+        subcategories = {
+            (category_id, name): sub_category_id
+            for sub_category_id, category_id, name in SubCategoryTranslation.objects.filter(lang="ko").values_list(
+                "sub_category_id", "sub_category__category_id", "name"
+            )
+        }
+
+        # 새로 만들 카테고리 데이터 목록, 기존 카테고리 아래 새로 만들 서브카테고리 [(카테고리 ID, 데이터)]
+        self.new_categories = []
+        self.new_subcategories = []
+        category_translations = {}
+        subcategory_translations = {}
+        kept_category_ids = set()
+        kept_subcategory_ids = set()
+        for category in dataset["categories"]:
+            category_id = categories.get(category["translations"]["ko"])
+            if category_id is None:
+                self.new_categories.append(category)
+                continue
+
+            kept_category_ids.add(category_id)
+            for lang, fields in name_fields(category["translations"]).items():
+                category_translations[(category_id, lang)] = fields
+            for subcategory in category["subcategories"]:
+                sub_category_id = subcategories.get((category_id, subcategory["translations"]["ko"]))
+                if sub_category_id is None:
+                    self.new_subcategories.append((category_id, subcategory))
+                    continue
+                kept_subcategory_ids.add(sub_category_id)
+                for lang, fields in name_fields(subcategory["translations"]).items():
+                    subcategory_translations[(sub_category_id, lang)] = fields
+
+        # 한국어 번역이 없는 행도 데이터 파일에 없는 것으로 취급
+        self.removed_categories = set()
+        self.removed_subcategories = set()
+        if prune:
+            self.removed_categories = set(Category.objects.values_list("id", flat=True)) - kept_category_ids
+            self.removed_subcategories = set(
+                SubCategory.objects.exclude(category_id__in=self.removed_categories).values_list("id", flat=True)
+            ) - kept_subcategory_ids
+
+        self.category_translations = TranslationDiff(
+            CategoryTranslation, "category", category_translations, parent_ids=kept_category_ids
+        )
+        self.subcategory_translations = TranslationDiff(
+            SubCategoryTranslation, "sub_category", subcategory_translations, parent_ids=kept_subcategory_ids
+        )
+
+    @property
+    def changed(self):
+        return bool(
+            self.new_categories or self.new_subcategories or self.removed_categories
+            or self.removed_subcategories or self.category_translations or self.subcategory_translations
+        )
+
+    def lines(self):
+        """변경 내용 설명 (--dry-run 출력용)"""
+        lines = []
+        for category in self.new_categories:
+            lines.append(f"+ 카테고리 {category['translations']['ko']} (서브카테고리 {len(category['subcategories'])}개)")
+        for category_id, subcategory in self.new_subcategories:
+            lines.append(f"+ 서브카테고리 {subcategory['translations']['ko']} (카테고리 ID {category_id})")
+        for label, diff in [("카테고리", self.category_translations), ("서브카테고리", self.subcategory_translations)]:
+            parent_field = f"{diff.parent_field}_id"
+            for translation in diff.to_create:
+                lines.append(f"+ {label} {getattr(translation, parent_field)} 번역 {translation.lang}: {translation.name}")
+            for translation in diff.to_update:
+                lines.append(f"~ {label} {getattr(translation, parent_field)} 번역 {translation.lang}: {translation.name}")
+            for translation in diff.to_delete:
+                lines.append(f"- {label} {getattr(translation, parent_field)} 번역 {translation.lang}")
+        for category_id in sorted(self.removed_categories):
+            lines.append(f"- 카테고리 ID {category_id}")
+        for sub_category_id in sorted(self.removed_subcategories):
+            lines.append(f"- 서브카테고리 ID {sub_category_id}")
+        return lines
+
+    def apply(self):
+        """계획한 변경을 한 트랜잭션으로 반영 (바뀐 카테고리/서브카테고리는 같은 트랜잭션에서 변경 기록에 남김)"""
+        with collect():
+            if self.removed_subcategories:
+                SubCategory.objects.filter(id__in=self.removed_subcategories).delete()
+            if self.removed_categories:
+                Category.objects.filter(id__in=self.removed_categories).delete()
+
+            new_categories = Category.objects.bulk_create([Category() for _ in self.new_categories])
+            new_subcategories = [
+                (SubCategory(category_id=category_id), subcategory)
+                for category_id, subcategory in self.new_subcategories
+            ] + [
+                (SubCategory(category_id=category.id), subcategory)
+                for category, data in zip(new_categories, self.new_categories)
+                for subcategory in data["subcategories"]
+            ]
+            SubCategory.objects.bulk_create([subcategory for subcategory, _ in new_subcategories])
+
+            # 새 행의 번역은 비교할 것이 없어서 바로 추가
+            CategoryTranslation.objects.bulk_create([
+                CategoryTranslation(category_id=category.id, lang=lang, name=name)
+                for category, data in zip(new_categories, self.new_categories)
+                for lang, name in data["translations"].items()
+            ])
+            SubCategoryTranslation.objects.bulk_create([
+                SubCategoryTranslation(sub_category_id=subcategory.id, lang=lang, name=name)
+                for subcategory, data in new_subcategories
+                for lang, name in data["translations"].items()
+            ])
+
+            self.category_translations.apply()
+            self.subcategory_translations.apply()
+
+            # 삭제는 signal로 기록
+            record(
+                CatalogChange.ENTITY_CATEGORY,
+                [category.id for category in new_categories] + list(self.category_translations.changed_parent_ids())
+            )
+            record(
+                CatalogChange.ENTITY_SUBCATEGORY,
+                [subcategory.id for subcategory, _ in new_subcategories]
+                + list(self.subcategory_translations.changed_parent_ids())
+            )
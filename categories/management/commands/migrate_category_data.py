@@ -1,112 +1,92 @@
 from django.core.management.base import BaseCommand
+from django.db import connection
 from categories.models import Category, CategoryTranslation, SubCategory, SubCategoryTranslation
+from outbox.changes import collect, record
+from outbox.models import CatalogChange
+
+# 예전 스키마의 언어별 이름 컬럼
+LEGACY_COLUMNS = [("ko", "name_ko"), ("en", "name_en"), ("jp", "name_jp"), ("cn", "name_cn")]
 
 
 class Command(BaseCommand):
 
-    help = "기존 카테고리 데이터를 CategoryTranslation으로 이전"
+    help = "기존 카테고리 데이터(name_ko 등 언어별 컬럼)를 CategoryTranslation으로 한 번에 이전"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="반영하지 않고 새로 만들 번역만 출력합니다",
+        )
 
     def handle(self, *args, **options):
         self.stdout.write("=== 카테고리 데이터 이전 시작 ===")
 
-        category_count = Category.objects.count()
-        translation_count = CategoryTranslation.objects.count()
-
-        self.stdout.write(f"기존 카테고리 개수: {category_count}")
-        self.stdout.write(f"현재 번역 개수: {translation_count}")
-
-        if category_count == 0:
-            self.stdout.write(
-                self.style.WARNING("카테고리가 없습니다. 먼저 카테고리를 생성해주세요.")
-            )
+        plans = [
+            (Category, CategoryTranslation, "category", CatalogChange.ENTITY_CATEGORY),
+            (SubCategory, SubCategoryTranslation, "sub_category", CatalogChange.ENTITY_SUBCATEGORY),
+        ]
+        translations = {}
+        # {번역 모델: (변경 기록 대상, 부모 ID 필드)}
+        parents = {}
+        for model, translation_model, parent_field, entity in plans:
+            legacy_names = self.read_legacy_names(model)
+            if legacy_names is None:
+                self.stdout.write(
+                    self.style.WARNING(f"{model._meta.db_table} 테이블에 언어별 이름 컬럼이 없어 건너뜁니다.")
+                )
+                continue
+            translations[translation_model] = self.missing_translations(translation_model, parent_field, legacy_names)
+            parents[translation_model] = (entity, f"{parent_field}_id")
+
+        for translation_model, missing in translations.items():
+            self.stdout.write(f"{translation_model._meta.verbose_name}: 새로 만들 번역 {len(missing)}개")
+            for translation in missing:
+                self.stdout.write(f"  + {translation}")
+
+        if options["dry_run"]:
+            self.stdout.write(self.style.WARNING("--dry-run: 반영하지 않았습니다."))
             return
 
-        self.stdout.write("\n=== 기존 카테고리 데이터 ===")
-        for category in Category.objects.all():
-            self.stdout.write(f"ID: {category.id}")
-            self.stdout.write(f"  한국어: {category.name_ko}")
-            self.stdout.write(f"  영어: {category.name_en}")
-            self.stdout.write(f"  일본어: {category.name_jp}")
-            self.stdout.write(f"  중국어: {category.name_cn}")
-            self.stdout.write("---")
-
-        self.migrate_categories()
-
-        self.migrate_subcategories()
-
-        final_translation_count = CategoryTranslation.objects.count()
-        final_sub_translation_count = SubCategoryTranslation.objects.count()
+        # 이미 있는 (부모, 언어) 번역은 그대로 두기 (get_or_create와 같은 결과)
+        with collect():
+            for translation_model, missing in translations.items():
+                translation_model.objects.bulk_create(missing, batch_size=500, ignore_conflicts=True)
+                entity, parent_id_field = parents[translation_model]
+                record(entity, {getattr(translation, parent_id_field) for translation in missing})
 
         self.stdout.write(
             self.style.SUCCESS(
                 f"\n🎉 데이터 이전 완료!\n"
-                f"카테고리 번역: {final_translation_count}개\n"
-                f"서브카테고리 번역: {final_sub_translation_count}개"
+                f"카테고리 번역: {CategoryTranslation.objects.count()}개\n"
+                f"서브카테고리 번역: {SubCategoryTranslation.objects.count()}개"
             )
         )
 
-    def migrate_categories(self):
-        self.stdout.write("\n=== 카테고리 데이터 이전 실행 ===")
-
-        for category in Category.objects.all():
-            self.stdout.write(f"카테고리 {category.id} 이전 중...")
-
-            languages = [
-                ("ko", category.name_ko),
-                ("en", category.name_en),
-                ("jp", category.name_jp),
-                ("cn", category.name_cn)
-            ]
-
-            for lang, name in languages:
-                if name:
-                    translation, created = CategoryTranslation.objects.get_or_create(
-                        category=category,
-                        lang=lang,
-                        defaults={"name": name}
-                    )
-
-                    if created:
-                        self.stdout.write(
-                            self.style.SUCCESS(f"  {lang} 번역 생성: {name}")
-                        )
-                    else:
-                        self.stdout.write(f"  {lang} 번역 이미 존재: {name}")
-
-    def migrate_subcategories(self):
-        subcategory_count = SubCategory.objects.count()
-
-        if subcategory_count == 0:
-            self.stdout.write(
-                self.style.WARNING("서브카테고리가 없습니다.")
+    def read_legacy_names(self, model):
+        """{부모 ID: {lang: 이름}} (예전 컬럼이 없는 스키마면 None)"""
+        table = model._meta.db_table
+        with connection.cursor() as cursor:
+            columns = {column.name for column in connection.introspection.get_table_description(cursor, table)}
+            legacy_columns = [(lang, column) for lang, column in LEGACY_COLUMNS if column in columns]
+            if not legacy_columns:
+                return None
+
+            quote = connection.ops.quote_name
+            cursor.execute(
+                f"SELECT {quote('id')}, {', '.join(quote(column) for _, column in legacy_columns)} FROM {quote(table)}"
             )
-            return
-
-        self.stdout.write("\n=== 서브카테고리 데이터 이전 실행 ===")
-        self.stdout.write(f"기존 서브카테고리 개수: {subcategory_count}")
-
-        for subcategory in SubCategory.objects.all():
-            self.stdout.write(f"서브카테고리 {subcategory.id} 이전 중...")
-
-            # 언어별 데이터 매핑
-            languages = [
-                ("ko", subcategory.name_ko),
-                ("en", subcategory.name_en),
-                ("jp", subcategory.name_jp),
-                ("cn", subcategory.name_cn)
-            ]
-
-            for lang, name in languages:
-                if name:
-                    translation, created = SubCategoryTranslation.objects.get_or_create(
-                        sub_category=subcategory,
-                        lang=lang,
-                        defaults={"name": name}
-                    )
-
-                    if created:
-                        self.stdout.write(
-                            self.style.SUCCESS(f"  {lang} 번역 생성: {name}")
-                        )
-                    else:
-                        self.stdout.write(f"  {lang} 번역 이미 존재: {name}")
+            return {
+                row[0]: {lang: name for (lang, _), name in zip(legacy_columns, row[1:]) if name}
+                for row in cursor.fetchall()
+            }
+
+    def missing_translations(self, translation_model, parent_field, legacy_names):
+        """아직 없는 (부모, 언어) 번역 객체 목록"""
+        existing = set(translation_model.objects.values_list(f"{parent_field}_id", "lang"))
+        return [
+            translation_model(**{f"{parent_field}_id": parent_id}, lang=lang, name=name)
+            for parent_id, names in legacy_names.items()
+            for lang, name in names.items()
+            if (parent_id, lang) not in existing
+        ]
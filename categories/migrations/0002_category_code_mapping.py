@@ -0,0 +1,32 @@
+# Generated by Django 5.2.18 on 2026-10-17 19:44
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('categories', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CategoryCodeMapping',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('content_type_id', models.CharField(blank=True, help_text='TourAPI contenttypeid (예: 12 관광지, 39 음식점)', max_length=10, verbose_name='관광 타입 ID')),
+                ('cat_code', models.CharField(blank=True, help_text='TourAPI cat1/cat2/cat3 (예: A02, A0201, A02010100)', max_length=20, verbose_name='분류 코드')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='생성일시')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='수정일시')),
+                ('category', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='code_mappings', to='categories.category', verbose_name='카테고리')),
+                ('sub_category', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='code_mappings', to='categories.subcategory', verbose_name='서브카테고리')),
+            ],
+            options={
+                'verbose_name': 'TourAPI 분류 코드 매핑',
+                'verbose_name_plural': 'TourAPI 분류 코드 매핑',
+                'db_table': 'category_code_mapping',
+                'unique_together': {('content_type_id', 'cat_code')},
+            },
+        ),
+    ]
@@ -1,10 +1,14 @@
 from django.db import models
+from helper.translation_helper import TranslatableMixin, TranslationQuerySet
+from outbox.changes import AtomicSaveMixin
 
 
-class Category(models.Model):
+class Category(TranslatableMixin, AtomicSaveMixin, models.Model):
     created_at = models.DateTimeField(auto_now_add=True, verbose_name="생성일시")
     updated_at = models.DateTimeField(auto_now=True, verbose_name="수정일시")
 
+    objects = TranslationQuerySet.as_manager()
+
     class Meta:
         db_table = "category"
         verbose_name = "카테고리"
@@ -15,14 +19,10 @@ class Category(models.Model):
         return korean_name if korean_name else f"Category {self.id}"
 
     def get_name(self, lang):
-        try:
-            translation = self.translations.get(lang=lang)
-            return translation.name
-        except CategoryTranslation.DoesNotExist:
-            return None
+        return self.get_translated_field("name", lang)
 
 
-class SubCategory(models.Model):
+class SubCategory(TranslatableMixin, AtomicSaveMixin, models.Model):
     category = models.ForeignKey(
         Category,
         on_delete=models.CASCADE,
@@ -32,6 +32,8 @@ class SubCategory(models.Model):
     created_at = models.DateTimeField(auto_now_add=True, verbose_name="생성일시")
     updated_at = models.DateTimeField(auto_now=True, verbose_name="수정일시")
 
+    objects = TranslationQuerySet.as_manager()
+
     class Meta:
         db_table = "subcategory"
         verbose_name = "서브 카테고리"
@@ -42,14 +44,10 @@ class SubCategory(models.Model):
         return korean_name if korean_name else f"SubCategory {self.id}"
 
     def get_name(self, lang):
-        try:
-            translation = self.translations.get(lang=lang)
-            return translation.name
-        except SubCategoryTranslation.DoesNotExist:
-            return None
+        return self.get_translated_field("name", lang)
 
 
-class CategoryTranslation(models.Model):
+class CategoryTranslation(AtomicSaveMixin, models.Model):
     category = models.ForeignKey(
         Category,
         on_delete=models.CASCADE,
@@ -78,7 +76,7 @@ class CategoryTranslation(models.Model):
         return f"{self.category.id} - {self.lang}: {self.name}"
 
 
-class SubCategoryTranslation(models.Model):
+class SubCategoryTranslation(AtomicSaveMixin, models.Model):
     sub_category = models.ForeignKey(
         SubCategory,
         on_delete=models.CASCADE,
@@ -105,3 +103,48 @@ class SubCategoryTranslation(models.Model):
 
     def __str__(self):
         return f"{self.sub_category.id} - {self.lang}: {self.name}"
+
+
+class CategoryCodeMapping(models.Model):
+    """TourAPI 분류 코드(contenttypeid, cat1/cat2/cat3) → 우리 카테고리/서브카테고리
+
+    cat_code는 대/중/소분류 어느 단계든 가능하고, 동기화 때 가장 구체적인 코드부터 찾음
+    content_type_id를 비우면 모든 관광 타입에, cat_code를 비우면 그 관광 타입 전체에 적용
+    """
+    content_type_id = models.CharField(
+        max_length=10,
+        blank=True,
+        verbose_name="관광 타입 ID",
+        help_text="TourAPI contenttypeid (예: 12 관광지, 39 음식점)"
+    )
+    cat_code = models.CharField(
+        max_length=20,
+        blank=True,
+        verbose_name="분류 코드",
+        help_text="TourAPI cat1/cat2/cat3 (예: A02, A0201, A02010100)"
+    )
+    category = models.ForeignKey(
+        Category,
+        on_delete=models.CASCADE,
+        related_name="code_mappings",
+        verbose_name="카테고리"
+    )
+    sub_category = models.ForeignKey(
+        SubCategory,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="code_mappings",
+        verbose_name="서브카테고리"
+    )
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name="생성일시")
+    updated_at = models.DateTimeField(auto_now=True, verbose_name="수정일시")
+
+    class Meta:
+        db_table = "category_code_mapping"
+        verbose_name = "TourAPI 분류 코드 매핑"
+        verbose_name_plural = "TourAPI 분류 코드 매핑"
+        unique_together = (("content_type_id", "cat_code"),)
+
+    def __str__(self):
+        return f"{self.content_type_id or '*'}/{self.cat_code or '*'} → {self.category_id}/{self.sub_category_id}"
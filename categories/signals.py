@@ -0,0 +1,30 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from helper.catalog_cache import categories_cache
+from categories.models import Category, CategoryTranslation, SubCategory, SubCategoryTranslation
+from categories.snapshots import categories_snapshot
+from outbox.changes import track
+from outbox.consumer import register
+from outbox.models import CatalogChange
+
+
+# 카테고리 데이터가 바뀌면 카테고리 카탈로그 캐시 무효화
+@receiver([post_save, post_delete], sender=Category)
+@receiver([post_save, post_delete], sender=CategoryTranslation)
+@receiver([post_save, post_delete], sender=SubCategory)
+@receiver([post_save, post_delete], sender=SubCategoryTranslation)
+def invalidate_categories_cache(sender, **kwargs):
+    categories_cache.invalidate()
+
+
+# 변경 기록 (번역은 부모 카테고리/서브카테고리의 변경으로)
+track(Category, CatalogChange.ENTITY_CATEGORY)
+track(CategoryTranslation, CatalogChange.ENTITY_CATEGORY, parent_field="category")
+track(SubCategory, CatalogChange.ENTITY_SUBCATEGORY)
+track(SubCategoryTranslation, CatalogChange.ENTITY_SUBCATEGORY, parent_field="sub_category")
+
+
+# 카테고리가 바뀐 배치에서만 스냅샷을 미리 빌드
+@register(CatalogChange.ENTITY_CATEGORY, CatalogChange.ENTITY_SUBCATEGORY)
+def rebuild_categories_snapshot(changes):
+    categories_snapshot.rebuild()
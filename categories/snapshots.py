@@ -0,0 +1,34 @@
+from django.db.models import Prefetch
+from helper.catalog_cache import categories_cache
+from helper.catalog_snapshot import CatalogSnapshot
+from categories.models import Category, SubCategory
+from categories.serializers import CategorySerializer, SubCategoryListSerializer
+
+
+def build_categories_snapshot(language):
+    """카테고리 트리 전체를 한 번에 조회해서 엔드포인트별 응답 데이터로 만들기"""
+    context = {"language": language}
+    categories = list(
+        Category.objects.with_translations(language).prefetch_related(
+            Prefetch(
+                "subcategories",
+                queryset=SubCategory.objects.with_translations(language).order_by("id")
+            )
+        ).order_by("id")
+    )
+
+    payloads = {
+        "categories": {"categories": CategorySerializer(categories, many=True, context=context).data}
+    }
+
+    for category in categories:
+        serializer = SubCategoryListSerializer(
+            {},
+            context={**context, "subcategories_queryset": category.subcategories.all()}
+        )
+        payloads[f"categories/{category.id}/subcategories"] = serializer.data
+
+    return payloads
+
+
+categories_snapshot = CatalogSnapshot(categories_cache, build_categories_snapshot)
@@ -0,0 +1,47 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from rest_framework.test import APITestCase
+from rest_framework import status
+from categories.models import Category, CategoryTranslation, SubCategory, SubCategoryTranslation
+
+User = get_user_model()
+
+
+# 카테고리 카탈로그 응답 캐시 테스트
+class CategoriesCacheTest(APITestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(email="cache@test.com", password="testpass123")
+        self.client.force_authenticate(user=self.user)
+
+        self.category = Category.objects.create()
+        CategoryTranslation.objects.create(category=self.category, lang="ko", name="자연")
+        self.subcategory = SubCategory.objects.create(category=self.category)
+        self.subcategory_ko = SubCategoryTranslation.objects.create(
+            sub_category=self.subcategory, lang="ko", name="산"
+        )
+
+    def test_cached_response_should_not_hit_database(self):
+        for url in ["/api/categories/?lang=ko", f"/api/categories/{self.category.id}/subcategories/?lang=ko"]:
+            first = self.client.get(url)
+            with self.assertNumQueries(0):
+                second = self.client.get(url)
+
+            self.assertEqual(second.status_code, status.HTTP_200_OK)
+            self.assertEqual(first.data, second.data)
+
+    def test_missing_category_should_not_be_cached(self):
+        url = "/api/categories/9999/subcategories/?lang=ko"
+        self.assertEqual(self.client.get(url).status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(self.client.get(url).status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_subcategory_translation_update_should_invalidate_cache(self):
+        self.client.get("/api/categories/?lang=ko")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.subcategory_ko.name = "등산"
+            self.subcategory_ko.save()
+
+        response = self.client.get("/api/categories/?lang=ko")
+        self.assertEqual(response.data["categories"][0]["subcategories"][0]["name"], "등산")
@@ -0,0 +1,52 @@
+from django.test import TestCase
+from categories.code_mapping import CategoryCodeMapper
+from categories.models import Category, CategoryCodeMapping, SubCategory
+
+
+# TourAPI 분류 코드 매핑 테스트
+class CategoryCodeMapperTest(TestCase):
+
+    def setUp(self):
+        self.culture = Category.objects.create()
+        self.history = SubCategory.objects.create(category=self.culture)
+        self.nature = Category.objects.create()
+        self.food = Category.objects.create()
+
+        CategoryCodeMapping.objects.create(cat_code="A02", category=self.culture)
+        CategoryCodeMapping.objects.create(cat_code="A0201", category=self.culture, sub_category=self.history)
+        CategoryCodeMapping.objects.create(content_type_id="12", cat_code="A01", category=self.nature)
+        CategoryCodeMapping.objects.create(content_type_id="39", category=self.food)
+
+    def test_mapper_should_be_built_with_one_query(self):
+        with self.assertNumQueries(1):
+            mapper = CategoryCodeMapper.load()
+
+        with self.assertNumQueries(0):
+            mapper.resolve({"contenttypeid": "12", "cat1": "A02", "cat2": "A0201", "cat3": "A02010100"})
+
+    def test_most_specific_mapping_should_win(self):
+        mapper = CategoryCodeMapper.load()
+
+        self.assertEqual(
+            mapper.resolve({"contenttypeid": "12", "cat1": "A02", "cat2": "A0201", "cat3": "A02010100"}),
+            (self.culture.id, self.history.id)
+        )
+        self.assertEqual(
+            mapper.resolve({"contenttypeid": "14", "cat1": "A02", "cat2": "A0206", "cat3": "A02060100"}),
+            (self.culture.id, None)
+        )
+        self.assertEqual(mapper.resolve({"contenttypeid": "12", "cat1": "A01"}), (self.nature.id, None))
+        # 관광 타입 전체 매핑
+        self.assertEqual(mapper.resolve({"contenttypeid": "39", "cat1": "A05"}), (self.food.id, None))
+
+    def test_unmapped_codes_should_be_reported(self):
+        mapper = CategoryCodeMapper.load()
+
+        for _ in range(2):
+            self.assertEqual(mapper.resolve({"contenttypeid": "38", "cat1": "A04", "cat3": "A04010100"}), (None, None))
+        mapper.resolve({"contenttypeid": "15"})
+
+        self.assertEqual(mapper.report(), [
+            {"content_type_id": "38", "cat_code": "A04010100", "count": 2},
+            {"content_type_id": "15", "cat_code": "", "count": 1},
+        ])
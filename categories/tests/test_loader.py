@@ -0,0 +1,130 @@
+import json
+import os
+import tempfile
+from io import StringIO
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase
+from categories.loader import CategoryPlan, read_dataset
+from categories.models import Category, CategoryTranslation, SubCategory, SubCategoryTranslation
+from helper.catalog_cache import categories_cache
+
+
+def make_dataset():
+    return {
+        "version": 1,
+        "categories": [
+            {"translations": {"ko": "자연", "en": "Nature"}, "subcategories": [
+                {"translations": {"ko": "산", "en": "Mountain"}},
+                {"translations": {"ko": "바다", "en": "Beach"}},
+            ]},
+            {"translations": {"ko": "음식", "en": "Food"}, "subcategories": [
+                {"translations": {"ko": "한식", "en": "Korean Food"}},
+            ]},
+        ],
+    }
+
+
+# 카테고리 일괄 로더 테스트
+class CategoryLoaderTest(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, "categories.json")
+        self.write(make_dataset())
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def write(self, dataset):
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump(dataset, f, ensure_ascii=False)
+
+    def load(self, **options):
+        stdout = StringIO()
+        call_command("load_categories", file=self.path, stdout=stdout, **options)
+        return stdout.getvalue()
+
+    def test_bundled_data_file_should_load(self):
+        dataset = read_dataset()
+        call_command("load_categories", stdout=StringIO())
+
+        self.assertEqual(Category.objects.count(), len(dataset["categories"]))
+        self.assertEqual(
+            SubCategory.objects.count(), sum(len(category["subcategories"]) for category in dataset["categories"])
+        )
+        self.assertEqual(CategoryTranslation.objects.filter(lang="en", name="Culture").count(), 1)
+
+    def test_load_should_be_a_handful_of_queries(self):
+        # 기존 이름 조회 2 + SAVEPOINT 2 + INSERT 4 + 변경 기록 INSERT 1 (비교할 기존 번역이 없으면 조회 안 함)
+        with self.assertNumQueries(9):
+            CategoryPlan(read_dataset(self.path)).apply()
+
+        self.assertEqual(SubCategoryTranslation.objects.count(), 6)
+
+    def test_reload_should_keep_ids_and_apply_diff(self):
+        self.load()
+        nature = Category.objects.get(translations__lang="ko", translations__name="자연")
+        mountain = SubCategory.objects.get(translations__lang="ko", translations__name="산")
+
+        dataset = make_dataset()
+        dataset["categories"][0]["translations"]["jp"] = "自然"
+        dataset["categories"][0]["subcategories"][0]["translations"]["en"] = "Mountains"
+        dataset["categories"][1]["subcategories"].append({"translations": {"ko": "일식"}})
+        self.write(dataset)
+        self.load()
+
+        self.assertEqual(Category.objects.count(), 2)
+        self.assertEqual(Category.objects.get(id=nature.id).get_name("jp"), "自然")
+        self.assertEqual(SubCategory.objects.get(id=mountain.id).get_name("en"), "Mountains")
+        self.assertTrue(SubCategoryTranslation.objects.filter(lang="ko", name="일식").exists())
+
+    def test_reload_without_changes_should_not_write(self):
+        self.load()
+        version = categories_cache.get_version()
+
+        with self.assertNumQueries(4):
+            output = self.load()
+
+        self.assertIn("변경 사항이 없습니다", output)
+        self.assertEqual(categories_cache.get_version(), version)
+
+    def test_dry_run_should_print_diff_without_writing(self):
+        self.load()
+        dataset = make_dataset()
+        dataset["categories"][1]["translations"]["en"] = "Cuisine"
+        dataset["categories"].append({"translations": {"ko": "쇼핑"}, "subcategories": []})
+        self.write(dataset)
+
+        output = self.load(dry_run=True)
+
+        self.assertIn("+ 카테고리 쇼핑", output)
+        self.assertIn("en: Cuisine", output)
+        self.assertEqual(Category.objects.count(), 2)
+        self.assertFalse(CategoryTranslation.objects.filter(name="Cuisine").exists())
+
+    # 데이터 파일에 없는 행은 --prune일 때만 삭제
+    def test_prune_should_delete_rows_missing_from_file(self):
+        self.load()
+        dataset = make_dataset()
+        dataset["categories"][0]["subcategories"].pop()
+        del dataset["categories"][1]
+        self.write(dataset)
+
+        self.load()
+        self.assertEqual(Category.objects.count(), 2)
+
+        self.load(prune=True)
+        self.assertEqual(Category.objects.count(), 1)
+        self.assertEqual(list(SubCategoryTranslation.objects.filter(lang="ko").values_list("name", flat=True)), ["산"])
+
+    # 언어별 이름 컬럼이 없는 현재 스키마에서는 아무것도 바꾸지 않음
+    def test_migrate_category_data_should_skip_without_legacy_columns(self):
+        self.load()
+        stdout = StringIO()
+
+        call_command("migrate_category_data", stdout=stdout)
+
+        self.assertIn("건너뜁니다", stdout.getvalue())
+        self.assertEqual(CategoryTranslation.objects.count(), 4)
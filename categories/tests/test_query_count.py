@@ -0,0 +1,57 @@
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase
+from rest_framework import status
+from categories.models import Category, CategoryTranslation, SubCategory, SubCategoryTranslation
+
+User = get_user_model()
+
+LANGS = ["ko", "en", "jp", "cn"]
+
+
+# 카테고리 API 쿼리 수가 데이터 개수와 무관하게 일정한지 확인하는 회귀 테스트
+class CategoryAPIQueryCountTest(APITestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(email="query@test.com", password="testpass123")
+        self.client.force_authenticate(user=self.user)
+
+        self.category = self.create_category()
+
+    def create_category(self, subcategory_count=2):
+        category = Category.objects.create()
+        for lang in LANGS:
+            CategoryTranslation.objects.create(category=category, lang=lang, name=f"카테고리-{lang}")
+
+        for _ in range(subcategory_count):
+            subcategory = SubCategory.objects.create(category=category)
+            for lang in LANGS:
+                SubCategoryTranslation.objects.create(sub_category=subcategory, lang=lang, name=f"서브-{lang}")
+        return category
+
+    def count_queries(self, url):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return len(context.captured_queries)
+
+    def test_categories_list_query_count(self):
+        before = self.count_queries("/api/categories/?lang=en")
+        for _ in range(5):
+            self.create_category(subcategory_count=4)
+        after = self.count_queries("/api/categories/?lang=en")
+
+        self.assertEqual(before, after)
+        self.assertEqual(after, 4)
+
+    def test_subcategories_list_query_count(self):
+        url = f"/api/categories/{self.category.id}/subcategories/?lang=en"
+        before = self.count_queries(url)
+        for _ in range(5):
+            subcategory = SubCategory.objects.create(category=self.category)
+            SubCategoryTranslation.objects.create(sub_category=subcategory, lang="en", name="Sub")
+        after = self.count_queries(url)
+
+        self.assertEqual(before, after)
+        self.assertEqual(after, 4)
@@ -2,21 +2,17 @@
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
-from django.shortcuts import get_object_or_404
+from rest_framework.permissions import AllowAny
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
-from categories.models import (
-    Category, SubCategory,
-    CategoryTranslation, SubCategoryTranslation
-)
-from categories.serializers import (
-    CategorySerializer,
-    SubCategoryListSerializer
-)
+from categories.snapshots import categories_snapshot
 
 
 # 카테고리 목록 API
 class CategoriesAPIView(APIView):
+    # 공개 참조 데이터라 로그인 없이 조회 (nginx/클라이언트 공용 캐시 대상)
+    permission_classes = [AllowAny]
+
     @swagger_auto_schema(
         operation_summary="카테고리 목록 조회",
         operation_description="전체 카테고리 목록을 조회합니다. 언어 파라미터를 통해 다국어 지원이 가능합니다.",
@@ -78,18 +74,7 @@ class CategoriesAPIView(APIView):
 
     def _get_categories(self, request, language):
         try:
-            categories = Category.objects.prefetch_related("subcategories").all()
-
-            # Context 방식 사용
-            serializer = CategorySerializer(
-                categories,
-                many=True,
-                context={"language": language}
-            )
-
-            return Response({
-                "categories": serializer.data
-            }, status=status.HTTP_200_OK)
+            return categories_snapshot.response("categories", language, request)
 
         except Exception as e:
             return Response({
@@ -98,6 +83,8 @@ class CategoriesAPIView(APIView):
 
 
 class SubCategoriesAPIView(APIView):
+    permission_classes = [AllowAny]
+
     @swagger_auto_schema(
         operation_summary="서브카테고리 목록 조회",
         operation_description="특정 카테고리의 서브카테고리 목록을 조회합니다.",
@@ -167,24 +154,11 @@ class SubCategoriesAPIView(APIView):
             }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
     def _get_subcategories(self, request, language, category_id):
-        try:
-            category = Category.objects.get(id=category_id)
-        except Category.DoesNotExist:
+        response = categories_snapshot.response(f"categories/{category_id}/subcategories", language, request)
+
+        if response is None:
             return Response({
                 "error": "존재하지 않는 카테고리입니다."
             }, status=status.HTTP_404_NOT_FOUND)
 
-        subcategories = SubCategory.objects.filter(category=category)
-
-        serializer = SubCategoryListSerializer(
-            {},
-            context={
-                "language": language,
-                "subcategories_queryset": subcategories
-            }
-        )
-
-        return Response(
-            serializer.data,
-            status=status.HTTP_200_OK
-        )
+        return response
@@ -56,6 +56,8 @@ INSTALLED_APPS = [
     "exports",
     "categories",
     "regions",
+    "outbox",
+    "search",
 ]
 
 MIDDLEWARE = [
@@ -162,6 +164,10 @@ LOCALE_PATHS = [
 STATIC_URL = "static/"
 STATIC_ROOT = os.path.join(BASE_DIR, "staticfiles")
 
+# 업로드/수집한 파일 (nginx가 /media/를 직접 서빙)
+MEDIA_URL = "/media/"
+MEDIA_ROOT = config("MEDIA_ROOT", default=str(BASE_DIR / "media"))
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
 
@@ -309,3 +315,34 @@ CACHES = {
         }
     }
 }
+
+# 지역/카테고리 카탈로그 응답 캐시 유지 시간 (초) - 데이터 변경 시에는 버전 키로 즉시 무효화
+CATALOG_CACHE_TIMEOUT = config("CATALOG_CACHE_TIMEOUT", default=60 * 60 * 24, cast=int)
+
+# 카탈로그 API Cache-Control (클라이언트/nginx 캐시 시간, 만료 후 백그라운드 재검증 허용 시간)
+CATALOG_CACHE_MAX_AGE = config("CATALOG_CACHE_MAX_AGE", default=60 * 5, cast=int)
+CATALOG_STALE_WHILE_REVALIDATE = config("CATALOG_STALE_WHILE_REVALIDATE", default=60 * 60 * 24, cast=int)
+
+# 처리한 카탈로그 변경 기록 보관 기간 (일) - 지난 기록은 process_outbox가 삭제
+CATALOG_OUTBOX_RETENTION_DAYS = config("CATALOG_OUTBOX_RETENTION_DAYS", default=7, cast=int)
+
+# 한국관광공사 TourAPI (관광지 동기화)
+TOUR_API_BASE_URL = config("TOUR_API_BASE_URL", default="https://apis.data.go.kr/B551011")
+TOUR_API_SERVICE_KEY = config("TOUR_API_SERVICE_KEY", default="")
+# 언어 코드별 TourAPI 서비스 이름 (다국어 관광정보는 언어마다 서비스가 따로 있음)
+TOUR_API_SERVICES = {
+    "ko": "KorService1",
+    "en": "EngService1",
+    "jp": "JpnService1",
+    "cn": "ChsService1",
+}
+
+# sync_places 중단 시 이어받기용 체크포인트 파일 위치
+TOUR_API_CHECKPOINT_DIR = config("TOUR_API_CHECKPOINT_DIR", default=str(BASE_DIR / ".sync_checkpoints"))
+
+# 관광지 이미지 썸네일 크기 (긴 변 기준 px)
+PLACE_IMAGE_SIZES = {
+    "small": 160,
+    "medium": 480,
+    "large": 960,
+}
@@ -0,0 +1,33 @@
+import uuid
+
+from django.core.cache import cache
+from django.db import transaction
+
+
+class CatalogCache:
+    """지역/카테고리 같은 준정적 데이터의 캐시 버전 관리 (버전이 바뀌면 이전 캐시는 모두 무효)"""
+
+    def __init__(self, name):
+        self.name = name
+        self.version_key = f"catalog:{name}:version"
+
+    def get_version(self):
+        """현재 카탈로그 버전 조회 (없으면 새로 발급)"""
+        version = cache.get(self.version_key)
+        if version is None:
+            cache.add(self.version_key, uuid.uuid4().hex, timeout=None)
+            version = cache.get(self.version_key)
+        return version
+
+    def bump_version(self):
+        """버전을 새로 발급해서 이전 버전의 캐시를 모두 무효화"""
+        cache.set(self.version_key, uuid.uuid4().hex, timeout=None)
+
+    def invalidate(self):
+        """변경 직후와 트랜잭션 커밋 후 두 번 무효화 (커밋 전에 읽힌 데이터가 캐시되는 것 방지)"""
+        self.bump_version()
+        transaction.on_commit(self.bump_version)
+
+
+regions_cache = CatalogCache("regions")
+categories_cache = CatalogCache("categories")
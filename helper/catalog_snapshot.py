@@ -0,0 +1,107 @@
+import hashlib
+import json
+
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework import status
+from rest_framework.renderers import JSONRenderer
+from django.utils.cache import patch_cache_control
+from django.utils.http import parse_etags
+from rest_framework.response import Response
+
+
+class SnapshotResponse(Response):
+    """미리 렌더링된 JSON 바이트를 시리얼라이저 없이 그대로 내려주는 응답"""
+
+    def __init__(self, body, etag, status=status.HTTP_200_OK):
+        self.body = body
+        super().__init__(status=status)
+        self["ETag"] = etag
+        # 클라이언트와 nginx가 캐시하고, 만료 후에는 백그라운드 재검증 동안 이전 응답 사용
+        patch_cache_control(
+            self,
+            public=True,
+            max_age=settings.CATALOG_CACHE_MAX_AGE,
+            stale_while_revalidate=settings.CATALOG_STALE_WHILE_REVALIDATE
+        )
+
+    @property
+    def data(self):
+        # 바이트가 원본이라 파싱은 테스트 등에서 data에 접근할 때만 수행
+        return json.loads(self.body)
+
+    @data.setter
+    def data(self, value):
+        pass
+
+    @property
+    def rendered_content(self):
+        self["Content-Type"] = "application/json"
+        return self.body
+
+
+class CatalogSnapshot:
+    """카탈로그 전체를 언어별로 한 번에 JSON 바이트로 렌더링해서 보관 (프로세스 메모리 + Redis)"""
+
+    def __init__(self, catalog_cache, builder):
+        self.catalog_cache = catalog_cache
+        # builder(lang) -> {payload_key: 응답 데이터}
+        self.builder = builder
+        self._local = {}
+
+    def _redis_key(self, version, lang):
+        return f"catalog:{self.catalog_cache.name}:{version}:snapshot:{lang}"
+
+    def render(self, lang):
+        """builder 결과를 payload_key별 (바이트, ETag)로 렌더링"""
+        renderer = JSONRenderer()
+        payloads = {}
+        for key, data in self.builder(lang).items():
+            body = renderer.render(data)
+            payloads[key] = (body, f'"{hashlib.sha1(body).hexdigest()}"')
+        return payloads
+
+    def get_payloads(self, lang):
+        """현재 버전의 스냅샷 조회 (프로세스 메모리 → Redis → 새로 빌드 순서)"""
+        version = self.catalog_cache.get_version()
+        local = self._local.get(lang)
+        if local is not None and local[0] == version:
+            return local[1]
+
+        redis_key = self._redis_key(version, lang)
+        payloads = cache.get(redis_key)
+        if payloads is None:
+            payloads = self.render(lang)
+            cache.set(redis_key, payloads, settings.CATALOG_CACHE_TIMEOUT)
+
+        self._local[lang] = (version, payloads)
+        return payloads
+
+    def rebuild(self, langs=None):
+        """지원 언어 전체의 스냅샷을 미리 빌드 (데이터 로드 직후 워밍용)"""
+        for lang in langs or [code for code, _ in settings.LANGUAGES]:
+            self.get_payloads(lang)
+
+    def get(self, key, lang):
+        """payload_key에 해당하는 (바이트, ETag) 반환 (없으면 None)"""
+        return self.get_payloads(lang).get(key)
+
+    def response(self, key, lang, request=None):
+        """payload_key에 해당하는 응답 반환 (없으면 None, If-None-Match가 일치하면 304)"""
+        payload = self.get(key, lang)
+        if payload is None:
+            return None
+        body, etag = payload
+        if request is not None and etag_matches(request.headers.get("If-None-Match"), etag):
+            return SnapshotResponse(b"", etag, status=status.HTTP_304_NOT_MODIFIED)
+        return SnapshotResponse(body, etag)
+
+
+def etag_matches(if_none_match, etag):
+    """If-None-Match 헤더와 ETag 비교 (nginx gzip이 붙이는 W/ 접두어는 무시하는 약한 비교)"""
+    if not if_none_match:
+        return False
+    etags = parse_etags(if_none_match)
+    if "*" in etags:
+        return True
+    return etag.removeprefix("W/") in {tag.removeprefix("W/") for tag in etags}
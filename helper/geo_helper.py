@@ -0,0 +1,206 @@
+import heapq
+import math
+from collections import defaultdict
+
+# 지구 평균 반지름 (미터)
+EARTH_RADIUS_M = 6371008.8
+
+# 위도 1도의 거리 (미터)
+METERS_PER_DEGREE = math.pi * EARTH_RADIUS_M / 180
+
+
+def haversine_distance(lat1, lng1, lat2, lng2):
+    """두 좌표 사이의 대원 거리 (미터)"""
+    lat1, lng1, lat2, lng2 = map(math.radians, (float(lat1), float(lng1), float(lat2), float(lng2)))
+    a = (
+        math.sin((lat2 - lat1) / 2) ** 2
+        + math.cos(lat1) * math.cos(lat2) * math.sin((lng2 - lng1) / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_M * math.asin(min(1.0, math.sqrt(a)))
+
+
+def bounding_box(lat, lng, radius):
+    """중심 좌표에서 radius(미터) 원을 감싸는 (최소 위도, 최대 위도, 최소 경도, 최대 경도)
+
+    인덱스 범위 조회용 사전 필터라 원보다 약간 넓어도 되고, 정확한 거리는 haversine으로 다시 계산
+    """
+    lat, lng = float(lat), float(lng)
+    delta_lat = radius / METERS_PER_DEGREE
+    min_lat, max_lat = max(-90.0, lat - delta_lat), min(90.0, lat + delta_lat)
+
+    # 극 근처에서는 경도 폭이 무한대로 커지므로 전체 경도로
+    cos_lat = math.cos(math.radians(max(abs(min_lat), abs(max_lat))))
+    if cos_lat < 1e-6:
+        return min_lat, max_lat, -180.0, 180.0
+    delta_lng = delta_lat / cos_lat
+    return min_lat, max_lat, max(-180.0, lng - delta_lng), min(180.0, lng + delta_lng)
+
+
+def nearest(candidates, lat, lng, radius, limit):
+    """(키, 위도, 경도) 후보 중 radius 안에 있는 것을 가까운 순으로 최대 limit개 [(키, 거리)] 반환
+
+    DB 없이 동작하는 순수 파이썬 엔진 (bounding box 후보 정밀 필터링 및 테스트용)
+    """
+    within = []
+    for key, candidate_lat, candidate_lng in candidates:
+        if candidate_lat is None or candidate_lng is None:
+            continue
+        distance = haversine_distance(lat, lng, candidate_lat, candidate_lng)
+        if distance <= radius:
+            within.append((distance, key))
+    return [(key, distance) for distance, key in heapq.nsmallest(limit, within)]
+
+
+class GridIndex:
+    """위도/경도 격자 버킷으로 나눈 메모리 공간 인덱스 (가장 가까운 점 조회용)
+
+    points는 (키, 위도, 경도) 목록이고, 좌표가 없는 점은 제외
+    """
+
+    def __init__(self, points, cell_size=0.1):
+        self.cell_size = cell_size
+        self.cells = defaultdict(list)
+        # 경도 1도 거리의 하한 계산용 (인덱스 안의 가장 높은 위도)
+        self.max_abs_lat = 0.0
+        for key, lat, lng in points:
+            if lat is None or lng is None:
+                continue
+            lat, lng = float(lat), float(lng)
+            self.cells[self._cell(lat, lng)].append((key, lat, lng))
+            self.max_abs_lat = max(self.max_abs_lat, abs(lat))
+
+        if self.cells:
+            rows = [row for row, _ in self.cells]
+            cols = [col for _, col in self.cells]
+            self.bounds = (min(rows), max(rows), min(cols), max(cols))
+
+    def __len__(self):
+        return sum(len(bucket) for bucket in self.cells.values())
+
+    def _cell(self, lat, lng):
+        return math.floor(lat / self.cell_size), math.floor(lng / self.cell_size)
+
+    def _ring(self, row, col, ring):
+        """(row, col) 격자에서 체비셰프 거리가 정확히 ring인 격자들"""
+        if ring == 0:
+            yield row, col
+            return
+        for d in range(-ring, ring + 1):
+            yield row - ring, col + d
+            yield row + ring, col + d
+        for d in range(-ring + 1, ring):
+            yield row + d, col - ring
+            yield row + d, col + ring
+
+    def nearest(self, lat, lng, max_distance=None):
+        """가장 가까운 점의 (키, 거리) 반환 (없거나 max_distance보다 멀면 None)
+
+        가까운 격자부터 고리 모양으로 넓혀가며, 남은 격자가 현재 최단 거리보다 멀어지면 중단
+        """
+        if not self.cells:
+            return None
+        lat, lng = float(lat), float(lng)
+        row, col = self._cell(lat, lng)
+        min_row, max_row, min_col, max_col = self.bounds
+        last_ring = max(abs(row - min_row), abs(row - max_row), abs(col - min_col), abs(col - max_col))
+
+        # ring 바깥 격자의 점은 위도나 경도가 최소 ring * cell_size 만큼 떨어져 있음
+        cos_lat = math.cos(math.radians(min(89.9, max(abs(lat), self.max_abs_lat))))
+        ring_distance = self.cell_size * METERS_PER_DEGREE * cos_lat
+
+        best = None
+        for ring in range(last_ring + 1):
+            for cell in self._ring(row, col, ring):
+                for key, point_lat, point_lng in self.cells.get(cell, ()):
+                    distance = haversine_distance(lat, lng, point_lat, point_lng)
+                    if best is None or distance < best[1]:
+                        best = (key, distance)
+
+            lower_bound = ring * ring_distance
+            if best is not None and lower_bound >= best[1]:
+                break
+            if max_distance is not None and lower_bound > max_distance:
+                break
+
+        if best is None or (max_distance is not None and best[1] > max_distance):
+            return None
+        return best
+
+
+GEOHASH_ALPHABET = "0123456789bcdefghjkmnpqrstuvwxyz"
+
+
+def geohash_encode(lat, lng, precision=6):
+    """좌표의 geohash 문자열 (precision 6 ≈ 1.2km x 0.6km 격자)"""
+    lat, lng = float(lat), float(lng)
+    lat_range, lng_range = [-90.0, 90.0], [-180.0, 180.0]
+    chars = []
+    bits, bit_count, even = 0, 0, True
+    while len(chars) < precision:
+        # 경도/위도 비트를 번갈아 가며 범위를 반으로 나눔
+        value, value_range = (lng, lng_range) if even else (lat, lat_range)
+        mid = (value_range[0] + value_range[1]) / 2
+        if value >= mid:
+            bits = bits * 2 + 1
+            value_range[0] = mid
+        else:
+            bits = bits * 2
+            value_range[1] = mid
+        even = not even
+        bit_count += 1
+        if bit_count == 5:
+            chars.append(GEOHASH_ALPHABET[bits])
+            bits, bit_count = 0, 0
+    return "".join(chars)
+
+
+def geohash_bounds(geohash):
+    """geohash 격자의 (최소 위도, 최대 위도, 최소 경도, 최대 경도)"""
+    lat_range, lng_range = [-90.0, 90.0], [-180.0, 180.0]
+    even = True
+    for char in geohash:
+        bits = GEOHASH_ALPHABET.index(char)
+        for shift in range(4, -1, -1):
+            value_range = lng_range if even else lat_range
+            mid = (value_range[0] + value_range[1]) / 2
+            if bits >> shift & 1:
+                value_range[0] = mid
+            else:
+                value_range[1] = mid
+            even = not even
+    return lat_range[0], lat_range[1], lng_range[0], lng_range[1]
+
+
+def geohash_cell_size(precision, lat=0.0):
+    """precision 자리 geohash 격자의 (높이, 너비) 미터 (너비는 위도 lat에서, 고위도일수록 좁아짐)"""
+    lat_bits = precision * 5 // 2
+    lng_bits = precision * 5 - lat_bits
+    height = 180 / 2 ** lat_bits * METERS_PER_DEGREE
+    width = 360 / 2 ** lng_bits * METERS_PER_DEGREE * math.cos(math.radians(min(abs(lat), 89.9)))
+    return height, width
+
+
+def geohash_precision(distance, lat=0.0):
+    """주변 8칸만 봐도 distance 안의 점을 모두 찾을 수 있는 가장 긴 자리 수 (격자 높이/너비가 distance 이상)"""
+    for precision in range(12, 1, -1):
+        if min(geohash_cell_size(precision, lat)) >= distance:
+            return precision
+    return 1
+
+
+def geohash_neighbors(geohash):
+    """geohash 격자와 주변 8개 격자 (극/날짜 변경선 바깥은 제외)"""
+    min_lat, max_lat, min_lng, max_lng = geohash_bounds(geohash)
+    height, width = max_lat - min_lat, max_lng - min_lng
+    center_lat, center_lng = (min_lat + max_lat) / 2, (min_lng + max_lng) / 2
+    cells = []
+    for d_lat in (-1, 0, 1):
+        lat = center_lat + d_lat * height
+        if not -90 < lat < 90:
+            continue
+        for d_lng in (-1, 0, 1):
+            lng = center_lng + d_lng * width
+            if not -180 < lng < 180:
+                continue
+            cells.append(geohash_encode(lat, lng, len(geohash)))
+    return cells
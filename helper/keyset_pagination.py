@@ -0,0 +1,93 @@
+import base64
+import datetime
+import json
+
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Q
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+class CursorEncoder(DjangoJSONEncoder):
+    """일시는 마이크로초까지 (DjangoJSONEncoder는 밀리초로 잘라서 같은 밀리초에 만든 행을 건너뜀)"""
+
+    def default(self, o):
+        if isinstance(o, datetime.datetime):
+            return o.isoformat()
+        return super().default(o)
+
+
+class KeysetPaginator:
+    """정렬 키 값을 커서로 넘겨서 OFFSET 없이 다음 페이지를 조회하는 페이지네이션
+
+    ordering은 order_by 형식의 필드 목록이고, 마지막 필드는 id처럼 유일해야 함
+    """
+
+    def __init__(self, ordering, default_limit=20, max_limit=100):
+        self.ordering = ordering
+        self.default_limit = default_limit
+        self.max_limit = max_limit
+
+    def get_limit(self, value):
+        """limit 파라미터 검증 (없으면 기본값, 범위 밖이면 ValueError)"""
+        if value in (None, ""):
+            return self.default_limit
+        limit = int(value)
+        if not 1 <= limit <= self.max_limit:
+            raise ValueError(f"limit은 1~{self.max_limit} 사이여야 합니다.")
+        return limit
+
+    def encode_cursor(self, obj):
+        values = [getattr(obj, field.lstrip("-")) for field in self.ordering]
+        raw = json.dumps(values, cls=CursorEncoder, ensure_ascii=False)
+        return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+    def decode_cursor(self, cursor, queryset):
+        """커서를 정렬 필드 값 목록으로 (값마다 필드 타입으로 변환, 잘못된 값이면 InvalidCursor)"""
+        try:
+            values = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8"))
+        except (ValueError, UnicodeError):
+            raise InvalidCursor("잘못된 커서입니다.")
+        if not isinstance(values, list) or len(values) != len(self.ordering):
+            raise InvalidCursor("잘못된 커서입니다.")
+        try:
+            return [
+                self._field(queryset, field.lstrip("-")).to_python(value)
+                for field, value in zip(self.ordering, values)
+            ]
+        except (ValidationError, TypeError, ValueError):
+            raise InvalidCursor("잘못된 커서입니다.")
+
+    def _field(self, queryset, name):
+        """정렬 필드 (모델 필드가 아니면 annotate한 값의 output_field)"""
+        try:
+            return queryset.model._meta.get_field(name)
+        except FieldDoesNotExist:
+            return queryset.query.annotations[name].output_field
+
+    def _after(self, values):
+        """(a, b, c) 정렬에서 커서 다음 행 조건: a > x OR (a = x AND b > y) OR (a = x AND b = y AND c > z)"""
+        condition = Q()
+        equal = Q()
+        for field, value in zip(self.ordering, values):
+            name = field.lstrip("-")
+            lookup = "lt" if field.startswith("-") else "gt"
+            condition |= equal & Q(**{f"{name}__{lookup}": value})
+            equal &= Q(**{name: value})
+        return condition
+
+    def paginate(self, queryset, cursor=None, limit=None):
+        """(현재 페이지 객체 목록, 다음 커서) 반환 - 마지막 페이지면 다음 커서는 None"""
+        limit = limit or self.default_limit
+        queryset = queryset.order_by(*self.ordering)
+        if cursor:
+            queryset = queryset.filter(self._after(self.decode_cursor(cursor, queryset)))
+
+        rows = list(queryset[:limit + 1])
+        if len(rows) <= limit:
+            return rows, None
+        rows = rows[:limit]
+        return rows, self.encode_cursor(rows[-1])
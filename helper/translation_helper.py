@@ -0,0 +1,106 @@
+from django.db import models
+from django.db.models import F, FilteredRelation, Prefetch, Q
+from django.utils import timezone
+
+
+class TranslationQuerySet(models.QuerySet):
+    """번역(translations) 관계를 가진 모델용 QuerySet"""
+
+    def with_translations(self, *langs):
+        """번역을 한 번의 쿼리로 미리 가져오기 (langs를 주면 해당 언어만)"""
+        translation_model = self.model._meta.get_field("translations").related_model
+        translations = translation_model.objects.order_by()
+        if langs:
+            translations = translations.filter(lang__in=langs)
+        return self.prefetch_related(Prefetch("translations", queryset=translations))
+
+    def with_translation(self, lang, *fields):
+        """지정한 언어의 번역 한 행만 JOIN 해서 translated_<필드> 로 annotate (추가 쿼리 없음)"""
+        annotations = {
+            f"translated_{field}": F(f"lang_translation__{field}") for field in fields
+        }
+        return self.annotate(
+            lang_translation=FilteredRelation("translations", condition=Q(translations__lang=lang)),
+            **annotations
+        )
+
+
+class TranslatableMixin:
+    """prefetch 된 번역이 있으면 그걸 쓰고, 없을 때만 DB를 조회하는 모델 믹스인"""
+
+    def get_translation(self, lang="ko"):
+        """지정한 언어의 번역 객체 가져오기 (없으면 None)"""
+        prefetched = getattr(self, "_prefetched_objects_cache", {})
+        if "translations" in prefetched:
+            for translation in prefetched["translations"]:
+                if translation.lang == lang:
+                    return translation
+            return None
+        return self.translations.filter(lang=lang).first()
+
+    def get_translated_field(self, field_name, lang="ko", default=None):
+        """지정한 언어의 번역 필드 값 가져오기"""
+        translation = self.get_translation(lang)
+        if translation is None:
+            return default
+        return getattr(translation, field_name)
+
+
+class TranslationDiff:
+    """원하는 번역 {(부모 ID, lang): 필드}와 DB의 현재 번역을 비교한 결과 (추가/수정/삭제할 행)
+
+    바뀐 행만 bulk_create / bulk_update 하고, 원하는 목록에 없는 언어의 번역은 삭제
+    parent_ids를 주면 그 부모들의 번역만 비교 (없으면 원하는 번역의 부모만)
+    """
+
+    def __init__(self, translation_model, parent_field, translations, parent_ids=None):
+        self.model = translation_model
+        self.parent_field = parent_field
+        parent_ids = set(parent_ids) if parent_ids is not None else {parent_id for parent_id, _ in translations}
+        field_names = sorted({field for fields in translations.values() for field in fields})
+
+        existing = {
+            (getattr(translation, f"{parent_field}_id"), translation.lang): translation
+            for translation in translation_model.objects.filter(
+                **{f"{parent_field}_id__in": parent_ids}
+            ).order_by().only("id", f"{parent_field}_id", "lang", *field_names)
+        }
+
+        self.to_create = []
+        self.to_update = []
+        self.update_fields = set()
+        for (parent_id, lang), fields in translations.items():
+            translation = existing.get((parent_id, lang))
+            if translation is None:
+                self.to_create.append(translation_model(**{f"{parent_field}_id": parent_id, "lang": lang}, **fields))
+                continue
+            changed = {name for name, value in fields.items() if getattr(translation, name) != value}
+            if changed:
+                for name in changed:
+                    setattr(translation, name, fields[name])
+                self.update_fields |= changed
+                self.to_update.append(translation)
+        self.to_delete = [translation for key, translation in existing.items() if key not in translations]
+
+    def __bool__(self):
+        return bool(self.to_create or self.to_update or self.to_delete)
+
+    def changed_parent_ids(self):
+        """번역이 추가/수정/삭제되는 부모 ID 집합"""
+        parent_field = f"{self.parent_field}_id"
+        return {getattr(translation, parent_field) for translation in self.to_create + self.to_update + self.to_delete}
+
+    def apply(self, batch_size=500):
+        """변경 사항 반영 (호출하는 쪽에서 transaction.atomic으로 묶기)"""
+        if self.to_delete:
+            self.model.objects.filter(id__in=[translation.id for translation in self.to_delete]).delete()
+        if self.to_create:
+            self.model.objects.bulk_create(self.to_create, batch_size=batch_size)
+        if self.to_update:
+            # bulk_update는 auto_now를 채우지 않아서 직접 갱신
+            now = timezone.now()
+            for translation in self.to_update:
+                translation.updated_at = now
+            self.model.objects.bulk_update(
+                self.to_update, sorted(self.update_fields | {"updated_at"}), batch_size=batch_size
+            )
@@ -0,0 +1,10 @@
+from django.contrib import admin
+from outbox.models import CatalogChange
+
+
+@admin.register(CatalogChange)
+class CatalogChangeAdmin(admin.ModelAdmin):
+    list_display = ["id", "entity", "entity_id", "action", "created_at", "processed_at"]
+    list_filter = ["entity", "action", "processed_at"]
+    search_fields = ["entity_id"]
+    readonly_fields = ["entity", "entity_id", "action", "created_at", "processed_at"]
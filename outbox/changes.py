@@ -0,0 +1,91 @@
+import threading
+from contextlib import contextmanager
+
+from django.core.exceptions import ImproperlyConfigured
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from outbox.models import CatalogChange
+
+# 한 번에 INSERT할 변경 기록 수
+BATCH_SIZE = 500
+
+# collect() 안에서 모으는 중인 변경 {(대상, ID): 변경 종류}
+_local = threading.local()
+
+
+def write(changes):
+    """[(대상, ID, 변경 종류)] 기록 INSERT"""
+    CatalogChange.objects.bulk_create(
+        [CatalogChange(entity=entity, entity_id=entity_id, action=action) for entity, entity_id, action in changes],
+        batch_size=BATCH_SIZE
+    )
+
+
+def record(entity, ids, action=CatalogChange.ACTION_UPSERT):
+    """변경 기록 (collect() 안이면 모았다가 블록 끝에 한 번에, 아니면 바로 INSERT)
+
+    변경한 쿼리와 같은 트랜잭션 안에서 호출해야 변경과 기록이 함께 커밋됨
+    """
+    buffer = getattr(_local, "buffer", None)
+    if buffer is None:
+        write((entity, entity_id, action) for entity_id in ids)
+        return
+    for entity_id in ids:
+        # 같은 행은 마지막 변경만 남기고 순서도 마지막 변경 기준
+        buffer.pop((entity, entity_id), None)
+        buffer[(entity, entity_id)] = action
+
+
+@contextmanager
+def collect():
+    """블록 전체를 한 트랜잭션으로 묶고, 안에서 생긴 변경 기록을 (대상, ID)별로 합쳐서 커밋 직전에 INSERT
+
+    일괄 저장 명령처럼 signal이 행마다 발생하는 곳에서 기록 INSERT를 한 번으로 줄임 (중첩되면 바깥 블록에서 기록)
+    """
+    if getattr(_local, "buffer", None) is not None:
+        yield
+        return
+
+    _local.buffer = {}
+    try:
+        with transaction.atomic():
+            yield
+            write((entity, entity_id, action) for (entity, entity_id), action in _local.buffer.items())
+    finally:
+        _local.buffer = None
+
+
+class AtomicSaveMixin:
+    """save()를 post_save의 변경 기록과 한 트랜잭션으로 묶는 모델 믹스인 (track()하는 모델은 필수)
+
+    Django는 post_save를 저장 트랜잭션 밖에서 보내서 autocommit이면 저장만 커밋되고 기록이 빠질 수 있음
+    delete()는 post_delete까지 Django가 한 트랜잭션으로 묶음
+    """
+
+    def save(self, *args, **kwargs):
+        with collect():
+            super().save(*args, **kwargs)
+
+
+def track(model, entity, parent_field=None):
+    """모델 저장/삭제 signal을 변경 기록으로 연결 (번역 모델은 parent_field 부모의 변경으로 기록)
+
+    bulk_create / bulk_update / update()는 signal이 없어서 호출하는 쪽에서 record()로 직접 기록
+    """
+    if not issubclass(model, AtomicSaveMixin):
+        raise ImproperlyConfigured(f"{model._meta.label}: 변경 기록 모델은 AtomicSaveMixin으로 저장해야 함")
+
+    def on_save(sender, instance, **kwargs):
+        if parent_field:
+            record(entity, [getattr(instance, f"{parent_field}_id")])
+        else:
+            record(entity, [instance.pk])
+
+    def on_delete(sender, instance, **kwargs):
+        if parent_field:
+            record(entity, [getattr(instance, f"{parent_field}_id")])
+        else:
+            record(entity, [instance.pk], CatalogChange.ACTION_DELETE)
+
+    post_save.connect(on_save, sender=model, weak=False, dispatch_uid=f"outbox:{model._meta.label}:save")
+    post_delete.connect(on_delete, sender=model, weak=False, dispatch_uid=f"outbox:{model._meta.label}:delete")
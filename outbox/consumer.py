@@ -0,0 +1,110 @@
+import time
+from collections import defaultdict
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from outbox.models import CatalogChange
+
+# [(대상 집합, 핸들러)] - 앱이 ready()에서 register로 등록
+HANDLERS = []
+
+# 처리한 지 오래된 기록을 지우는 간격 (초)
+PURGE_INTERVAL = 60 * 60
+
+
+def register(*entities):
+    """변경 기록 핸들러 등록 데코레이터 (배치에 entities 중 하나라도 있으면 ChangeSet으로 한 번 호출)"""
+    def decorator(handler):
+        HANDLERS.append((set(entities), handler))
+        return handler
+    return decorator
+
+
+class ChangeSet:
+    """한 배치의 변경 기록을 대상별로 합친 것 (같은 행은 마지막 변경 기준)"""
+
+    def __init__(self, changes):
+        actions = {}
+        for change in changes:
+            actions[(change.entity, change.entity_id)] = change.action
+
+        # {대상: ID 집합}
+        self.upserted = defaultdict(set)
+        self.deleted = defaultdict(set)
+        for (entity, entity_id), action in actions.items():
+            if action == CatalogChange.ACTION_DELETE:
+                self.deleted[entity].add(entity_id)
+            else:
+                self.upserted[entity].add(entity_id)
+
+    @property
+    def entities(self):
+        return set(self.upserted) | set(self.deleted)
+
+    def __contains__(self, entity):
+        return entity in self.entities
+
+
+class OutboxConsumer:
+    """처리 대기 중인 변경 기록을 id 순으로 배치씩 핸들러에 전달 (최소 한 번 처리)
+
+    핸들러 호출과 처리 표시가 한 트랜잭션이라, 핸들러가 실패하면 배치 전체가 다음에 다시 처리됨
+    같은 기록이 두 번 전달될 수 있어서 핸들러는 다시 실행해도 결과가 같아야 함
+    """
+
+    def __init__(self, batch_size=500, handlers=None, log=None):
+        self.batch_size = batch_size
+        self.handlers = HANDLERS if handlers is None else handlers
+        self.log = log or (lambda message: None)
+        self.processed = 0
+
+    def process_batch(self):
+        """한 배치 처리 후 처리한 기록 수 반환 (대기 중인 기록이 없으면 0)"""
+        with transaction.atomic():
+            # 여러 consumer가 동시에 돌아도 같은 기록을 잡지 않게 (PostgreSQL)
+            changes = list(
+                CatalogChange.objects.pending().select_for_update(skip_locked=True).order_by("id")[:self.batch_size]
+            )
+            if not changes:
+                return 0
+
+            change_set = ChangeSet(changes)
+            for entities, handler in self.handlers:
+                if entities & change_set.entities:
+                    handler(change_set)
+
+            CatalogChange.objects.filter(id__in=[change.id for change in changes]).update(
+                processed_at=timezone.now()
+            )
+        self.processed += len(changes)
+        return len(changes)
+
+    def drain(self):
+        """대기 중인 기록이 없을 때까지 처리하고 처리한 수 반환"""
+        processed = 0
+        while True:
+            count = self.process_batch()
+            if not count:
+                return processed
+            processed += count
+
+    def purge(self):
+        """처리한 지 CATALOG_OUTBOX_RETENTION_DAYS일이 지난 기록 삭제"""
+        return CatalogChange.objects.purge(settings.CATALOG_OUTBOX_RETENTION_DAYS)
+
+    def run(self, interval=5, stop=None):
+        """계속 실행하면서 기록이 없으면 interval초 대기 (핸들러 오류는 로그만 남기고 다음 주기에 재시도)"""
+        purged_at = 0.0
+        while stop is None or not stop():
+            try:
+                count = self.drain()
+                if time.monotonic() - purged_at >= PURGE_INTERVAL:
+                    self.purge()
+                    purged_at = time.monotonic()
+            except Exception as e:
+                self.log(f"❌ 변경 기록 처리 실패 (다음 주기에 재시도): {e}")
+                count = 0
+            if count:
+                self.log(f"✅ 변경 기록 {count}개 처리")
+            time.sleep(interval)
@@ -0,0 +1,23 @@
+from django.core.management.base import BaseCommand
+from outbox.consumer import OutboxConsumer
+
+
+class Command(BaseCommand):
+    help = "카탈로그 변경 기록을 배치로 처리합니다. (캐시 갱신 등, 실패한 배치는 다시 처리)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--once", action="store_true", help="대기 중인 기록만 처리하고 종료")
+        parser.add_argument("--batch-size", type=int, default=500, help="한 번에 처리할 기록 수")
+        parser.add_argument("--interval", type=float, default=5, help="처리할 기록이 없을 때 대기 시간 (초)")
+
+    def handle(self, *args, **options):
+        consumer = OutboxConsumer(batch_size=options["batch_size"], log=self.stdout.write)
+
+        if not options["once"]:
+            self.stdout.write(f"🔄 변경 기록 처리 시작 ({options['interval']}초 간격)")
+            consumer.run(interval=options["interval"])
+            return
+
+        processed = consumer.drain()
+        purged = consumer.purge()
+        self.stdout.write(self.style.SUCCESS(f"✅ 변경 기록 {processed}개 처리, 오래된 기록 {purged}개 삭제"))
@@ -0,0 +1,32 @@
+# Generated by Django 5.2.18 on 2026-10-17 19:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CatalogChange',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('entity', models.CharField(choices=[('place', '관광지'), ('region', '지역'), ('subregion', '서브지역'), ('category', '카테고리'), ('subcategory', '서브카테고리')], max_length=20, verbose_name='대상')),
+                ('entity_id', models.BigIntegerField(verbose_name='대상 ID')),
+                ('action', models.CharField(choices=[('upsert', '추가/수정'), ('delete', '삭제')], default='upsert', max_length=10, verbose_name='변경 종류')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='생성일시')),
+                ('processed_at', models.DateTimeField(blank=True, null=True, verbose_name='처리일시')),
+            ],
+            options={
+                'verbose_name': '카탈로그 변경 기록',
+                'verbose_name_plural': '카탈로그 변경 기록들',
+                'db_table': 'catalog_outbox',
+                'ordering': ['id'],
+                'indexes': [models.Index(condition=models.Q(('processed_at__isnull', True)), fields=['id'], name='catalog_outbox_pending_idx'), models.Index(fields=['processed_at'], name='catalog_outbox_processed_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,82 @@
+from datetime import timedelta
+
+from django.db import models
+from django.utils import timezone
+
+
+class CatalogChangeQuerySet(models.QuerySet):
+
+    def pending(self):
+        return self.filter(processed_at__isnull=True)
+
+    def purge(self, retention_days):
+        """처리한 지 retention_days일이 지난 기록 삭제, 삭제 수 반환"""
+        deleted, _ = self.filter(processed_at__lt=timezone.now() - timedelta(days=retention_days)).delete()
+        return deleted
+
+
+# 관광지/지역/카테고리 변경 기록 (변경과 같은 트랜잭션에 기록하고, process_outbox가 배치로 처리)
+class CatalogChange(models.Model):
+    ENTITY_PLACE = "place"
+    ENTITY_REGION = "region"
+    ENTITY_SUBREGION = "subregion"
+    ENTITY_CATEGORY = "category"
+    ENTITY_SUBCATEGORY = "subcategory"
+    ENTITY_CHOICES = [
+        (ENTITY_PLACE, "관광지"),
+        (ENTITY_REGION, "지역"),
+        (ENTITY_SUBREGION, "서브지역"),
+        (ENTITY_CATEGORY, "카테고리"),
+        (ENTITY_SUBCATEGORY, "서브카테고리"),
+    ]
+
+    ACTION_UPSERT = "upsert"
+    ACTION_DELETE = "delete"
+    ACTION_CHOICES = [
+        (ACTION_UPSERT, "추가/수정"),
+        (ACTION_DELETE, "삭제"),
+    ]
+
+    id = models.BigAutoField(primary_key=True)
+    entity = models.CharField(
+        max_length=20,
+        choices=ENTITY_CHOICES,
+        verbose_name="대상"
+    )
+    # 번역이 바뀌면 번역의 부모 ID로 기록
+    entity_id = models.BigIntegerField(verbose_name="대상 ID")
+    action = models.CharField(
+        max_length=10,
+        choices=ACTION_CHOICES,
+        default=ACTION_UPSERT,
+        verbose_name="변경 종류"
+    )
+
+    created_at = models.DateTimeField(
+        auto_now_add=True,
+        verbose_name="생성일시"
+    )
+    processed_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        verbose_name="처리일시"
+    )
+
+    objects = CatalogChangeQuerySet.as_manager()
+
+    class Meta:
+        db_table = "catalog_outbox"
+        verbose_name = "카탈로그 변경 기록"
+        verbose_name_plural = "카탈로그 변경 기록들"
+        ordering = ["id"]
+        indexes = [
+            # 처리 대기 중인 기록만 id 순으로 읽기
+            models.Index(
+                fields=["id"], name="catalog_outbox_pending_idx", condition=models.Q(processed_at__isnull=True)
+            ),
+            # 오래된 기록 삭제용
+            models.Index(fields=["processed_at"], name="catalog_outbox_processed_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.get_entity_display()} {self.entity_id} {self.get_action_display()}"
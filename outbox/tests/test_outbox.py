@@ -0,0 +1,188 @@
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+from outbox.changes import collect, record
+from outbox.consumer import ChangeSet, OutboxConsumer
+from outbox.models import CatalogChange
+from places.models import Place, PlaceTranslation
+from places.sync import delete_places
+from places.upsert import upsert_places
+from regions.loader import load_regions, read_dataset
+from regions.models import SubRegion
+
+PLACE = CatalogChange.ENTITY_PLACE
+
+
+def pending_changes():
+    return list(CatalogChange.objects.pending().values_list("entity", "entity_id", "action"))
+
+
+def make_records(count):
+    return [
+        (f"content_{i}", {"latitude": None, "longitude": None, "phone_number": ""}, {"name": f"관광지{i}"})
+        for i in range(count)
+    ]
+
+
+# 변경 기록 테스트
+class RecordChangesTest(TestCase):
+
+    def setUp(self):
+        cache.clear()
+
+    def test_save_and_delete_should_be_recorded(self):
+        place = Place.objects.create(content_id="1")
+        translation = PlaceTranslation.objects.create(place=place, lang="ko", name="경복궁")
+        translation.delete()
+        place_id = place.id
+        place.delete()
+
+        self.assertEqual(pending_changes(), [
+            (PLACE, place_id, "upsert"),
+            (PLACE, place_id, "upsert"),
+            (PLACE, place_id, "upsert"),
+            (PLACE, place_id, "delete"),
+        ])
+
+    # 같은 행의 변경은 마지막 것만 한 번에 INSERT
+    def test_collect_should_merge_changes_into_one_insert(self):
+        # SAVEPOINT + 관광지/번역 INSERT 2 + 변경 기록 INSERT 1 + RELEASE
+        with self.assertNumQueries(5):
+            with collect():
+                place = Place.objects.create(content_id="1")
+                PlaceTranslation.objects.create(place=place, lang="ko", name="경복궁")
+
+        self.assertEqual(pending_changes(), [(PLACE, place.id, "upsert")])
+
+    def test_collect_should_roll_back_changes_with_data(self):
+        with self.assertRaises(ValueError):
+            with collect():
+                Place.objects.create(content_id="1")
+                raise ValueError
+
+        self.assertFalse(Place.objects.exists())
+        self.assertEqual(pending_changes(), [])
+
+    # 변경 기록을 못 남기면 저장도 함께 취소 (post_save는 Django 저장 트랜잭션 밖이라 save()를 직접 묶음)
+    def test_save_should_roll_back_when_record_fails(self):
+        with mock.patch("outbox.changes.write", side_effect=ValueError):
+            with self.assertRaises(ValueError):
+                Place.objects.create(content_id="1")
+
+        self.assertFalse(Place.objects.exists())
+
+    # 일괄 저장은 바뀐 관광지만 기록
+    def test_bulk_upsert_should_record_only_changed_places(self):
+        upsert_places(make_records(3))
+        self.assertEqual(len(pending_changes()), 3)
+
+        CatalogChange.objects.all().delete()
+        records = make_records(3)
+        records[0][2]["name"] = "새 이름"
+        upsert_places(records)
+
+        self.assertEqual(pending_changes(), [(PLACE, Place.objects.get(content_id="content_0").id, "upsert")])
+
+    def test_delete_places_should_record_deletes(self):
+        upsert_places(make_records(2))
+        place_ids = set(Place.objects.values_list("id", flat=True))
+        CatalogChange.objects.all().delete()
+
+        delete_places(["content_0", "content_1"])
+
+        self.assertEqual({(entity_id, action) for _, entity_id, action in pending_changes()}, {
+            (place_id, "delete") for place_id in place_ids
+        })
+
+    def test_load_regions_should_record_only_changes(self):
+        dataset = read_dataset()
+        load_regions(dataset)
+        self.assertEqual(
+            CatalogChange.objects.filter(entity=CatalogChange.ENTITY_REGION).count(), len(dataset["regions"])
+        )
+        self.assertEqual(
+            CatalogChange.objects.filter(entity=CatalogChange.ENTITY_SUBREGION).count(), len(dataset["subregions"])
+        )
+
+        CatalogChange.objects.all().delete()
+        load_regions(dataset)
+        self.assertEqual(pending_changes(), [])
+
+        # 지역을 지우면 CASCADE로 지워진 서브지역도 삭제로 기록
+        removed_region_id = dataset["regions"].pop(0)["id"]
+        dataset["subregions"] = [data for data in dataset["subregions"] if data["region_id"] != removed_region_id]
+        removed_subregion_ids = set(SubRegion.objects.filter(region_id=removed_region_id).values_list("id", flat=True))
+        load_regions(dataset)
+
+        change_set = ChangeSet(CatalogChange.objects.pending())
+        self.assertEqual(change_set.deleted[CatalogChange.ENTITY_REGION], {removed_region_id})
+        self.assertEqual(change_set.deleted[CatalogChange.ENTITY_SUBREGION], removed_subregion_ids)
+        self.assertEqual(dict(change_set.upserted), {})
+
+
+# 변경 기록 처리 테스트
+class OutboxConsumerTest(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.calls = []
+
+    def handler(self, changes):
+        self.calls.append((dict(changes.upserted), dict(changes.deleted)))
+
+    def test_batch_should_be_merged_and_marked_processed(self):
+        record(PLACE, [1, 2])
+        record(PLACE, [1], CatalogChange.ACTION_DELETE)
+        record(CatalogChange.ENTITY_REGION, [3])
+
+        consumer = OutboxConsumer(handlers=[({PLACE}, self.handler)])
+        self.assertEqual(consumer.drain(), 4)
+
+        self.assertEqual(self.calls, [({PLACE: {2}, CatalogChange.ENTITY_REGION: {3}}, {PLACE: {1}})])
+        self.assertEqual(pending_changes(), [])
+
+    def test_handler_should_only_run_for_its_entities(self):
+        record(CatalogChange.ENTITY_REGION, [1])
+
+        OutboxConsumer(handlers=[({PLACE}, self.handler)]).drain()
+
+        self.assertEqual(self.calls, [])
+        self.assertEqual(pending_changes(), [])
+
+    def test_batches_should_follow_id_order(self):
+        record(PLACE, range(5))
+
+        consumer = OutboxConsumer(batch_size=2, handlers=[({PLACE}, self.handler)])
+        self.assertEqual(consumer.process_batch(), 2)
+        self.assertEqual(self.calls[0][0], {PLACE: {0, 1}})
+        self.assertEqual(consumer.drain(), 3)
+        self.assertEqual(len(self.calls), 3)
+
+    # 핸들러가 실패하면 처리 표시도 되돌려서 다음에 다시 전달 (최소 한 번)
+    def test_failed_batch_should_be_delivered_again(self):
+        record(PLACE, [1])
+
+        def failing(changes):
+            raise RuntimeError("search index down")
+
+        with self.assertRaises(RuntimeError):
+            OutboxConsumer(handlers=[({PLACE}, failing)]).process_batch()
+        self.assertEqual(pending_changes(), [(PLACE, 1, "upsert")])
+
+        OutboxConsumer(handlers=[({PLACE}, self.handler)]).process_batch()
+        self.assertEqual(self.calls, [({PLACE: {1}}, {})])
+
+    def test_command_should_process_and_purge_old_changes(self):
+        record(PLACE, [1])
+        old = CatalogChange.objects.create(entity=PLACE, entity_id=2)
+        CatalogChange.objects.filter(id=old.id).update(processed_at=timezone.now() - timedelta(days=30))
+
+        out = StringIO()
+        call_command("process_outbox", once=True, stdout=out)
+
+        self.assertIn("변경 기록 1개 처리, 오래된 기록 1개 삭제", out.getvalue())
+        self.assertEqual(list(CatalogChange.objects.values_list("entity_id", flat=True)), [1])
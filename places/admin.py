@@ -1,6 +1,6 @@
 # places/admin.py
 from django.contrib import admin
-from places.models import Place, PlaceTranslation
+from places.models import Place, PlaceTranslation, SyncRun
 
 
 # Place Admin에서 번역을 인라인으로 관리
@@ -81,6 +81,9 @@ class PlaceAdmin(admin.ModelAdmin):
         })
     ]
 
+    def get_queryset(self, request):
+        return super().get_queryset(request).with_translations("ko")
+
 # 리스트에서 한국어 이름 표시
     def get_korean_name(self, obj):
         name = obj.get_name("ko")
@@ -118,3 +121,46 @@ class PlaceTranslationAdmin(admin.ModelAdmin):
         return "-"
 
     get_short_description.short_description = "설명"
+
+
+# 관광지 동기화 기록 (읽기 전용, 동기화 지연 확인용)
+@admin.register(SyncRun)
+class SyncRunAdmin(admin.ModelAdmin):
+    list_display = [
+        "id",
+        "kind",
+        "scope",
+        "status",
+        "started_at",
+        "finished_at",
+        "high_water_mark",
+        "get_lag",
+        "inserted",
+        "updated",
+        "unchanged",
+        "deleted",
+        "get_rows_per_second"
+    ]
+    list_filter = ["kind", "status", "scope"]
+    readonly_fields = [field.name for field in SyncRun._meta.fields]
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+# 원본 수정 시간 기준점이 현재보다 얼마나 뒤처졌는지
+    def get_lag(self, obj):
+        lag = obj.lag
+        if lag is None:
+            return "-"
+        hours, remainder = divmod(int(lag.total_seconds()), 3600)
+        return f"{hours}시간 {remainder // 60}분"
+
+    get_lag.short_description = "지연"
+
+    def get_rows_per_second(self, obj):
+        return obj.metrics.get("rows_per_second", "-")
+
+    get_rows_per_second.short_description = "처리 속도 (행/초)"
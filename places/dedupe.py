@@ -0,0 +1,165 @@
+import re
+import time
+import unicodedata
+from collections import Counter, defaultdict
+
+from helper.geo_helper import geohash_encode, geohash_neighbors, geohash_precision, haversine_distance
+from outbox.changes import collect, record
+from outbox.models import CatalogChange
+from places.models import Place, PlaceTranslation
+
+# 이 거리(미터) 안에 있고 정규화한 이름이 같으면 같은 관광지로 봄
+DEDUPE_MAX_DISTANCE = 300
+
+# 이보다 짧은 이름은 비교하지 않음 (한 글자 이름끼리 잘못 묶이지 않게)
+MIN_NAME_LENGTH = 2
+
+# 한 번에 저장할 관광지 수
+UPDATE_BATCH_SIZE = 500
+
+# 괄호 안 부가 표기 - "경복궁(景福宮)", "Gyeongbokgung Palace [Seoul]"
+BRACKETS = re.compile(r"[(\[{（【].*?[)\]}）】]")
+NON_WORD = re.compile(r"[\W_]+")
+
+
+def normalize_name(name):
+    """비교용 이름 (전각/반각 통일, 소문자, 괄호 표기와 공백/기호 제거)"""
+    name = unicodedata.normalize("NFKC", name or "").lower()
+    name = NON_WORD.sub("", BRACKETS.sub("", name))
+    return name if len(name) >= MIN_NAME_LENGTH else ""
+
+
+def find_duplicates(places, max_distance=DEDUPE_MAX_DISTANCE):
+    """(키, 위도, 경도, 정규화한 이름 집합) 목록에서 같은 관광지 묶음 [키 집합] 반환
+
+    geohash 격자별로 이름 → 관광지 버킷을 만들고, 같은 격자와 주변 8칸에서 이름이 같은 것만 거리 비교
+    (전체 쌍을 비교하지 않아 관광지 수에 거의 비례), 연결된 관광지는 union-find로 한 묶음
+    격자 자리 수는 가장 고위도 관광지에서도 격자가 max_distance보다 크게 정함 (300m → 6자리 ≈ 1.2km x 0.6km)
+    """
+    located = [
+        (key, float(lat), float(lng), names) for key, lat, lng, names in places if lat is not None and lng is not None
+    ]
+    precision = geohash_precision(max_distance, max((abs(lat) for _, lat, _, _ in located), default=0.0))
+
+    cells = defaultdict(lambda: defaultdict(list))
+    for key, lat, lng, names in located:
+        cell = geohash_encode(lat, lng, precision)
+        for name in names:
+            cells[cell][name].append((key, lat, lng))
+
+    parent = {}
+
+    def find(key):
+        parent.setdefault(key, key)
+        while parent[key] != key:
+            parent[key] = parent[parent[key]]
+            key = parent[key]
+        return key
+
+    for cell, by_name in cells.items():
+        nearby = [cells[neighbor] for neighbor in geohash_neighbors(cell) if neighbor in cells]
+        for name, members in by_name.items():
+            for other_cell in nearby:
+                for key, lat, lng in members:
+                    for other_key, other_lat, other_lng in other_cell.get(name, ()):
+                        # 한 쌍은 한 방향에서만 비교
+                        if key >= other_key or find(key) == find(other_key):
+                            continue
+                        if haversine_distance(lat, lng, other_lat, other_lng) <= max_distance:
+                            parent[find(other_key)] = find(key)
+
+    clusters = defaultdict(set)
+    for key in parent:
+        clusters[find(key)].add(key)
+    return [cluster for cluster in clusters.values() if len(cluster) > 1]
+
+
+class DedupeStats:
+    """중복 관광지 정리 결과 집계"""
+
+    def __init__(self):
+        self.places = 0
+        self.clusters = 0
+        self.duplicates = 0
+        self.changed = 0
+        self.elapsed = 0.0
+
+    def as_dict(self):
+        return {
+            "places": self.places,
+            "clusters": self.clusters,
+            "duplicates": self.duplicates,
+            "changed": self.changed,
+            "elapsed": round(self.elapsed, 3),
+        }
+
+    def __str__(self):
+        return (
+            f"관광지 {self.places}개 중 {self.clusters}묶음 / 중복 {self.duplicates}개 "
+            f"(연결 변경 {self.changed}개, {self.elapsed:.2f}초)"
+        )
+
+
+class PlaceDeduplicator:
+    """좌표가 가깝고 이름(모든 언어 번역)이 같은 관광지를 대표 관광지 하나에 연결 (canonical_id)
+
+    대표는 번역 언어가 많은 것 → 즐겨찾기가 많은 것 → 먼저 저장된 것 순으로 고름
+    매번 전체를 다시 계산하고 canonical_id가 바뀐 관광지만 저장 (삭제된 대표의 연결도 이때 정리)
+    """
+
+    def __init__(self, max_distance=DEDUPE_MAX_DISTANCE):
+        self.max_distance = max_distance
+        self.stats = DedupeStats()
+
+    def load(self):
+        """[(place_id, 위도, 경도, 이름 집합)], {place_id: 대표 우선순위 키}"""
+        names = defaultdict(set)
+        languages = Counter()
+        for place_id, name in PlaceTranslation.objects.order_by().values_list("place_id", "name").iterator():
+            languages[place_id] += 1
+            normalized = normalize_name(name)
+            if normalized:
+                names[place_id].add(normalized)
+
+        places = []
+        priority = {}
+        for place_id, lat, lng, favorite_count in Place.objects.exclude(latitude=None).exclude(
+            longitude=None
+        ).order_by().values_list("id", "latitude", "longitude", "favorite_count").iterator():
+            if place_id in names:
+                places.append((place_id, lat, lng, names[place_id]))
+                priority[place_id] = (-languages[place_id], -favorite_count, place_id)
+        return places, priority
+
+    def run(self, dry_run=False):
+        """중복 관광지를 대표 관광지에 연결하고 DedupeStats 반환 (dry_run이면 저장하지 않음)"""
+        started = time.monotonic()
+        places, priority = self.load()
+        clusters = find_duplicates(places, self.max_distance)
+
+        canonical_ids = {}
+        for cluster in clusters:
+            canonical_id = min(cluster, key=priority.__getitem__)
+            for place_id in cluster - {canonical_id}:
+                canonical_ids[place_id] = canonical_id
+
+        current = dict(Place.objects.exclude(canonical_id=None).values_list("id", "canonical_id"))
+        changed = [
+            place_id for place_id in set(current) | set(canonical_ids)
+            if current.get(place_id) != canonical_ids.get(place_id)
+        ]
+        if changed and not dry_run:
+            with collect():
+                Place.objects.bulk_update(
+                    [Place(id=place_id, canonical_id=canonical_ids.get(place_id)) for place_id in changed],
+                    ["canonical_id"],
+                    batch_size=UPDATE_BATCH_SIZE
+                )
+                record(CatalogChange.ENTITY_PLACE, changed)
+
+        self.stats.places = len(places)
+        self.stats.clusters = len(clusters)
+        self.stats.duplicates = len(canonical_ids)
+        self.stats.changed = len(changed)
+        self.stats.elapsed = time.monotonic() - started
+        return self.stats
@@ -0,0 +1,261 @@
+import hashlib
+import mimetypes
+import os
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+
+import requests
+from django.conf import settings
+from django.db.models import F
+from outbox.changes import collect, record
+from outbox.models import CatalogChange
+from PIL import Image, ImageOps, UnidentifiedImageError
+from places.models import Place
+from requests.adapters import HTTPAdapter
+
+# MEDIA_ROOT 아래 관광지 이미지 디렉터리
+IMAGE_DIR = "places"
+
+# 이미지 한 장 최대 크기 (이보다 크면 받지 않음)
+MAX_IMAGE_BYTES = 10 * 1024 * 1024
+
+THUMBNAIL_QUALITY = 85
+
+# 한 번에 저장할 관광지 수
+UPDATE_BATCH_SIZE = 500
+
+# 이 수만큼 이미지 처리가 끝날 때마다 저장 (중간에 멈춰도 끝난 이미지는 다시 받지 않게)
+SAVE_BATCH_SIZE = 100
+
+
+class ImageDownloadError(Exception):
+    pass
+
+
+def image_path(image_hash, suffix):
+    """내용 해시 기준 상대 경로 (해시 앞 두 글자로 디렉터리를 나눔)"""
+    return f"{IMAGE_DIR}/{image_hash[:2]}/{image_hash}{suffix}"
+
+
+def image_extension(content_type):
+    content_type = (content_type or "").split(";")[0].strip().lower()
+    if content_type in ("image/jpeg", "image/jpg", "image/pjpeg"):
+        return ".jpg"
+    return mimetypes.guess_extension(content_type) or ".img"
+
+
+def write_file(path, data):
+    """임시 파일에 쓰고 교체 (동시에 같은 이미지를 써도 깨지지 않음)"""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, "wb") as f:
+        f.write(data)
+    os.replace(temp_path, path)
+
+
+def make_thumbnails(media_root, original, image_hash, sizes):
+    """원본 이미지로 크기별 JPEG 썸네일 생성 → {크기 이름: 상대 경로} (프로세스 풀에서 실행)
+
+    이미 만들어진 썸네일은 다시 만들지 않음 (같은 해시면 같은 결과)
+    """
+    variants = {}
+    missing = {}
+    for name, size in sizes.items():
+        variants[name] = image_path(image_hash, f"_{name}.jpg")
+        if not os.path.exists(os.path.join(media_root, variants[name])):
+            missing[name] = size
+    if not missing:
+        return variants
+
+    with Image.open(os.path.join(media_root, original)) as image:
+        image = ImageOps.exif_transpose(image).convert("RGB")
+        for name, size in missing.items():
+            thumbnail = image.copy()
+            thumbnail.thumbnail((size, size), Image.Resampling.LANCZOS)
+            path = os.path.join(media_root, variants[name])
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            temp_path = f"{path}.{os.getpid()}.tmp"
+            thumbnail.save(temp_path, "JPEG", quality=THUMBNAIL_QUALITY, optimize=True, progressive=True)
+            os.replace(temp_path, path)
+    return variants
+
+
+class ImageStats:
+    """이미지 처리 결과 집계"""
+
+    def __init__(self):
+        self.downloaded = 0
+        self.deduplicated = 0
+        self.failed = 0
+        self.places_updated = 0
+        self.elapsed = 0.0
+
+    def as_dict(self):
+        return {
+            "downloaded": self.downloaded,
+            "deduplicated": self.deduplicated,
+            "failed": self.failed,
+            "places_updated": self.places_updated,
+            "elapsed": round(self.elapsed, 3),
+        }
+
+    def __str__(self):
+        return (
+            f"다운로드 {self.downloaded} / 중복 {self.deduplicated} / 실패 {self.failed} "
+            f"(관광지 {self.places_updated}개 갱신, {self.elapsed:.2f}초)"
+        )
+
+
+class ImagePipeline:
+    """image_url이 바뀐 관광지의 이미지를 받아서 내용 해시 경로에 저장하고 썸네일 생성
+
+    다운로드는 스레드 풀(동시 요청 수 제한), 썸네일은 프로세스 풀에서 처리하고 DB 저장은 호출한 스레드에서만
+    같은 URL은 한 번만 받고, 같은 내용의 이미지는 파일 하나만 저장
+    처리가 끝난 이미지는 batch_size개마다 저장 (중간에 실패해도 저장된 관광지는 다음 실행 때 건너뜀)
+    """
+
+    def __init__(self, workers=8, processes=None, timeout=15, media_root=None, sizes=None, log=None,
+                 batch_size=SAVE_BATCH_SIZE):
+        self.workers = workers
+        self.processes = processes
+        self.batch_size = batch_size
+        self.timeout = timeout
+        self.media_root = media_root or settings.MEDIA_ROOT
+        self.sizes = sizes or settings.PLACE_IMAGE_SIZES
+        self.log = log or (lambda message: None)
+        self.stats = ImageStats()
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=workers, pool_maxsize=workers)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def download(self, url):
+        """이미지 다운로드 → (내용, Content-Type) (이미지가 아니거나 너무 크면 ImageDownloadError)"""
+        try:
+            with self.session.get(url, timeout=self.timeout, stream=True) as response:
+                if response.status_code != 200:
+                    raise ImageDownloadError(f"HTTP {response.status_code}")
+                content_type = response.headers.get("Content-Type", "")
+                if not content_type.startswith("image/"):
+                    raise ImageDownloadError(f"이미지가 아님: {content_type}")
+
+                chunks = []
+                size = 0
+                for chunk in response.iter_content(64 * 1024):
+                    size += len(chunk)
+                    if size > MAX_IMAGE_BYTES:
+                        raise ImageDownloadError(f"{MAX_IMAGE_BYTES} 바이트 초과")
+                    chunks.append(chunk)
+        except requests.RequestException as e:
+            raise ImageDownloadError(str(e)) from e
+        return b"".join(chunks), content_type
+
+    def store_original(self, content, content_type):
+        """원본을 내용 해시 경로에 저장 → (해시, 상대 경로) (이미 있으면 쓰지 않음)"""
+        image_hash = hashlib.sha256(content).hexdigest()
+        original = image_path(image_hash, image_extension(content_type))
+        path = os.path.join(self.media_root, original)
+        if os.path.exists(path):
+            self.stats.deduplicated += 1
+        else:
+            write_file(path, content)
+        self.stats.downloaded += 1
+        return image_hash, original
+
+    def pending_places(self):
+        """이미지를 다시 처리해야 하는 관광지 {image_url: [place_id]}"""
+        pending = {}
+        for place_id, url in Place.objects.exclude(image_url="").exclude(
+            image_fetched_url=F("image_url")
+        ).order_by().values_list("id", "image_url"):
+            pending.setdefault(url, []).append(place_id)
+        return pending
+
+    def run(self):
+        """처리가 필요한 관광지 이미지를 모두 처리하고 ImageStats 반환 (실패한 이미지는 다음 실행 때 다시 시도)"""
+        started = time.monotonic()
+
+        # 이미지가 없어진 관광지는 경로만 비움 (파일은 다른 관광지가 쓸 수 있어서 남겨둠)
+        cleared = list(Place.objects.filter(image_url="").exclude(image_fetched_url="").values_list("id", flat=True))
+        if cleared:
+            with collect():
+                Place.objects.filter(id__in=cleared).update(image_fetched_url="", image_hash="", image_variants={})
+                record(CatalogChange.ENTITY_PLACE, cleared)
+
+        pending = self.pending_places()
+        if not pending:
+            return self.stats
+        self.log(f"🖼️ 이미지 {len(pending)}개 처리 시작")
+
+        results = {}
+        queue = deque(pending)
+        with ThreadPoolExecutor(max_workers=self.workers) as downloader, \
+                ProcessPoolExecutor(max_workers=self.processes) as resizer:
+            downloads = {}
+            resizes = {}
+            # 받아놓고 처리 못 한 이미지가 메모리에 쌓이지 않게 동시에 받는 수 제한
+            while queue or downloads:
+                while queue and len(downloads) < self.workers * 2:
+                    url = queue.popleft()
+                    downloads[downloader.submit(self.download, url)] = url
+
+                done, _ = wait(downloads, return_when=FIRST_COMPLETED)
+                # 다운로드 결과를 보기 전에 끝난 썸네일부터 저장 (다운로드에서 실패해도 남게)
+                self.collect_resizes(pending, resizes, results)
+                for future in done:
+                    url = downloads.pop(future)
+                    try:
+                        content, content_type = future.result()
+                    except ImageDownloadError as e:
+                        self.stats.failed += 1
+                        self.log(f"❌ 이미지 다운로드 실패 {url}: {e}")
+                        continue
+                    image_hash, original = self.store_original(content, content_type)
+                    future = resizer.submit(make_thumbnails, self.media_root, original, image_hash, self.sizes)
+                    resizes[future] = (url, image_hash, original)
+
+            self.collect_resizes(pending, resizes, results, wait_all=True)
+
+        self.save(pending, results)
+        self.stats.elapsed = time.monotonic() - started
+        return self.stats
+
+    def collect_resizes(self, pending, resizes, results, wait_all=False):
+        """끝난 썸네일 작업 결과를 results에 모으고 batch_size개가 넘으면 저장 (wait_all이면 모두 기다림)"""
+        for future in [future for future in resizes if wait_all or future.done()]:
+            url, image_hash, original = resizes.pop(future)
+            try:
+                variants = future.result()
+            except (OSError, UnidentifiedImageError, Image.DecompressionBombError) as e:
+                # 깨진 이미지는 URL이 바뀔 때까지 다시 받지 않음
+                self.stats.failed += 1
+                self.log(f"❌ 썸네일 생성 실패 {url}: {e}")
+                results[url] = ("", {})
+            else:
+                results[url] = (image_hash, {"original": original, **variants})
+            if len(results) >= self.batch_size:
+                self.save(pending, results)
+
+    def save(self, pending, results):
+        """모은 결과를 저장하고 results를 비움"""
+        places = [
+            Place(id=place_id, image_fetched_url=url, image_hash=image_hash, image_variants=variants)
+            for url, (image_hash, variants) in results.items()
+            for place_id in pending[url]
+        ]
+        with collect():
+            Place.objects.bulk_update(
+                places, ["image_fetched_url", "image_hash", "image_variants"], batch_size=UPDATE_BATCH_SIZE
+            )
+            record(CatalogChange.ENTITY_PLACE, [place.id for place in places])
+        self.stats.places_updated += len(places)
+        results.clear()
+
+    def close(self):
+        self.session.close()
+
+
+def media_url(path):
+    return f"{settings.MEDIA_URL}{path}" if path else None
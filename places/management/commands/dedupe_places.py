@@ -0,0 +1,23 @@
+from django.core.management.base import BaseCommand
+from places.dedupe import DEDUPE_MAX_DISTANCE, PlaceDeduplicator
+
+
+class Command(BaseCommand):
+    help = "좌표가 가깝고 이름이 같은 중복 관광지를 대표 관광지에 연결합니다. (sync_places에서도 매번 실행)"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--max-distance",
+            type=float,
+            default=DEDUPE_MAX_DISTANCE,
+            help="같은 관광지로 볼 최대 거리 (미터)"
+        )
+        parser.add_argument("--dry-run", action="store_true", help="저장하지 않고 결과만 출력")
+
+    def handle(self, *args, **options):
+        stats = PlaceDeduplicator(max_distance=options["max_distance"]).run(dry_run=options["dry_run"])
+        self.stdout.write(f"🔗 중복 관광지: {stats}")
+        if options["dry_run"]:
+            self.stdout.write(self.style.WARNING("--dry-run: 반영하지 않았습니다."))
+            return
+        self.stdout.write(self.style.SUCCESS("✅ 중복 관광지 연결 완료"))
@@ -0,0 +1,207 @@
+import os
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from places.dedupe import PlaceDeduplicator
+from places.images import ImagePipeline
+from places.models import SyncRun
+from places.sync import (
+    AREA_BASED_LIST,
+    AREA_BASED_SYNC_LIST,
+    BASE_LANG,
+    RECONCILE_MAX_DELETE_RATIO,
+    STORE_BATCH_SIZE,
+    PlaceSyncer,
+    SyncError,
+    delta_params,
+    reconcile_places
+)
+from places.tour_api import TourAPIClient, TourAPIError
+
+
+class Command(BaseCommand):
+    help = "TourAPI 관광지 목록을 동시 요청으로 가져와 저장합니다. (중단되면 다시 실행 시 이어받기)"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--mode",
+            choices=[SyncRun.KIND_FULL, SyncRun.KIND_DELTA],
+            default=SyncRun.KIND_DELTA,
+            help="full: 전체 동기화, delta: 마지막 동기화 이후 변경분만 (기록이 없으면 전체)"
+        )
+        parser.add_argument("--reconcile", action="store_true", help="동기화 후 원본에서 사라진 관광지 삭제 대조")
+        parser.add_argument(
+            "--max-delete-ratio",
+            type=float,
+            default=RECONCILE_MAX_DELETE_RATIO,
+            help="삭제 대조 시 허용하는 최대 삭제 비율 (넘으면 중단)"
+        )
+        parser.add_argument("--area", type=str, default="", help="지역 코드 (1:서울, 6:부산, 비우면 전국)")
+        parser.add_argument("--content-type", type=str, default="", help="관광 타입 ID (12:관광지, 비우면 전체)")
+        parser.add_argument(
+            "--langs",
+            type=str,
+            default=",".join(settings.TOUR_API_SERVICES),
+            help="동시에 가져올 언어 (쉼표 구분, 기본 언어 ko는 항상 포함)"
+        )
+        parser.add_argument("--rows", type=int, default=1000, help="페이지당 아이템 수")
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=STORE_BATCH_SIZE,
+            help="한 번에 파싱해서 저장할 아이템 수 (페이지 크기와 상관없이 메모리 사용량 유지)"
+        )
+        parser.add_argument("--workers", type=int, default=4, help="동시 요청 수")
+        parser.add_argument("--rate", type=float, default=10, help="초당 최대 요청 수")
+        parser.add_argument("--retries", type=int, default=4, help="요청 실패 시 재시도 횟수")
+        parser.add_argument("--skip-dedupe", action="store_true", help="중복 관광지 연결 단계 건너뛰기")
+        parser.add_argument("--skip-images", action="store_true", help="이미지 다운로드/썸네일 생성 단계 건너뛰기")
+        parser.add_argument("--image-workers", type=int, default=8, help="이미지 동시 다운로드 수")
+        parser.add_argument("--base-url", type=str, default=None, help="TourAPI 주소 (기본: settings.TOUR_API_BASE_URL)")
+        parser.add_argument("--checkpoint", type=str, default=None, help="체크포인트 파일 경로")
+        parser.add_argument("--restart", action="store_true", help="체크포인트를 무시하고 처음부터")
+
+    def handle(self, *args, **options):
+        langs = [lang.strip() for lang in options["langs"].split(",") if lang.strip()]
+        unknown_langs = set(langs) - set(settings.TOUR_API_SERVICES)
+        if unknown_langs:
+            raise CommandError(f"지원하지 않는 언어: {', '.join(sorted(unknown_langs))}")
+        # 번역은 기본 언어 관광지에 붙으므로 기본 언어는 항상 포함
+        options["langs"] = [BASE_LANG] + [lang for lang in langs if lang != BASE_LANG]
+
+        params = {}
+        if options["area"]:
+            params["areaCode"] = options["area"]
+        if options["content_type"]:
+            params["contentTypeId"] = options["content_type"]
+
+        scope = f"area={options['area'] or 'all'},type={options['content_type'] or 'all'}"
+        mode = options["mode"]
+        operation = AREA_BASED_LIST
+        since = None
+        if mode == SyncRun.KIND_DELTA:
+            since = SyncRun.objects.latest_high_water_mark(scope)
+            if since is None:
+                self.stdout.write("ℹ️ 이전 동기화 기록이 없어 전체 동기화로 진행합니다.")
+                mode = SyncRun.KIND_FULL
+            else:
+                operation = AREA_BASED_SYNC_LIST
+                params = delta_params(params, since)
+
+        checkpoint_path = options["checkpoint"] or os.path.join(
+            settings.TOUR_API_CHECKPOINT_DIR,
+            f"places_{mode}_{options['area'] or 'all'}_{options['content_type'] or 'all'}.json"
+        )
+        if options["restart"] and os.path.exists(checkpoint_path):
+            os.remove(checkpoint_path)
+
+        client = TourAPIClient(
+            base_url=options["base_url"],
+            rate=options["rate"],
+            max_retries=options["retries"],
+            pool_size=options["workers"]
+        )
+        try:
+            self.sync(client, scope, mode, operation, params, since, checkpoint_path, options)
+            if options["reconcile"]:
+                self.reconcile(client, options)
+        finally:
+            client.close()
+
+    def sync(self, client, scope, mode, operation, params, since, checkpoint_path, options):
+        syncer = PlaceSyncer(
+            client,
+            operation=operation,
+            params=params,
+            num_of_rows=options["rows"],
+            workers=options["workers"],
+            checkpoint_path=checkpoint_path,
+            langs=options["langs"],
+            batch_size=options["batch_size"],
+            log=self.stdout.write
+        )
+        run = SyncRun.objects.create(
+            kind=mode, scope=scope, params={"operation": operation, "langs": options["langs"], **params}
+        )
+
+        self.stdout.write(f"🚀 관광지 {run.get_kind_display()} 동기화 시작 (조건: {params or '전체'})")
+        try:
+            stats = syncer.run()
+
+            report = {}
+            unmapped_categories = syncer.category_mapper.report()
+            if unmapped_categories:
+                report["unmapped_categories"] = unmapped_categories
+            if not options["skip_dedupe"]:
+                report["duplicates"] = self.dedupe()
+                syncer.metrics.add_time("dedupe", report["duplicates"]["elapsed"])
+            if not options["skip_images"]:
+                report["images"] = self.process_images(options)
+                syncer.metrics.add_time("images", report["images"]["elapsed"])
+
+            # 변경분이 없으면 기준점 유지
+            high_water_mark = max(filter(None, [syncer.high_water_mark, since]), default=None)
+            run.finish(
+                stats,
+                deleted=syncer.deleted,
+                high_water_mark=high_water_mark,
+                report=report,
+                metrics=syncer.metrics.as_dict(syncer.elapsed)
+            )
+        except (SyncError, TourAPIError) as e:
+            run.fail(e, metrics=syncer.metrics.as_dict(syncer.elapsed))
+            raise CommandError(f"{e} - 다시 실행하면 체크포인트({checkpoint_path})부터 이어받습니다.")
+        except Exception as e:
+            # DB 오류나 중복/이미지 단계 실패도 실패로 기록 (실행 중으로 남으면 지연/성능 비교가 틀어짐)
+            run.fail(e, metrics=syncer.metrics.as_dict(syncer.elapsed))
+            raise
+
+        for unmapped in unmapped_categories:
+            self.stdout.write(
+                f"   - 매핑 없음: 관광 타입 {unmapped['content_type_id'] or '-'} / "
+                f"분류 {unmapped['cat_code'] or '-'} ({unmapped['count']}개)"
+            )
+        self.stdout.write(self.style.SUCCESS(
+            f"✅ 관광지 동기화 완료: {stats}, 비공개 전환 삭제 {syncer.deleted}, 관광지 없는 번역 {syncer.unmatched}"
+        ))
+
+    def dedupe(self):
+        """가깝고 이름이 같은 관광지를 대표 관광지에 연결 (목록/검색에는 대표만 노출)"""
+        stats = PlaceDeduplicator().run()
+        self.stdout.write(f"🔗 중복 관광지 연결 완료: {stats}")
+        return stats.as_dict()
+
+    def process_images(self, options):
+        """이미지가 바뀐 관광지의 원본/썸네일 저장 (실패한 이미지는 다음 실행 때 다시 시도)"""
+        pipeline = ImagePipeline(workers=options["image_workers"], log=self.stdout.write)
+        try:
+            stats = pipeline.run()
+        finally:
+            pipeline.close()
+        self.stdout.write(f"🖼️ 이미지 처리 완료: {stats}")
+        return stats.as_dict()
+
+    def reconcile(self, client, options):
+        run = SyncRun.objects.create(
+            kind=SyncRun.KIND_RECONCILE,
+            scope=f"area={options['area'] or 'all'}",
+            params={"areaCode": options["area"]}
+        )
+
+        self.stdout.write("🔍 원본 ID 목록과 삭제 대조 중...")
+        try:
+            deleted = reconcile_places(
+                client,
+                area_code=options["area"] or None,
+                workers=options["workers"],
+                log=self.stdout.write,
+                max_delete_ratio=options["max_delete_ratio"]
+            )
+        except (SyncError, TourAPIError, ValueError) as e:
+            run.fail(e)
+            raise CommandError(f"삭제 대조 실패: {e}")
+        except Exception as e:
+            run.fail(e)
+            raise
+
+        run.finish(deleted=deleted)
+        self.stdout.write(self.style.SUCCESS(f"✅ 삭제 대조 완료: {deleted}개 삭제"))
@@ -0,0 +1,82 @@
+from django.core.management.base import BaseCommand
+from places.metrics import STAGES, find_regressions
+from places.models import SyncRun
+
+
+class Command(BaseCommand):
+    help = "최근 관광지 동기화 실행의 단계별 시간/처리 속도를 보여주고, 이전 실행보다 느려진 단계를 찾습니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--last", type=int, default=10, help="보여줄 실행 수")
+        parser.add_argument(
+            "--kind",
+            choices=[SyncRun.KIND_FULL, SyncRun.KIND_DELTA],
+            default=None,
+            help="동기화 종류 (비우면 전체/증분 모두)"
+        )
+        parser.add_argument("--scope", type=str, default=None, help="동기화 범위 (예: area=all,type=all)")
+        parser.add_argument(
+            "--threshold",
+            type=float,
+            default=0.2,
+            help="이전 실행 중앙값보다 이 비율 이상 나빠지면 표시 (0.2 = 20%%)"
+        )
+
+    def handle(self, *args, **options):
+        runs = SyncRun.objects.filter(kind__in=[SyncRun.KIND_FULL, SyncRun.KIND_DELTA]).exclude(metrics={})
+        if options["kind"]:
+            runs = runs.filter(kind=options["kind"])
+        if options["scope"]:
+            runs = runs.filter(scope=options["scope"])
+        runs = list(runs.order_by("-started_at", "-id")[:options["last"]])
+        if not runs:
+            self.stdout.write("ℹ️ 성능 지표가 있는 동기화 기록이 없습니다.")
+            return
+
+        for run in reversed(runs):
+            self.write_run(run)
+        self.compare(runs, options["threshold"])
+
+    def write_run(self, run):
+        metrics = run.metrics
+        counters = metrics.get("counters", {})
+        self.stdout.write(
+            f"#{run.id} {run.started_at:%Y-%m-%d %H:%M} {run.get_kind_display()}/{run.get_status_display()} "
+            f"[{run.scope}] {counters.get('items', 0):,}행 {metrics.get('rows_per_second', 0):,.1f}행/초 "
+            f"({metrics.get('elapsed', 0):.1f}초) | 요청 {counters.get('requests', 0)} "
+            f"(재시도 {counters.get('retries', 0)}, 실패 페이지 {counters.get('failed_pages', 0)}) "
+            f"{counters.get('bytes', 0) / 1024 / 1024:.1f}MB | 쿼리 {counters.get('queries', 0)}"
+        )
+        stages = metrics.get("stages", {})
+        self.stdout.write("    " + " · ".join(
+            f"{stage} {stages[stage]:.2f}s" for stage in STAGES if stage in stages
+        ))
+
+    def compare(self, runs, threshold):
+        """가장 최근 성공한 실행을 같은 종류/범위의 이전 성공 실행들과 비교"""
+        successful = [run for run in runs if run.status == SyncRun.STATUS_SUCCESS]
+        if not successful:
+            return
+        latest = successful[0]
+        previous = [
+            run.metrics for run in successful[1:]
+            if run.kind == latest.kind and run.scope == latest.scope
+        ]
+        if not previous:
+            self.stdout.write("ℹ️ 비교할 이전 실행이 없습니다.")
+            return
+
+        regressions = find_regressions(latest.metrics, previous, threshold)
+        if not regressions:
+            self.stdout.write(self.style.SUCCESS(
+                f"✅ #{latest.id}: 이전 {len(previous)}회 중앙값보다 느려진 단계가 없습니다."
+            ))
+            return
+
+        for name, baseline, value in regressions:
+            change = (value - baseline) / baseline * 100 if baseline else 0
+            if name == "rows_per_second":
+                message = f"처리 속도 {baseline:,.1f} → {value:,.1f}행/초 ({change:+.0f}%)"
+            else:
+                message = f"{name} 1000행당 {baseline:.2f}s → {value:.2f}s ({change:+.0f}%)"
+            self.stdout.write(self.style.WARNING(f"⚠️ #{latest.id} {message} (이전 {len(previous)}회 중앙값 대비)"))
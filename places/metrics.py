@@ -0,0 +1,103 @@
+import statistics
+import threading
+import time
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+
+# sync_report에 표시하는 단계 순서
+STAGES = ["fetch", "throttle", "parse", "categories", "locate", "store", "db", "dedupe", "images"]
+
+# 1000행당 이 시간(초)보다 적게 늘어난 단계는 느려진 것으로 보지 않음 (작은 값의 흔들림 무시)
+MIN_STAGE_DELTA = 0.05
+
+
+class SyncMetrics:
+    """동기화 단계별 누적 시간(초)과 카운터 (여러 스레드에서 기록해도 안전)
+
+    fetch/throttle은 여러 스레드의 시간을 합친 값이라 실제 경과 시간보다 클 수 있음
+    db는 호출한 스레드의 SQL 실행 시간만 (store 등 다른 단계 안에 포함됨)
+    """
+
+    def __init__(self):
+        self.timings = defaultdict(float)
+        self.counters = Counter()
+        self._lock = threading.Lock()
+
+    def add_time(self, stage, seconds):
+        with self._lock:
+            self.timings[stage] += seconds
+
+    def incr(self, name, amount=1):
+        with self._lock:
+            self.counters[name] += amount
+
+    @contextmanager
+    def stage(self, name):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_time(name, time.perf_counter() - started)
+
+    def timed(self, iterable, stage):
+        """iterable에서 다음 값을 꺼내는 데 걸린 시간만 stage에 기록 (스트리밍 파싱 시간 측정용)"""
+        iterator = iter(iterable)
+        while True:
+            started = time.perf_counter()
+            try:
+                value = next(iterator)
+            except StopIteration:
+                return
+            finally:
+                self.add_time(stage, time.perf_counter() - started)
+            yield value
+
+    def db_wrapper(self, execute, sql, params, many, context):
+        """connection.execute_wrapper용 (SQL 실행 시간과 쿼리 수 기록)"""
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.add_time("db", time.perf_counter() - started)
+            self.incr("queries")
+
+    def as_dict(self, elapsed):
+        """SyncRun.metrics에 저장할 형태"""
+        items = self.counters["items"]
+        return {
+            "elapsed": round(elapsed, 3),
+            "rows_per_second": round(items / elapsed, 1) if elapsed else 0.0,
+            "stages": {stage: round(seconds, 3) for stage, seconds in self.timings.items()},
+            "counters": dict(self.counters),
+        }
+
+
+def per_thousand_rows(metrics, stage):
+    """1000행당 단계 시간 (실행마다 행 수가 달라도 비교할 수 있게)"""
+    items = metrics.get("counters", {}).get("items", 0)
+    if not items:
+        return None
+    return metrics.get("stages", {}).get(stage, 0.0) * 1000 / items
+
+
+def find_regressions(latest, previous, threshold):
+    """최근 실행을 이전 실행들의 중앙값과 비교해서 threshold 비율 이상 나빠진 항목 목록
+
+    처리 속도(행/초)는 떨어진 것, 단계 시간은 1000행당 시간이 늘어난 것 → [(항목, 이전 중앙값, 최근 값)]
+    """
+    regressions = []
+    speeds = [metrics["rows_per_second"] for metrics in previous if metrics.get("rows_per_second")]
+    if speeds and latest.get("rows_per_second") is not None:
+        baseline = statistics.median(speeds)
+        if latest["rows_per_second"] < baseline * (1 - threshold):
+            regressions.append(("rows_per_second", baseline, latest["rows_per_second"]))
+
+    for stage in STAGES:
+        values = [value for value in (per_thousand_rows(metrics, stage) for metrics in previous) if value]
+        value = per_thousand_rows(latest, stage)
+        if not values or value is None:
+            continue
+        baseline = statistics.median(values)
+        if value > baseline * (1 + threshold) and value - baseline >= MIN_STAGE_DELTA:
+            regressions.append((stage, baseline, value))
+    return regressions
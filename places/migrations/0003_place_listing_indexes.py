@@ -0,0 +1,53 @@
+# Generated by Django 5.2.18 on 2026-10-17 19:19
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('places', '0002_alter_placetranslation_lang'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='place',
+            index=models.Index(fields=['-favorite_count', '-id'], name='place_pop_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='place',
+            index=models.Index(fields=['-created_at', '-id'], name='place_recent_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='place',
+            index=models.Index(fields=['region_id', '-favorite_count', '-id'], name='place_region_pop_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='place',
+            index=models.Index(fields=['region_id', '-created_at', '-id'], name='place_region_recent_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='place',
+            index=models.Index(fields=['region_code', '-favorite_count', '-id'], name='place_rcode_pop_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='place',
+            index=models.Index(fields=['region_code', '-created_at', '-id'], name='place_rcode_recent_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='place',
+            index=models.Index(fields=['category_id', '-favorite_count', '-id'], name='place_cat_pop_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='place',
+            index=models.Index(fields=['category_id', '-created_at', '-id'], name='place_cat_recent_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='place',
+            index=models.Index(fields=['sub_category_id', '-favorite_count', '-id'], name='place_subcat_pop_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='place',
+            index=models.Index(fields=['sub_category_id', '-created_at', '-id'], name='place_subcat_recent_idx'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-17 19:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('places', '0004_place_location_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='place',
+            name='content_hash',
+            field=models.CharField(blank=True, editable=False, max_length=40, verbose_name='내용 해시'),
+        ),
+        migrations.AddField(
+            model_name='placetranslation',
+            name='content_hash',
+            field=models.CharField(blank=True, editable=False, max_length=40, verbose_name='내용 해시'),
+        ),
+    ]
@@ -0,0 +1,42 @@
+# Generated by Django 5.2.18 on 2026-10-17 19:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('places', '0005_content_hash'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SyncRun',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('full', '전체'), ('delta', '증분'), ('reconcile', '삭제 대조')], max_length=20, verbose_name='종류')),
+                ('status', models.CharField(choices=[('running', '실행 중'), ('success', '성공'), ('failed', '실패')], default='running', max_length=20, verbose_name='상태')),
+                ('scope', models.CharField(blank=True, max_length=50, verbose_name='범위')),
+                ('params', models.JSONField(blank=True, default=dict, verbose_name='조회 조건')),
+                ('high_water_mark', models.DateTimeField(blank=True, null=True, verbose_name='원본 수정 시간 기준점')),
+                ('inserted', models.IntegerField(default=0, verbose_name='추가')),
+                ('updated', models.IntegerField(default=0, verbose_name='변경')),
+                ('unchanged', models.IntegerField(default=0, verbose_name='동일')),
+                ('deleted', models.IntegerField(default=0, verbose_name='삭제')),
+                ('error', models.TextField(blank=True, verbose_name='오류')),
+                ('started_at', models.DateTimeField(auto_now_add=True, verbose_name='시작일시')),
+                ('finished_at', models.DateTimeField(blank=True, null=True, verbose_name='종료일시')),
+            ],
+            options={
+                'verbose_name': '관광지 동기화 기록',
+                'verbose_name_plural': '관광지 동기화 기록들',
+                'db_table': 'place_sync_run',
+                'ordering': ['-started_at'],
+            },
+        ),
+        migrations.AddField(
+            model_name='place',
+            name='source_modified_at',
+            field=models.DateTimeField(blank=True, null=True, verbose_name='원본 수정 시간'),
+        ),
+    ]
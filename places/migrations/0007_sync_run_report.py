@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-17 19:44
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('places', '0006_sync_run'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='syncrun',
+            name='report',
+            field=models.JSONField(blank=True, default=dict, verbose_name='보고'),
+        ),
+    ]
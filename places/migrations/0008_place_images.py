@@ -0,0 +1,33 @@
+# Generated by Django 5.2.18 on 2026-10-17 19:48
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('places', '0007_sync_run_report'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='place',
+            name='image_fetched_url',
+            field=models.URLField(blank=True, editable=False, max_length=500, verbose_name='처리한 이미지 URL'),
+        ),
+        migrations.AddField(
+            model_name='place',
+            name='image_hash',
+            field=models.CharField(blank=True, editable=False, max_length=64, verbose_name='이미지 해시'),
+        ),
+        migrations.AddField(
+            model_name='place',
+            name='image_url',
+            field=models.URLField(blank=True, max_length=500, verbose_name='이미지 원본 URL'),
+        ),
+        migrations.AddField(
+            model_name='place',
+            name='image_variants',
+            field=models.JSONField(blank=True, default=dict, editable=False, verbose_name='이미지 크기별 경로'),
+        ),
+    ]
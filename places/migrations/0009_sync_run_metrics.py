@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-17 20:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('places', '0008_place_images'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='syncrun',
+            name='metrics',
+            field=models.JSONField(blank=True, default=dict, verbose_name='성능 지표'),
+        ),
+    ]
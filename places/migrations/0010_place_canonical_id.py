@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-17 20:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('places', '0009_sync_run_metrics'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='place',
+            name='canonical_id',
+            field=models.BigIntegerField(blank=True, editable=False, null=True, verbose_name='대표 관광지 ID'),
+        ),
+    ]
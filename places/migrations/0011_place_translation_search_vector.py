@@ -0,0 +1,60 @@
+# Generated by Django 5.2.18 on 2026-10-17 20:14
+
+import django.contrib.postgres.search
+from django.db import migrations
+
+# 언어별 텍스트 검색 설정 (places.search.SEARCH_CONFIGS와 같게 유지)
+CREATE_SEARCH_TRIGGER = """
+CREATE OR REPLACE FUNCTION place_translation_search_vector() RETURNS trigger AS $$
+DECLARE
+    config regconfig := CASE NEW.lang WHEN 'en' THEN 'english'::regconfig ELSE 'simple'::regconfig END;
+BEGIN
+    NEW.search_vector :=
+        setweight(to_tsvector(config, coalesce(NEW.name, '')), 'A') ||
+        setweight(to_tsvector(config, coalesce(NEW.address, '')), 'B') ||
+        setweight(to_tsvector(config, coalesce(NEW.description, '')), 'D');
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER place_translation_search_vector_trigger
+    BEFORE INSERT OR UPDATE ON place_translation
+    FOR EACH ROW EXECUTE FUNCTION place_translation_search_vector();
+
+UPDATE place_translation SET search_vector = NULL;
+
+CREATE INDEX place_tr_search_idx ON place_translation USING gin (search_vector);
+"""
+
+DROP_SEARCH_TRIGGER = """
+DROP INDEX IF EXISTS place_tr_search_idx;
+DROP TRIGGER IF EXISTS place_translation_search_vector_trigger ON place_translation;
+DROP FUNCTION IF EXISTS place_translation_search_vector();
+"""
+
+
+# 트리거/GIN 인덱스는 PostgreSQL에서만 (다른 DB에서는 places.search가 LIKE 검색으로 대신함)
+def create_search_trigger(apps, schema_editor):
+    if schema_editor.connection.vendor == "postgresql":
+        schema_editor.execute(CREATE_SEARCH_TRIGGER)
+
+
+def drop_search_trigger(apps, schema_editor):
+    if schema_editor.connection.vendor == "postgresql":
+        schema_editor.execute(DROP_SEARCH_TRIGGER)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('places', '0010_place_canonical_id'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='placetranslation',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True, verbose_name='검색 벡터'),
+        ),
+        migrations.RunPython(create_search_trigger, drop_search_trigger),
+    ]
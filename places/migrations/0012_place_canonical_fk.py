@@ -0,0 +1,40 @@
+# Generated by Django 5.2.18 on 2026-10-17 22:40
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def unlink_deleted_canonicals(apps, schema_editor):
+    """이미 삭제된 대표에 연결된 관광지는 대표 관광지로 되돌리고 변경 기록 (외래 키 제약 전에)"""
+    Place = apps.get_model("places", "Place")
+    CatalogChange = apps.get_model("outbox", "CatalogChange")
+    orphans = Place.objects.exclude(canonical=None).exclude(canonical__in=Place.objects.values("id"))
+    place_ids = list(orphans.values_list("id", flat=True))
+    orphans.update(canonical=None)
+    CatalogChange.objects.bulk_create(
+        [CatalogChange(entity="place", entity_id=place_id, action="upsert") for place_id in place_ids],
+        batch_size=500
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('outbox', '0001_initial'),
+        ('places', '0011_place_translation_search_vector'),
+    ]
+
+    # canonical_id 컬럼은 그대로 두고 외래 키로 변경 (이름만 바꾼 뒤 컬럼을 다시 canonical_id로)
+    operations = [
+        migrations.RenameField(
+            model_name='place',
+            old_name='canonical_id',
+            new_name='canonical',
+        ),
+        migrations.RunPython(unlink_deleted_canonicals, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='place',
+            name='canonical',
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='duplicates', to='places.place', verbose_name='대표 관광지'),
+        ),
+    ]
@@ -1,4 +1,12 @@
+import math
+
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
+from django.db.models.functions import Cast
+from django.utils import timezone
+from helper.geo_helper import bounding_box, nearest
+from helper.translation_helper import TranslatableMixin, TranslationQuerySet
+from outbox.changes import AtomicSaveMixin
 
 # 언어 선택지 정의
 LANGUAGE_CHOICES = [
@@ -8,8 +16,40 @@ LANGUAGE_CHOICES = [
     ("cn", "中文"),
 ]
 
+# 주변 검색에서 DB가 근사 거리순으로 자르는 후보 수 (limit의 배수 - 근사 오차로 순서가 바뀌는 경계 후보까지 포함)
+NEAREST_CANDIDATE_FACTOR = 4
+
+
+class PlaceQuerySet(TranslationQuerySet):
+
+    def canonical(self):
+        """중복으로 연결된 관광지를 뺀 대표 관광지만 (목록/검색 API용)"""
+        return self.filter(canonical_id__isnull=True)
+
+    def in_bounding_box(self, lat, lng, radius):
+        """반경 radius(미터) 원을 감싸는 사각형 안의 관광지 (위도/경도 인덱스 범위 조회)"""
+        min_lat, max_lat, min_lng, max_lng = bounding_box(lat, lng, radius)
+        return self.filter(
+            latitude__range=(min_lat, max_lat),
+            longitude__range=(min_lng, max_lng)
+        )
 
-class Place(models.Model):
+    def nearest_ids(self, lat, lng, radius, limit):
+        """반경 안의 관광지를 가까운 순으로 [(id, 거리)] 반환 - 좌표만 읽고 거리는 haversine으로 계산
+
+        bounding box 안에서 DB가 근사 거리순으로 limit의 NEAREST_CANDIDATE_FACTOR배만 읽음 (반경 안 관광지 수와 무관)
+        근사 거리는 위도/경도 차이의 제곱합 (경도 차이는 중심 위도의 cos으로 보정, 반경 20km 안에서 오차 1% 미만)
+        """
+        cos_lat = math.cos(math.radians(float(lat)))
+        delta_lat = Cast("latitude", models.FloatField()) - float(lat)
+        delta_lng = (Cast("longitude", models.FloatField()) - float(lng)) * cos_lat
+        candidates = self.in_bounding_box(lat, lng, radius).annotate(
+            approx_distance=delta_lat * delta_lat + delta_lng * delta_lng
+        ).order_by("approx_distance").values_list("id", "latitude", "longitude")[:limit * NEAREST_CANDIDATE_FACTOR]
+        return nearest(candidates, lat, lng, radius, limit)
+
+
+class Place(TranslatableMixin, AtomicSaveMixin, models.Model):
     content_id = models.CharField(
         max_length=50,
         unique=True,
@@ -76,12 +116,67 @@ class Place(models.Model):
         verbose_name="즐겨찾기 수"
     )
 
+    # 같은 관광지가 다른 content_id로 중복 등록된 경우 대표 관광지 (대표 관광지와 중복 없는 관광지는 null)
+    # 대표가 삭제되면 null로 돌아가서 다시 목록/검색에 나옴 (다음 중복 정리 때 새 대표에 연결)
+    canonical = models.ForeignKey(
+        "self",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        editable=False,
+        related_name="duplicates",
+        verbose_name="대표 관광지"
+    )
+
     last_synced_at = models.DateTimeField(
         null=True,
         blank=True,
         verbose_name="마지막 동기화 시간"
     )
 
+    # TourAPI 원본 수정 시간 (modifiedtime)
+    source_modified_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        verbose_name="원본 수정 시간"
+    )
+
+    # TourAPI 대표 이미지 (firstimage) 원본 URL
+    image_url = models.URLField(
+        max_length=500,
+        blank=True,
+        verbose_name="이미지 원본 URL"
+    )
+    # 이미지 처리를 마친 원본 URL (image_url과 다르면 다음 이미지 처리 때 다시 받음)
+    image_fetched_url = models.URLField(
+        max_length=500,
+        blank=True,
+        editable=False,
+        verbose_name="처리한 이미지 URL"
+    )
+    # 이미지 내용 해시 (같은 이미지는 파일 하나만 저장)
+    image_hash = models.CharField(
+        max_length=64,
+        blank=True,
+        editable=False,
+        verbose_name="이미지 해시"
+    )
+    # MEDIA_ROOT 기준 원본/썸네일 경로 {"original": ..., "small": ..., ...}
+    image_variants = models.JSONField(
+        default=dict,
+        blank=True,
+        editable=False,
+        verbose_name="이미지 크기별 경로"
+    )
+
+    # 동기화 시 바뀐 행만 갱신하기 위한 원본 데이터 해시
+    content_hash = models.CharField(
+        max_length=40,
+        blank=True,
+        editable=False,
+        verbose_name="내용 해시"
+    )
+
     created_at = models.DateTimeField(
         auto_now_add=True,
         verbose_name="생성일시"
@@ -91,11 +186,28 @@ class Place(models.Model):
         verbose_name="수정일시"
     )
 
+    objects = PlaceQuerySet.as_manager()
+
     class Meta:
         db_table = "place"
         verbose_name = "관광지"
         verbose_name_plural = "관광지들"
         ordering = ["-created_at"]
+        # 목록 API의 필터 + 정렬(인기순/최신순) 키셋 페이지네이션용 복합 인덱스
+        indexes = [
+            models.Index(fields=["-favorite_count", "-id"], name="place_pop_idx"),
+            models.Index(fields=["-created_at", "-id"], name="place_recent_idx"),
+            models.Index(fields=["region_id", "-favorite_count", "-id"], name="place_region_pop_idx"),
+            models.Index(fields=["region_id", "-created_at", "-id"], name="place_region_recent_idx"),
+            models.Index(fields=["region_code", "-favorite_count", "-id"], name="place_rcode_pop_idx"),
+            models.Index(fields=["region_code", "-created_at", "-id"], name="place_rcode_recent_idx"),
+            models.Index(fields=["category_id", "-favorite_count", "-id"], name="place_cat_pop_idx"),
+            models.Index(fields=["category_id", "-created_at", "-id"], name="place_cat_recent_idx"),
+            models.Index(fields=["sub_category_id", "-favorite_count", "-id"], name="place_subcat_pop_idx"),
+            models.Index(fields=["sub_category_id", "-created_at", "-id"], name="place_subcat_recent_idx"),
+            # 주변 검색 bounding box 조회용 (PostgreSQL에서는 id 포함 index-only scan)
+            models.Index(fields=["latitude", "longitude"], include=["id"], name="place_lat_lng_idx"),
+        ]
 
     def __str__(self):
         # 한국어 이름이 있으면 한국어, 없으면 기존 방식
@@ -113,28 +225,16 @@ class Place(models.Model):
 
     # 다국어 지원 메서드들 추가
     def get_name(self, lang="ko"):
-        try:
-            translation = self.translations.get(lang=lang)
-            return translation.name
-        except PlaceTranslation.DoesNotExist:
-            return ""
+        return self.get_translated_field("name", lang, "")
 
     def get_description(self, lang="ko"):
-        try:
-            translation = self.translations.get(lang=lang)
-            return translation.description
-        except PlaceTranslation.DoesNotExist:
-            return ""
+        return self.get_translated_field("description", lang, "")
 
     def get_address(self, lang="ko"):
-        try:
-            translation = self.translations.get(lang=lang)
-            return translation.address
-        except PlaceTranslation.DoesNotExist:
-            return ""
+        return self.get_translated_field("address", lang, "")
 
 
-class PlaceTranslation(models.Model):
+class PlaceTranslation(AtomicSaveMixin, models.Model):
     place = models.ForeignKey(
         Place,
         on_delete=models.CASCADE,
@@ -160,6 +260,20 @@ class PlaceTranslation(models.Model):
         verbose_name="주소"
     )
 
+    content_hash = models.CharField(
+        max_length=40,
+        blank=True,
+        editable=False,
+        verbose_name="내용 해시"
+    )
+
+    # 검색용 tsvector (이름 A > 주소 B > 설명 D 가중치, PostgreSQL 트리거가 저장할 때마다 채움)
+    search_vector = SearchVectorField(
+        null=True,
+        editable=False,
+        verbose_name="검색 벡터"
+    )
+
     created_at = models.DateTimeField(
         auto_now_add=True,
         verbose_name="생성일시"
@@ -179,3 +293,140 @@ class PlaceTranslation(models.Model):
 
     def __str__(self):
         return f"{self.name} ({self.lang})"
+
+
+class SyncRunQuerySet(models.QuerySet):
+
+    def latest_high_water_mark(self, scope=""):
+        """같은 범위의 성공한 전체/증분 동기화 중 가장 최근 원본 수정 시간 (다음 증분 동기화 시작점)"""
+        run = self.filter(
+            scope=scope,
+            status=SyncRun.STATUS_SUCCESS,
+            kind__in=[SyncRun.KIND_FULL, SyncRun.KIND_DELTA],
+            high_water_mark__isnull=False
+        ).order_by("-high_water_mark").first()
+        return run.high_water_mark if run else None
+
+
+# TourAPI 관광지 동기화 실행 기록 (운영자가 동기화 지연 확인용)
+class SyncRun(models.Model):
+    KIND_FULL = "full"
+    KIND_DELTA = "delta"
+    KIND_RECONCILE = "reconcile"
+    KIND_CHOICES = [
+        (KIND_FULL, "전체"),
+        (KIND_DELTA, "증분"),
+        (KIND_RECONCILE, "삭제 대조"),
+    ]
+
+    STATUS_RUNNING = "running"
+    STATUS_SUCCESS = "success"
+    STATUS_FAILED = "failed"
+    STATUS_CHOICES = [
+        (STATUS_RUNNING, "실행 중"),
+        (STATUS_SUCCESS, "성공"),
+        (STATUS_FAILED, "실패"),
+    ]
+
+    kind = models.CharField(
+        max_length=20,
+        choices=KIND_CHOICES,
+        verbose_name="종류"
+    )
+    status = models.CharField(
+        max_length=20,
+        choices=STATUS_CHOICES,
+        default=STATUS_RUNNING,
+        verbose_name="상태"
+    )
+    # 동기화 범위 (지역 코드 / 관광 타입, 범위별로 기준점을 따로 관리)
+    scope = models.CharField(
+        max_length=50,
+        blank=True,
+        verbose_name="범위"
+    )
+    params = models.JSONField(
+        default=dict,
+        blank=True,
+        verbose_name="조회 조건"
+    )
+
+    # 이번 실행에서 본 가장 최근 TourAPI 수정 시간
+    high_water_mark = models.DateTimeField(
+        null=True,
+        blank=True,
+        verbose_name="원본 수정 시간 기준점"
+    )
+
+    inserted = models.IntegerField(default=0, verbose_name="추가")
+    updated = models.IntegerField(default=0, verbose_name="변경")
+    unchanged = models.IntegerField(default=0, verbose_name="동일")
+    deleted = models.IntegerField(default=0, verbose_name="삭제")
+
+    error = models.TextField(
+        blank=True,
+        verbose_name="오류"
+    )
+    # 실패는 아니지만 확인이 필요한 항목 (예: 매핑이 없는 TourAPI 분류 코드)
+    report = models.JSONField(
+        default=dict,
+        blank=True,
+        verbose_name="보고"
+    )
+    # 단계별 시간/요청 수/처리 속도 {"elapsed", "rows_per_second", "stages": {...}, "counters": {...}}
+    metrics = models.JSONField(
+        default=dict,
+        blank=True,
+        verbose_name="성능 지표"
+    )
+
+    started_at = models.DateTimeField(
+        auto_now_add=True,
+        verbose_name="시작일시"
+    )
+    finished_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        verbose_name="종료일시"
+    )
+
+    objects = SyncRunQuerySet.as_manager()
+
+    class Meta:
+        db_table = "place_sync_run"
+        verbose_name = "관광지 동기화 기록"
+        verbose_name_plural = "관광지 동기화 기록들"
+        ordering = ["-started_at"]
+
+    def __str__(self):
+        return f"{self.get_kind_display()} 동기화 {self.started_at:%Y-%m-%d %H:%M} ({self.get_status_display()})"
+
+    @property
+    def lag(self):
+        """원본 수정 시간 기준점이 현재보다 얼마나 뒤처졌는지"""
+        if self.high_water_mark is None:
+            return None
+        return timezone.now() - self.high_water_mark
+
+    def finish(self, stats=None, deleted=0, high_water_mark=None, report=None, metrics=None):
+        if stats is not None:
+            self.inserted = stats.inserted
+            self.updated = stats.updated
+            self.unchanged = stats.unchanged
+        self.deleted = deleted
+        self.high_water_mark = high_water_mark
+        if report:
+            self.report = report
+        if metrics:
+            self.metrics = metrics
+        self.status = self.STATUS_SUCCESS
+        self.finished_at = timezone.now()
+        self.save()
+
+    def fail(self, error, metrics=None):
+        self.error = str(error)
+        if metrics:
+            self.metrics = metrics
+        self.status = self.STATUS_FAILED
+        self.finished_at = timezone.now()
+        self.save()
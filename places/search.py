@@ -0,0 +1,81 @@
+import math
+import re
+
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.db import connection
+from django.db.models import F, FloatField, Q
+from django.db.models.functions import Cast, Ln
+from places.models import PlaceTranslation
+
+# 언어별 텍스트 검색 설정 (한국어/일본어/중국어는 형태소 분석 없이 그대로)
+# 트리거(places/migrations/0011)와 같아야 인덱스의 단어와 검색어가 맞음
+SEARCH_CONFIGS = {
+    "ko": "simple",
+    "en": "english",
+    "jp": "simple",
+    "cn": "simple",
+}
+
+# ts_rank 기본 가중치 (D, C, B, A) - 이름 A, 주소 B, 설명 D
+FIELD_WEIGHTS = {"name": 1.0, "address": 0.4, "description": 0.1}
+
+# 즐겨찾기 수 반영 비율 (관련도 × (1 + POPULARITY_WEIGHT × ln(1 + 즐겨찾기 수)))
+POPULARITY_WEIGHT = 0.1
+
+# 검색어 최대 단어 수
+MAX_TERMS = 8
+
+WORD = re.compile(r"\w+")
+
+
+def search_terms(query):
+    """검색어를 단어 목록으로 (tsquery 특수 문자는 버림)"""
+    return WORD.findall(query.lower())[:MAX_TERMS]
+
+
+def popularity_boost(favorite_count):
+    return 1 + POPULARITY_WEIGHT * math.log1p(favorite_count)
+
+
+def search_places(query, lang="ko", limit=20):
+    """검색어의 모든 단어(앞부분 일치)가 들어간 대표 관광지를 [(place_id, 점수)]로 점수 높은 순 반환
+
+    PostgreSQL은 번역 행의 tsvector GIN 인덱스로 찾고 ts_rank에 즐겨찾기 수를 곱해서 정렬
+    다른 DB(테스트용 SQLite 등)는 같은 가중치로 LIKE 검색 후 파이썬에서 점수 계산
+    """
+    terms = search_terms(query)
+    if not terms:
+        return []
+    translations = PlaceTranslation.objects.filter(lang=lang, place__canonical_id__isnull=True).order_by()
+    if connection.vendor == "postgresql":
+        return _search_postgresql(translations, terms, lang, limit)
+    return _search_fallback(translations, terms, limit)
+
+
+def _search_postgresql(translations, terms, lang, limit):
+    # 단어마다 앞부분 일치 ('경복':* & '궁':*) - 한국어는 조사가 붙은 단어도 찾게
+    raw_query = " & ".join(f"'{term}':*" for term in terms)
+    search_query = SearchQuery(raw_query, config=SEARCH_CONFIGS[lang], search_type="raw")
+    popularity = 1 + POPULARITY_WEIGHT * Ln(Cast(F("place__favorite_count"), FloatField()) + 1)
+    rows = translations.filter(search_vector=search_query).annotate(
+        score=SearchRank(F("search_vector"), search_query) * popularity
+    ).order_by("-score", "place_id").values_list("place_id", "score")[:limit]
+    return list(rows)
+
+
+def _search_fallback(translations, terms, limit):
+    condition = Q()
+    for term in terms:
+        condition &= Q(name__icontains=term) | Q(address__icontains=term) | Q(description__icontains=term)
+
+    results = []
+    for place_id, favorite_count, *values in translations.filter(condition).values_list(
+        "place_id", "place__favorite_count", *FIELD_WEIGHTS
+    ):
+        fields = dict(zip(FIELD_WEIGHTS, (value.lower() for value in values)))
+        relevance = sum(
+            max(weight for field, weight in FIELD_WEIGHTS.items() if term in fields[field]) for term in terms
+        ) / len(terms)
+        results.append((place_id, relevance * popularity_boost(favorite_count)))
+    results.sort(key=lambda result: (-result[1], result[0]))
+    return results[:limit]
@@ -0,0 +1,91 @@
+from rest_framework import serializers
+from places.images import media_url
+from places.models import Place
+
+# 목록에서 보여줄 썸네일 크기
+LIST_THUMBNAIL_SIZE = "small"
+
+
+class PlaceListSerializer(serializers.ModelSerializer):
+    name = serializers.SerializerMethodField()
+    address = serializers.SerializerMethodField()
+    thumbnail = serializers.SerializerMethodField()
+
+    class Meta:
+        model = Place
+        fields = [
+            "id",
+            "content_id",
+            "name",
+            "address",
+            "category_id",
+            "sub_category_id",
+            "region_id",
+            "region_code",
+            "latitude",
+            "longitude",
+            "favorite_count",
+            "thumbnail"
+        ]
+
+    # with_translation()으로 JOIN 된 값이 있으면 그대로 사용
+    def get_name(self, obj):
+        if hasattr(obj, "translated_name"):
+            return obj.translated_name or ""
+        return obj.get_name(self.context.get("lang", "ko"))
+
+    def get_address(self, obj):
+        if hasattr(obj, "translated_address"):
+            return obj.translated_address or ""
+        return obj.get_address(self.context.get("lang", "ko"))
+
+    # 이미지 처리 단계에서 미리 만든 썸네일 (없으면 null)
+    def get_thumbnail(self, obj):
+        return media_url(obj.image_variants.get(LIST_THUMBNAIL_SIZE))
+
+
+class PlaceDetailSerializer(PlaceListSerializer):
+    description = serializers.SerializerMethodField()
+    images = serializers.SerializerMethodField()
+
+    class Meta(PlaceListSerializer.Meta):
+        fields = PlaceListSerializer.Meta.fields + [
+            "description",
+            "images",
+            "phone_number",
+            "use_time",
+            "link_url",
+            "canonical_id",
+            "created_at",
+            "updated_at"
+        ]
+
+    def get_description(self, obj):
+        if hasattr(obj, "translated_description"):
+            return obj.translated_description or ""
+        return obj.get_description(self.context.get("lang", "ko"))
+
+    def get_images(self, obj):
+        return {name: media_url(path) for name, path in obj.image_variants.items()}
+
+
+class PlaceNearbySerializer(PlaceListSerializer):
+    # 중심 좌표로부터의 거리 (미터)
+    distance = serializers.SerializerMethodField()
+
+    class Meta(PlaceListSerializer.Meta):
+        fields = PlaceListSerializer.Meta.fields + ["distance"]
+
+    def get_distance(self, obj):
+        return round(obj.distance, 1)
+
+
+class PlaceSearchSerializer(PlaceListSerializer):
+    # 검색 관련도 × 인기도 점수
+    score = serializers.SerializerMethodField()
+
+    class Meta(PlaceListSerializer.Meta):
+        fields = PlaceListSerializer.Meta.fields + ["score"]
+
+    def get_score(self, obj):
+        return round(obj.score, 4)
@@ -0,0 +1,15 @@
+from django.db.models.signals import pre_delete
+from django.dispatch import receiver
+from outbox.changes import record, track
+from outbox.models import CatalogChange
+from places.models import Place, PlaceTranslation
+
+# 변경 기록 (번역은 부모 관광지의 변경으로, 동기화의 일괄 저장은 upsert/sync에서 직접 기록)
+track(Place, CatalogChange.ENTITY_PLACE)
+track(PlaceTranslation, CatalogChange.ENTITY_PLACE, parent_field="place")
+
+
+# 대표 관광지를 지우면 연결된 중복은 SET_NULL로 다시 대표가 됨 (UPDATE라 signal이 없어서 직접 기록)
+@receiver(pre_delete, sender=Place)
+def record_unlinked_duplicates(sender, instance, **kwargs):
+    record(CatalogChange.ENTITY_PLACE, instance.duplicates.values_list("id", flat=True))
@@ -0,0 +1,456 @@
+import json
+import math
+import os
+import time
+from collections import defaultdict, deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import datetime
+from decimal import Decimal, InvalidOperation
+from zoneinfo import ZoneInfo
+
+from categories.code_mapping import CategoryCodeMapper
+from django.conf import settings
+from django.db import connection
+from outbox.changes import collect
+from places.metrics import SyncMetrics
+from places.models import Place, PlaceTranslation
+from places.upsert import UpsertStats, upsert_place_rows, upsert_translations
+from regions.locator import subregion_locator
+
+# 지역 기반 관광정보 목록 API
+AREA_BASED_LIST = "areaBasedList1"
+# 지역 기반 동기화 목록 API (modifiedtime 이후 변경분 + 비공개 전환 여부 showflag)
+AREA_BASED_SYNC_LIST = "areaBasedSyncList1"
+
+# 관광지 기본 정보(좌표, 전화번호 등)를 가져오는 언어 (나머지 언어는 번역만)
+BASE_LANG = "ko"
+
+# TourAPI 시간은 한국 시간 기준
+TOUR_API_TIMEZONE = ZoneInfo("Asia/Seoul")
+
+# 삭제 대조 시 이 비율보다 많이 지워야 하면 API 이상으로 보고 중단
+RECONCILE_MAX_DELETE_RATIO = 0.1
+
+# 한 번에 삭제할 관광지 수
+DELETE_BATCH_SIZE = 500
+
+# 한 페이지를 나눠서 저장하는 아이템 수 (페이지 크기와 상관없이 메모리 사용량 유지)
+STORE_BATCH_SIZE = 500
+
+
+class SyncError(Exception):
+    """일부 페이지를 가져오지 못함 (체크포인트는 남아 있어서 다시 실행하면 이어받기)"""
+
+    def __init__(self, failed_pages):
+        first_error = failed_pages[min(failed_pages)]
+        super().__init__(f"{len(failed_pages)}개 페이지 동기화 실패: {sorted(failed_pages)} (오류: {first_error})")
+        self.failed_pages = failed_pages
+
+
+class Checkpoint:
+    """언어별로 완료한 페이지 번호를 파일에 기록 (같은 조회 조건으로 다시 실행하면 남은 페이지만 가져오기)"""
+
+    def __init__(self, path, params):
+        self.path = path
+        self.params = params
+        # {언어: 전체 개수}, {언어: 완료한 페이지 번호 집합}
+        self.total_counts = {}
+        self.completed_pages = defaultdict(set)
+
+        if path and os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                saved = json.load(f)
+            # 조회 조건이 바뀌었으면 처음부터
+            if saved.get("params") == params:
+                self.total_counts = saved.get("total_counts", {})
+                for lang, pages in saved.get("completed_pages", {}).items():
+                    self.completed_pages[lang] = set(pages)
+
+    def save(self):
+        if not self.path:
+            return
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        # 쓰는 도중 중단돼도 파일이 깨지지 않게 임시 파일에 쓰고 교체
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump({
+                "params": self.params,
+                "total_counts": self.total_counts,
+                "completed_pages": {lang: sorted(pages) for lang, pages in self.completed_pages.items()},
+            }, f)
+        os.replace(temp_path, self.path)
+
+    def mark(self, lang, page_no):
+        self.completed_pages[lang].add(page_no)
+        self.save()
+
+    def clear(self):
+        if self.path and os.path.exists(self.path):
+            os.remove(self.path)
+
+
+def to_coordinate(value):
+    """TourAPI 좌표 문자열 → Decimal (없거나 0이면 None)"""
+    try:
+        coordinate = Decimal(str(value)).quantize(Decimal("0.00000001"))
+    except (InvalidOperation, TypeError, ValueError):
+        return None
+    return coordinate or None
+
+
+def parse_modified_time(value):
+    """TourAPI 수정 시간 (YYYYMMDDHHMMSS, 한국 시간) → aware datetime (형식이 다르면 None)"""
+    try:
+        return datetime.strptime(str(value), "%Y%m%d%H%M%S").replace(tzinfo=TOUR_API_TIMEZONE)
+    except (TypeError, ValueError):
+        return None
+
+
+def delta_params(params, since):
+    """since 이후 변경분만 조회하는 조건 (TourAPI는 날짜 단위라 그날 전체를 다시 받고, 해시로 걸러짐)"""
+    return {**params, "modifiedtime": since.astimezone(TOUR_API_TIMEZONE).strftime("%Y%m%d")}
+
+
+def batched(items, size):
+    """아이템을 size개씩 리스트로 묶어서 반환 (이터레이터도 끝까지 한꺼번에 읽지 않음)"""
+    batch = []
+    for item in items:
+        batch.append(item)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def parse_place_item(item):
+    """TourAPI 목록 아이템 → (content_id, Place 필드, 번역 필드)"""
+    address = " ".join(part for part in [item.get("addr1", ""), item.get("addr2", "")] if part).strip()
+    place_fields = {
+        "latitude": to_coordinate(item.get("mapy")),
+        "longitude": to_coordinate(item.get("mapx")),
+        "phone_number": (item.get("tel") or "")[:20],
+        "region_code": str(item.get("areacode") or ""),
+        "source_modified_at": parse_modified_time(item.get("modifiedtime")),
+        "image_url": (item.get("firstimage") or "")[:500],
+    }
+    translation_fields = {
+        "name": (item.get("title") or "")[:200],
+        "address": address[:500],
+    }
+    return str(item["contentid"]), place_fields, translation_fields
+
+
+def save_place_items(items, lang=BASE_LANG, extra_translations=None, category_mapper=None, metrics=None):
+    """한 페이지의 아이템을 관광지/번역으로 일괄 저장하고 (UpsertStats, {content_id: place_id}) 반환
+
+    extra_translations({content_id: {언어: 번역 필드}})는 이 페이지 번역과 같은 INSERT 한 번으로 저장
+    category_mapper에 매핑이 있으면 TourAPI 분류 코드로 카테고리도 채움 (매핑이 없는 코드는 비움)
+    매핑 테이블이 비어 있으면 카테고리는 건드리지 않음
+    metrics(SyncMetrics)를 주면 카테고리 매핑/지역 찾기/저장 단계 시간 기록
+    """
+    metrics = metrics or SyncMetrics()
+    items = [item for item in items if item.get("contentid")]
+    parsed = [parse_place_item(item) for item in items]
+    if category_mapper:
+        with metrics.stage("categories"):
+            for item, (_, place_fields, _) in zip(items, parsed):
+                place_fields["category_id"], place_fields["sub_category_id"] = category_mapper.resolve(item)
+    # 좌표 → 지역 ID는 메모리 인덱스로 한 번에 (아이템마다 DB 조회 안 함)
+    with metrics.stage("locate"):
+        located = subregion_locator.locate_many(
+            (place_fields["latitude"], place_fields["longitude"]) for _, place_fields, _ in parsed
+        )
+    for (_, place_fields, _), region in zip(parsed, located):
+        place_fields["region_id"] = region["region_id"] if region is not None else None
+
+    with metrics.stage("store"), collect():
+        stats, place_ids = upsert_place_rows([(content_id, place_fields) for content_id, place_fields, _ in parsed])
+        translations = {
+            (place_ids[content_id], lang): translation_fields
+            for content_id, _, translation_fields in parsed
+        }
+        for content_id, by_lang in (extra_translations or {}).items():
+            if content_id in place_ids:
+                for other_lang, translation_fields in by_lang.items():
+                    translations[(place_ids[content_id], other_lang)] = translation_fields
+        stats.translations_written = upsert_translations(translations)
+    return stats, place_ids
+
+
+class PlaceSyncer:
+    """여러 언어의 TourAPI 목록을 한 스레드 풀에서 동시에 페이지 단위로 조회해서, 받는 대로 DB에 저장
+
+    기본 언어(ko) 페이지는 관광지를 만들고, 다른 언어 아이템은 content_id로 관광지와 이어서 번역만 저장
+    관광지가 아직 없는 번역은 해당 관광지 페이지가 저장될 때 같은 INSERT로 저장
+    응답은 임시 파일로 받아두고 batch_size개씩 파싱해서 저장 (페이지가 커도 메모리에 다 올리지 않음)
+    DB 저장은 호출한 스레드에서만 하고, 완료한 페이지는 체크포인트에 기록
+    단계별 시간과 요청/행 수는 metrics에 기록 (sync_report로 실행끼리 비교)
+    """
+
+    def __init__(self, client, operation=AREA_BASED_LIST, params=None, num_of_rows=100, workers=4,
+                 checkpoint_path=None, langs=(BASE_LANG,), category_mapper=None, batch_size=STORE_BATCH_SIZE,
+                 log=None):
+        self.client = client
+        self.operation = operation
+        self.params = params or {}
+        self.num_of_rows = num_of_rows
+        self.batch_size = batch_size
+        self.workers = workers
+        self.langs = list(langs)
+        self.log = log or (lambda message: None)
+        self.checkpoint = Checkpoint(
+            checkpoint_path,
+            {"operation": operation, "params": self.params, "num_of_rows": num_of_rows, "langs": self.langs}
+        )
+        # 없으면 run() 시작 때 매핑 테이블에서 한 번 빌드
+        self.category_mapper = category_mapper
+        self.stats = UpsertStats()
+        self.deleted = 0
+        # 관광지가 없어서 저장하지 못한 번역 수
+        self.unmatched = 0
+        # 이번 실행에서 본 가장 최근 원본 수정 시간
+        self.high_water_mark = None
+        self.metrics = SyncMetrics()
+        # run()에 걸린 시간 (초)
+        self.elapsed = 0.0
+
+        # 관광지를 기다리는 번역 {content_id: {언어: (번역 필드, 페이지 번호)}}
+        self._waiting = defaultdict(dict)
+        # 번역이 아직 저장되지 않은 페이지 {(언어, 페이지 번호): 남은 아이템 수}
+        self._unresolved_pages = {}
+        self._place_ids = {}
+
+    def operation_path(self, lang):
+        return f"{settings.TOUR_API_SERVICES[lang]}/{self.operation}"
+
+    def fetch_page(self, lang, page_no):
+        with self.metrics.stage("fetch"):
+            return self.client.stream_page(self.operation_path(lang), page_no, self.num_of_rows, **self.params)
+
+    def _track_high_water_mark(self, items):
+        for item in items:
+            modified_at = parse_modified_time(item.get("modifiedtime"))
+            if modified_at and (self.high_water_mark is None or modified_at > self.high_water_mark):
+                self.high_water_mark = modified_at
+
+    def store_page(self, lang, page_no, items):
+        """한 페이지를 batch_size개씩 저장하고 저장한 아이템 수 반환 (items는 리스트나 PageStream)"""
+        if lang != BASE_LANG:
+            # 마지막 배치를 저장하기 전에 페이지가 완료로 기록되지 않게 하나 더 잡아둠
+            self._unresolved_pages[(lang, page_no)] = 1
+        count = 0
+        for batch in batched(self.metrics.timed(items, "parse"), self.batch_size):
+            self.store_batch(lang, page_no, batch)
+            count += len(batch)
+        self.metrics.incr("pages")
+        self.metrics.incr("items", count)
+
+        if lang == BASE_LANG:
+            self.checkpoint.mark(lang, page_no)
+        else:
+            self._release(lang, page_no)
+        return count
+
+    def store_batch(self, lang, page_no, items):
+        # 동기화 목록 API에서 showflag가 0이면 비공개 전환
+        hidden = {str(item["contentid"]) for item in items if str(item.get("showflag", "1")) == "0"}
+        visible = [item for item in items if item.get("contentid") and str(item["contentid"]) not in hidden]
+        self._track_high_water_mark(items)
+
+        if lang == BASE_LANG:
+            self._store_base_page(lang, page_no, visible)
+            if hidden:
+                self.deleted += delete_places(hidden)
+        else:
+            self._store_translation_page(lang, page_no, visible)
+            if hidden:
+                with collect():
+                    PlaceTranslation.objects.filter(place__content_id__in=hidden, lang=lang).delete()
+
+    def _store_base_page(self, lang, page_no, items):
+        content_ids = [str(item["contentid"]) for item in items]
+        waiting = {content_id: self._waiting[content_id] for content_id in content_ids if content_id in self._waiting}
+
+        stats, place_ids = save_place_items(
+            items,
+            lang,
+            extra_translations={
+                content_id: {other_lang: fields for other_lang, (fields, _) in by_lang.items()}
+                for content_id, by_lang in waiting.items()
+            },
+            category_mapper=self.category_mapper,
+            metrics=self.metrics
+        )
+        self.stats.merge(stats)
+        self._place_ids.update(place_ids)
+        self._resolve(waiting)
+
+    def _store_translation_page(self, lang, page_no, items):
+        content_ids = []
+        for item in items:
+            content_id, _, translation_fields = parse_place_item(item)
+            self._waiting[content_id][lang] = (translation_fields, page_no)
+            content_ids.append(content_id)
+
+        self._unresolved_pages[(lang, page_no)] += len(content_ids)
+        if not content_ids:
+            return
+
+        # 이미 저장된 관광지면 바로 저장 (이번 실행에서 모르는 것만 DB 조회)
+        unknown = [content_id for content_id in content_ids if content_id not in self._place_ids]
+        if unknown:
+            self._place_ids.update(
+                Place.objects.filter(content_id__in=unknown).order_by().values_list("content_id", "id")
+            )
+        ready = {
+            content_id: self._waiting[content_id]
+            for content_id in content_ids if content_id in self._place_ids
+        }
+        if ready:
+            with self.metrics.stage("store"), collect():
+                self.stats.translations_written += upsert_translations({
+                    (self._place_ids[content_id], other_lang): fields
+                    for content_id, by_lang in ready.items()
+                    for other_lang, (fields, _) in by_lang.items()
+                })
+            self._resolve(ready)
+
+    def _resolve(self, translations):
+        """저장(또는 포기)한 번역을 대기 목록에서 빼고, 모든 아이템이 처리된 페이지는 완료로 기록"""
+        for content_id, by_lang in translations.items():
+            for lang, (_, page_no) in by_lang.items():
+                if (lang, page_no) in self._unresolved_pages:
+                    self._release(lang, page_no)
+            self._waiting.pop(content_id, None)
+
+    def _release(self, lang, page_no):
+        key = (lang, page_no)
+        self._unresolved_pages[key] -= 1
+        if self._unresolved_pages[key] == 0:
+            del self._unresolved_pages[key]
+            self.checkpoint.mark(lang, page_no)
+
+    def _pages_for(self, lang):
+        total_pages = max(1, math.ceil(self.checkpoint.total_counts[lang] / self.num_of_rows))
+        return [page for page in range(1, total_pages + 1) if page not in self.checkpoint.completed_pages[lang]]
+
+    def run(self):
+        """전체 페이지 동기화 후 UpsertStats 반환 (실패한 페이지가 있으면 SyncError)"""
+        started = time.monotonic()
+        # 요청/재시도/바이트 수를 이번 실행 metrics에 기록
+        self.client.metrics = self.metrics
+        try:
+            with connection.execute_wrapper(self.metrics.db_wrapper):
+                return self._run()
+        finally:
+            self.elapsed = time.monotonic() - started
+
+    def _run(self):
+        if self.category_mapper is None:
+            self.category_mapper = CategoryCodeMapper.load()
+        checkpoint = self.checkpoint
+        queue = deque()
+        for lang in self.langs:
+            if lang in checkpoint.total_counts:
+                queue.extend((lang, page_no) for page_no in self._pages_for(lang))
+            else:
+                # 첫 페이지로 전체 개수를 확인한 뒤 나머지 페이지 추가
+                queue.append((lang, 1))
+        completed_count = sum(len(pages) for pages in checkpoint.completed_pages.values())
+        if completed_count:
+            self.log(f"완료한 {completed_count}페이지 이후부터 이어받기")
+
+        failed_pages = {}
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            pending = {}
+            # 받아놓고 저장 못 한 페이지가 쌓이지 않게 동시에 요청하는 페이지 수 제한
+            while queue or pending:
+                while queue and len(pending) < self.workers * 2:
+                    lang, page_no = queue.popleft()
+                    pending[executor.submit(self.fetch_page, lang, page_no)] = (lang, page_no)
+
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    lang, page_no = pending.pop(future)
+                    try:
+                        page = future.result()
+                    except Exception as e:
+                        failed_pages[f"{lang}:{page_no}"] = str(e)
+                        self.metrics.incr("failed_pages")
+                        self.log(f"❌ [{lang}] {page_no}페이지 실패: {e}")
+                        continue
+
+                    with page:
+                        if lang not in checkpoint.total_counts:
+                            checkpoint.total_counts[lang] = page.total_count
+                            queue.extend((lang, other) for other in self._pages_for(lang) if other != page_no)
+                        count = self.store_page(lang, page_no, page)
+                    self.log(f"✅ [{lang}] {page_no}페이지 저장 ({count}개)")
+
+        if failed_pages:
+            raise SyncError(failed_pages)
+
+        # 기본 언어 페이지를 모두 저장했는데도 관광지가 없는 번역은 포기
+        self.unmatched = sum(len(by_lang) for by_lang in self._waiting.values())
+        if self.unmatched:
+            self.log(f"⚠️ 관광지가 없어 저장하지 못한 번역 {self.unmatched}개")
+        if self.category_mapper.unmapped:
+            self.log(f"⚠️ 카테고리 매핑이 없는 분류 코드 {len(self.category_mapper.unmapped)}종")
+
+        checkpoint.clear()
+        return self.stats
+
+
+def delete_places(content_ids):
+    """content_id 목록의 관광지 삭제 (번역은 CASCADE), 삭제한 관광지 수 반환
+
+    배치마다 삭제 기록을 모아서 한 번에 INSERT
+    """
+    content_ids = list(content_ids)
+    deleted = 0
+    for start in range(0, len(content_ids), DELETE_BATCH_SIZE):
+        with collect():
+            _, counts = Place.objects.filter(content_id__in=content_ids[start:start + DELETE_BATCH_SIZE]).delete()
+        deleted += counts.get(Place._meta.label, 0)
+    return deleted
+
+
+class PlaceIdCollector(PlaceSyncer):
+    """기본 언어 목록 전체 페이지에서 content_id만 모으기 (DB 저장 없음, 삭제 대조용)"""
+
+    def __init__(self, client, **options):
+        super().__init__(client, checkpoint_path=None, langs=(BASE_LANG,), **options)
+        self.content_ids = set()
+
+    def store_page(self, lang, page_no, items):
+        count = 0
+        for item in items:
+            count += 1
+            if item.get("contentid"):
+                self.content_ids.add(str(item["contentid"]))
+        self.checkpoint.mark(lang, page_no)
+        return count
+
+
+def reconcile_places(client, area_code=None, num_of_rows=1000, workers=4, log=None,
+                     max_delete_ratio=RECONCILE_MAX_DELETE_RATIO):
+    """TourAPI 전체 ID 목록과 DB를 비교해서 원본에서 사라진 관광지 삭제, 삭제 수 반환
+
+    목록을 하나라도 못 받으면 SyncError로 중단 (일부만 받은 목록으로 삭제하지 않음)
+    """
+    params = {"areaCode": area_code} if area_code else {}
+    collector = PlaceIdCollector(client, params=params, num_of_rows=num_of_rows, workers=workers, log=log)
+    collector.run()
+
+    places = Place.objects.all()
+    if area_code:
+        places = places.filter(region_code=area_code)
+    local_ids = set(places.values_list("content_id", flat=True))
+    missing = local_ids - collector.content_ids
+
+    if local_ids and len(missing) > len(local_ids) * max_delete_ratio:
+        raise ValueError(
+            f"삭제 대상 {len(missing)}개가 전체 {len(local_ids)}개의 {max_delete_ratio:.0%}를 넘어 중단합니다."
+        )
+    return delete_places(missing)
@@ -0,0 +1,202 @@
+import random
+from io import StringIO
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import SimpleTestCase, TestCase
+from rest_framework.test import APITestCase
+from helper.geo_helper import (
+    geohash_bounds, geohash_cell_size, geohash_encode, geohash_neighbors, geohash_precision, haversine_distance
+)
+from outbox.models import CatalogChange
+from places.dedupe import PlaceDeduplicator, find_duplicates, normalize_name
+from places.models import Place, PlaceTranslation
+from places.sync import delete_places
+
+# 경복궁
+GYEONGBOKGUNG = (37.5796, 126.9770)
+
+
+def create_place(content_id, lat, lng, favorite_count=0, **names):
+    place = Place.objects.create(
+        content_id=content_id, latitude=lat, longitude=lng, favorite_count=favorite_count
+    )
+    for lang, name in names.items():
+        PlaceTranslation.objects.create(place=place, lang=lang, name=name)
+    return place
+
+
+# geohash / 이름 정규화 / 묶음 찾기 테스트
+class FindDuplicatesTest(SimpleTestCase):
+
+    def test_geohash_encode_and_neighbors(self):
+        self.assertEqual(geohash_encode(57.64911, 10.40744, 11), "u4pruydqqvj")
+        neighbors = geohash_neighbors("u4pruy")
+        self.assertEqual(len(neighbors), 9)
+        self.assertEqual(set(neighbors), {
+            "u4pruy", "u4prut", "u4pruv", "u4prvj", "u4pruw", "u4prvn", "u4prux", "u4pruz", "u4prvp"
+        })
+
+        min_lat, max_lat, min_lng, max_lng = geohash_bounds("u4pruy")
+        self.assertTrue(min_lat <= 57.64911 <= max_lat and min_lng <= 10.40744 <= max_lng)
+
+    # 격자가 거리보다 커야 주변 8칸에서 모두 찾음 (고위도는 격자 너비가 좁음)
+    def test_geohash_precision_should_cover_distance(self):
+        self.assertEqual(geohash_precision(300, 37.5), 6)
+        self.assertEqual(geohash_precision(1000, 37.5), 5)
+        self.assertEqual(geohash_precision(100, 0), 7)
+        for distance in (50, 300, 700, 5000):
+            for lat in (0, 37.5, 70):
+                precision = geohash_precision(distance, lat)
+                self.assertGreaterEqual(min(geohash_cell_size(precision, lat)), distance)
+                if precision < 12:
+                    self.assertLess(min(geohash_cell_size(precision + 1, lat)), distance)
+
+    def test_normalize_name(self):
+        self.assertEqual(normalize_name("경복궁 (景福宮)"), "경복궁")
+        self.assertEqual(normalize_name("Gyeongbokgung  Palace!"), "gyeongbokgungpalace")
+        self.assertEqual(normalize_name("ＮＡＭＳＡＮ Tower"), "namsantower")
+        self.assertEqual(normalize_name("산"), "")
+
+    def test_close_places_with_same_name_should_be_grouped(self):
+        places = [
+            (1, 37.5796, 126.9770, {"경복궁"}),
+            (2, 37.5797, 126.9772, {"경복궁", "gyeongbokgungpalace"}),
+            # 다른 언어 이름으로만 이어진 관광지도 같은 묶음
+            (3, 37.5795, 126.9769, {"gyeongbokgungpalace"}),
+            # 이름이 같아도 멀면 다른 관광지
+            (4, 35.1796, 129.0756, {"경복궁"}),
+            (5, 37.5796, 126.9771, {"광화문"}),
+            (6, None, None, {"경복궁"}),
+        ]
+        self.assertEqual(find_duplicates(places), [{1, 2, 3}])
+
+    # 격자 경계를 사이에 둔 관광지도 주변 격자에서 찾음
+    def test_places_across_cell_border_should_be_grouped(self):
+        min_lat, max_lat, min_lng, max_lng = geohash_bounds(geohash_encode(*GYEONGBOKGUNG))
+        places = [
+            (1, max_lat - 0.0001, max_lng - 0.0001, {"경복궁"}),
+            (2, max_lat + 0.0001, max_lng + 0.0001, {"경복궁"}),
+        ]
+        self.assertNotEqual(geohash_encode(*places[0][1:3]), geohash_encode(*places[1][1:3]))
+        self.assertEqual(find_duplicates(places), [{1, 2}])
+
+    # 같은 이름 후보만 거리 비교하므로 결과는 전체 쌍 비교와 같아야 함 (격자보다 먼 거리도)
+    def test_should_match_brute_force(self):
+        for max_distance in (300, 2000):
+            with self.subTest(max_distance=max_distance):
+                self.check_brute_force(max_distance)
+
+    def check_brute_force(self, max_distance):
+        rng = random.Random(3)
+        places = [
+            (index, 37.5 + rng.uniform(0, 0.05), 127.0 + rng.uniform(0, 0.05), {f"name{rng.randrange(30)}"})
+            for index in range(300)
+        ]
+        parent = list(range(len(places)))
+
+        def find(key):
+            while parent[key] != key:
+                key = parent[key]
+            return key
+
+        for key, lat, lng, names in places:
+            for other_key, other_lat, other_lng, other_names in places[key + 1:]:
+                if names & other_names and haversine_distance(lat, lng, other_lat, other_lng) <= max_distance:
+                    parent[find(other_key)] = find(key)
+        expected = {}
+        for key in range(len(places)):
+            expected.setdefault(find(key), set()).add(key)
+
+        self.assertCountEqual(
+            find_duplicates(places, max_distance), [cluster for cluster in expected.values() if len(cluster) > 1]
+        )
+
+
+# 중복 관광지 연결 테스트
+class PlaceDeduplicatorTest(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.main = create_place("1", *GYEONGBOKGUNG, ko="경복궁", en="Gyeongbokgung Palace")
+        self.copy = create_place("2", 37.5797, 126.9771, favorite_count=10, ko="경복궁(景福宮)")
+        self.other = create_place("3", 37.5760, 126.9769, ko="광화문")
+
+    def test_duplicates_should_link_to_canonical(self):
+        stats = PlaceDeduplicator().run()
+
+        self.assertEqual((stats.clusters, stats.duplicates, stats.changed), (1, 1, 1))
+        # 번역 언어가 많은 관광지가 대표
+        self.copy.refresh_from_db()
+        self.assertEqual(self.copy.canonical_id, self.main.id)
+        self.assertEqual(
+            list(Place.objects.canonical().order_by("id").values_list("id", flat=True)),
+            [self.main.id, self.other.id]
+        )
+        self.assertTrue(CatalogChange.objects.pending().filter(entity_id=self.copy.id).exists())
+
+    def test_second_run_should_change_nothing(self):
+        PlaceDeduplicator().run()
+        CatalogChange.objects.all().delete()
+
+        # 관광지 읽기 2번 + 기존 연결 읽기 1번
+        with self.assertNumQueries(3):
+            stats = PlaceDeduplicator().run()
+        self.assertEqual(stats.changed, 0)
+        self.assertFalse(CatalogChange.objects.exists())
+
+    # 이름이 바뀌어 더 이상 중복이 아니면 연결 해제
+    def test_link_should_be_removed_when_no_longer_duplicate(self):
+        PlaceDeduplicator().run()
+        PlaceTranslation.objects.filter(place=self.copy).update(name="경복궁 수문장 교대식")
+
+        stats = PlaceDeduplicator().run()
+
+        self.assertEqual(stats.changed, 1)
+        self.copy.refresh_from_db()
+        self.assertIsNone(self.copy.canonical_id)
+
+    # 대표 관광지가 삭제되면 중복이 다시 대표가 되고 변경 기록도 남음
+    def test_deleting_canonical_should_unlink_duplicates(self):
+        PlaceDeduplicator().run()
+        CatalogChange.objects.all().delete()
+
+        delete_places([self.main.content_id])
+
+        self.copy.refresh_from_db()
+        self.assertIsNone(self.copy.canonical_id)
+        self.assertEqual(
+            list(Place.objects.canonical().order_by("id").values_list("id", flat=True)),
+            [self.copy.id, self.other.id]
+        )
+        self.assertTrue(CatalogChange.objects.pending().filter(
+            entity_id=self.copy.id, action=CatalogChange.ACTION_UPSERT
+        ).exists())
+
+    def test_dry_run_should_not_save(self):
+        out = StringIO()
+        call_command("dedupe_places", dry_run=True, stdout=out)
+
+        self.assertIn("중복 1개", out.getvalue())
+        self.assertFalse(Place.objects.exclude(canonical_id=None).exists())
+
+
+# 목록/주변 API는 대표 관광지만 노출
+class CanonicalPlacesAPITest(APITestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.main = create_place("1", *GYEONGBOKGUNG, ko="경복궁")
+        self.copy = create_place("2", 37.5797, 126.9771, ko="경복궁")
+        PlaceDeduplicator().run()
+
+    def test_list_and_nearby_should_hide_duplicates(self):
+        response = self.client.get("/api/places/?lang=ko")
+        self.assertEqual([place["id"] for place in response.data["places"]], [self.main.id])
+
+        response = self.client.get(f"/api/places/nearby/?lat={GYEONGBOKGUNG[0]}&lng={GYEONGBOKGUNG[1]}")
+        self.assertEqual([place["id"] for place in response.data["places"]], [self.main.id])
+
+    # 중복 관광지 상세는 그대로 조회되고 대표 관광지 ID를 알려줌
+    def test_detail_should_point_to_canonical(self):
+        response = self.client.get(f"/api/places/{self.copy.id}/?lang=ko")
+        self.assertEqual(response.data["place"]["canonical_id"], self.main.id)
@@ -0,0 +1,139 @@
+import os
+import tempfile
+from datetime import datetime
+from io import StringIO
+from django.core.cache import cache
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+from places.models import Place, SyncRun
+from places.sync import TOUR_API_TIMEZONE, delta_params, parse_modified_time, reconcile_places
+from places.tests.tour_api_stub import TourAPIStub
+from places.tour_api import TourAPIClient
+
+
+# 증분 동기화 / 삭제 대조 테스트
+class DeltaSyncTest(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def sync(self, stub, *args, **options):
+        call_command(
+            "sync_places", *args, base_url=stub.base_url, rows=3, rate=0, retries=0, langs="ko",
+            checkpoint=os.path.join(self.temp_dir.name, "checkpoint.json"), stdout=StringIO(), **options
+        )
+        return SyncRun.objects.order_by("-id").first()
+
+    def modify(self, stub, content_id, modifiedtime="20240601120000", **fields):
+        for item in stub.items:
+            if item["contentid"] == content_id:
+                item.update(modifiedtime=modifiedtime, **fields)
+
+    def test_modified_time_parsing(self):
+        self.assertEqual(
+            parse_modified_time("20240521103314"),
+            datetime(2024, 5, 21, 10, 33, 14, tzinfo=TOUR_API_TIMEZONE)
+        )
+        self.assertIsNone(parse_modified_time(""))
+        self.assertEqual(
+            delta_params({"areaCode": "1"}, parse_modified_time("20240521103314")),
+            {"areaCode": "1", "modifiedtime": "20240521"}
+        )
+
+    def test_first_delta_should_fall_back_to_full_sync(self):
+        with TourAPIStub() as stub:
+            run = self.sync(stub)
+
+        self.assertEqual(run.kind, SyncRun.KIND_FULL)
+        self.assertEqual(run.status, SyncRun.STATUS_SUCCESS)
+        self.assertEqual(run.inserted, 8)
+        self.assertEqual(run.high_water_mark, parse_modified_time("20240521103314"))
+        self.assertIsNotNone(run.lag)
+
+    def test_delta_should_fetch_only_changed_places(self):
+        with TourAPIStub() as stub:
+            for item in stub.items[1:]:
+                item["modifiedtime"] = "20230101000000"
+            self.sync(stub, mode="full")
+
+            self.modify(stub, "126512", title="창덕궁 (수정)")
+            self.modify(stub, "126078")
+            stub.requests.clear()
+            run = self.sync(stub)
+
+        self.assertEqual(run.kind, SyncRun.KIND_DELTA)
+        self.assertEqual(run.params["modifiedtime"], "20240521")
+        # 기준일 이후 3개(기준점 당일 1개 + 변경 2개)만 받아서 1페이지로 끝남
+        self.assertEqual(dict(stub.requests), {1: 1})
+        self.assertEqual((run.inserted, run.updated, run.unchanged), (0, 2, 1))
+        self.assertEqual(run.high_water_mark, parse_modified_time("20240601120000"))
+        self.assertEqual(Place.objects.get(content_id="126512").get_name("ko"), "창덕궁 (수정)")
+
+    def test_delta_without_changes_should_keep_high_water_mark(self):
+        with TourAPIStub() as stub:
+            full = self.sync(stub, mode="full")
+            self.modify(stub, "126508", modifiedtime="20240520000000")
+            delta = self.sync(stub)
+
+        self.assertEqual(delta.high_water_mark, full.high_water_mark)
+
+    def test_hidden_place_should_be_deleted_by_delta(self):
+        with TourAPIStub() as stub:
+            self.sync(stub, mode="full")
+
+            stub.hidden = {"126535"}
+            self.modify(stub, "126535")
+            run = self.sync(stub)
+
+        self.assertEqual(run.deleted, 1)
+        self.assertFalse(Place.objects.filter(content_id="126535").exists())
+        self.assertEqual(Place.objects.count(), 7)
+
+    def test_reconcile_should_delete_places_missing_from_source(self):
+        with TourAPIStub() as stub:
+            self.sync(stub, mode="full")
+
+            stub.items = [item for item in stub.items if item["contentid"] != "126101"]
+            self.sync(stub, reconcile=True, max_delete_ratio=0.5)
+
+        run = SyncRun.objects.filter(kind=SyncRun.KIND_RECONCILE).get()
+        self.assertEqual(run.deleted, 1)
+        self.assertEqual(Place.objects.count(), 7)
+        self.assertFalse(Place.objects.filter(content_id="126101").exists())
+
+    # 원본 목록이 비정상적으로 줄었으면 대량 삭제하지 않음
+    def test_reconcile_should_refuse_mass_deletion(self):
+        with TourAPIStub() as stub:
+            self.sync(stub, mode="full")
+            stub.items = stub.items[:2]
+
+            client = TourAPIClient(base_url=stub.base_url, service_key="x", rate=0)
+            with self.assertRaises(ValueError):
+                reconcile_places(client, num_of_rows=3)
+
+        self.assertEqual(Place.objects.count(), 8)
+
+    def test_failed_sync_should_be_recorded(self):
+        with TourAPIStub() as stub:
+            stub.failures = {1: -1}
+            with self.assertRaises(CommandError):
+                self.sync(stub)
+
+        run = SyncRun.objects.get()
+        self.assertEqual(run.status, SyncRun.STATUS_FAILED)
+        self.assertIn("HTTP 500", run.error)
+        self.assertIsNone(SyncRun.objects.latest_high_water_mark(run.scope))
+
+    # 지역 범위가 다르면 기준점을 공유하지 않음
+    def test_high_water_mark_should_be_scoped(self):
+        with TourAPIStub() as stub:
+            self.sync(stub, mode="full", area="6")
+            run = self.sync(stub, area="1")
+
+        self.assertEqual(run.kind, SyncRun.KIND_FULL)
+        self.assertEqual(run.scope, "area=1,type=all")
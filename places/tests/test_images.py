@@ -0,0 +1,176 @@
+import functools
+import io
+import os
+import tempfile
+import threading
+import time
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from PIL import Image
+from places.images import ImagePipeline, image_path
+from places.models import Place
+from places.serializers import PlaceDetailSerializer, PlaceListSerializer
+
+SIZES = {"small": 40, "medium": 120}
+
+
+class QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+class FileServerStub:
+    """디렉터리의 파일을 그대로 서빙하는 로컬 HTTP 서버 (이미지 원본 서버 대신)"""
+
+    def __init__(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        handler = functools.partial(QuietHandler, directory=self.temp_dir.name)
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        self.base_url = f"http://127.0.0.1:{self.server.server_port}"
+
+    def add_image(self, name, color, size=(300, 200)):
+        buffer = io.BytesIO()
+        Image.new("RGB", size, color).save(buffer, "JPEG")
+        with open(os.path.join(self.temp_dir.name, name), "wb") as f:
+            f.write(buffer.getvalue())
+        return f"{self.base_url}/{name}"
+
+    def __enter__(self):
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *args):
+        self.server.shutdown()
+        self.server.server_close()
+        self.temp_dir.cleanup()
+
+
+# 관광지 이미지 처리 단계 테스트
+class ImagePipelineTest(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.media_dir = tempfile.TemporaryDirectory()
+        self.settings_override = override_settings(MEDIA_ROOT=self.media_dir.name, PLACE_IMAGE_SIZES=SIZES)
+        self.settings_override.enable()
+
+    def tearDown(self):
+        self.settings_override.disable()
+        self.media_dir.cleanup()
+
+    def run_pipeline(self):
+        pipeline = ImagePipeline(workers=2, processes=2)
+        try:
+            return pipeline.run()
+        finally:
+            pipeline.close()
+
+    def test_images_should_be_stored_by_hash_with_thumbnails(self):
+        with FileServerStub() as stub:
+            red = stub.add_image("red.jpg", "red")
+            place = Place.objects.create(content_id="1", image_url=red)
+
+            stats = self.run_pipeline()
+
+        place.refresh_from_db()
+        self.assertEqual((stats.downloaded, stats.failed, stats.places_updated), (1, 0, 1))
+        self.assertEqual(place.image_fetched_url, red)
+        self.assertEqual(set(place.image_variants), {"original", "small", "medium"})
+        self.assertEqual(place.image_variants["small"], image_path(place.image_hash, "_small.jpg"))
+
+        with Image.open(os.path.join(self.media_dir.name, place.image_variants["small"])) as small:
+            self.assertEqual(small.size, (40, 27))
+        with Image.open(os.path.join(self.media_dir.name, place.image_variants["medium"])) as medium:
+            self.assertEqual(medium.size, (120, 80))
+
+    # 같은 내용의 이미지는 URL이 달라도 파일 하나만 저장
+    def test_same_content_should_be_deduplicated(self):
+        with FileServerStub() as stub:
+            first = stub.add_image("a.jpg", "blue")
+            second = stub.add_image("b.jpg", "blue")
+            Place.objects.create(content_id="1", image_url=first)
+            Place.objects.create(content_id="2", image_url=first)
+            Place.objects.create(content_id="3", image_url=second)
+
+            stats = self.run_pipeline()
+
+        self.assertEqual((stats.downloaded, stats.deduplicated, stats.places_updated), (2, 1, 3))
+        self.assertEqual(len(set(Place.objects.values_list("image_hash", flat=True))), 1)
+        stored = [name for _, _, names in os.walk(self.media_dir.name) for name in names]
+        self.assertEqual(len(stored), 1 + len(SIZES))
+
+    def test_only_changed_images_should_be_processed_again(self):
+        with FileServerStub() as stub:
+            red = stub.add_image("red.jpg", "red")
+            place = Place.objects.create(content_id="1", image_url=red)
+            self.run_pipeline()
+
+            self.assertEqual(self.run_pipeline().downloaded, 0)
+
+            green = stub.add_image("green.jpg", "green")
+            Place.objects.filter(id=place.id).update(image_url=green)
+            self.assertEqual(self.run_pipeline().downloaded, 1)
+
+        place.refresh_from_db()
+        self.assertEqual(place.image_fetched_url, green)
+
+    # 실패한 이미지는 표시하지 않고 다음 실행 때 다시 시도
+    def test_failed_download_should_be_retried_later(self):
+        with FileServerStub() as stub:
+            place = Place.objects.create(content_id="1", image_url=f"{stub.base_url}/missing.jpg")
+            stats = self.run_pipeline()
+
+            self.assertEqual(stats.failed, 1)
+            place.refresh_from_db()
+            self.assertEqual(place.image_fetched_url, "")
+
+            stub.add_image("missing.jpg", "red")
+            self.assertEqual(self.run_pipeline().downloaded, 1)
+
+    # 중간에 멈춰도 처리가 끝난 이미지는 저장되어 다음 실행 때 다시 받지 않음
+    def test_completed_images_should_survive_crash(self):
+        class CrashingPipeline(ImagePipeline):
+            def download(self, url):
+                if url.endswith("crash.jpg"):
+                    # 앞의 썸네일이 끝날 때까지 기다렸다가 실패
+                    time.sleep(1.5)
+                    raise RuntimeError("crash")
+                return super().download(url)
+
+        with FileServerStub() as stub:
+            first = Place.objects.create(content_id="1", image_url=stub.add_image("red.jpg", "red"))
+            second = Place.objects.create(content_id="2", image_url=stub.add_image("blue.jpg", "blue"))
+            Place.objects.create(content_id="3", image_url=stub.add_image("crash.jpg", "green"))
+
+            pipeline = CrashingPipeline(workers=1, processes=1, batch_size=1)
+            with self.assertRaises(RuntimeError):
+                pipeline.run()
+            pipeline.close()
+
+            self.assertEqual(pipeline.stats.places_updated, 2)
+            for place in (first, second):
+                place.refresh_from_db()
+                self.assertEqual(place.image_fetched_url, place.image_url)
+            self.assertEqual(self.run_pipeline().downloaded, 1)
+
+    def test_removed_image_should_be_cleared(self):
+        with FileServerStub() as stub:
+            place = Place.objects.create(content_id="1", image_url=stub.add_image("red.jpg", "red"))
+            self.run_pipeline()
+
+        Place.objects.filter(id=place.id).update(image_url="")
+        self.run_pipeline()
+
+        place.refresh_from_db()
+        self.assertEqual((place.image_fetched_url, place.image_variants), ("", {}))
+
+    def test_serializers_should_return_media_urls(self):
+        place = Place.objects.create(
+            content_id="1",
+            image_variants={"original": "places/ab/ab.jpg", "small": "places/ab/ab_small.jpg"}
+        )
+
+        self.assertEqual(PlaceListSerializer(place).data["thumbnail"], "/media/places/ab/ab_small.jpg")
+        self.assertEqual(PlaceDetailSerializer(place).data["images"]["original"], "/media/places/ab/ab.jpg")
+        self.assertIsNone(PlaceListSerializer(Place.objects.create(content_id="2")).data["thumbnail"])
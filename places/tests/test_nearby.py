@@ -0,0 +1,111 @@
+import random
+from django.db import connection
+from django.test import SimpleTestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase
+from rest_framework import status
+from helper.geo_helper import bounding_box, haversine_distance, nearest
+from places.models import NEAREST_CANDIDATE_FACTOR, Place, PlaceTranslation
+
+# 서울시청
+CITY_HALL = (37.5665, 126.9780)
+
+
+# 순수 파이썬 거리 계산 엔진 테스트
+class GeoHelperTest(SimpleTestCase):
+
+    def test_haversine_distance(self):
+        # 서울시청 ~ 부산시청 약 325km
+        distance = haversine_distance(*CITY_HALL, 35.1796, 129.0756)
+        self.assertAlmostEqual(distance / 1000, 325, delta=5)
+        self.assertEqual(haversine_distance(*CITY_HALL, *CITY_HALL), 0)
+
+    # bounding box 는 반경 안의 모든 점을 포함해야 함
+    def test_bounding_box_should_contain_circle(self):
+        rng = random.Random(7)
+        radius = 5000
+        min_lat, max_lat, min_lng, max_lng = bounding_box(*CITY_HALL, radius)
+
+        for _ in range(2000):
+            lat = CITY_HALL[0] + rng.uniform(-0.1, 0.1)
+            lng = CITY_HALL[1] + rng.uniform(-0.1, 0.1)
+            if haversine_distance(*CITY_HALL, lat, lng) <= radius:
+                self.assertTrue(min_lat <= lat <= max_lat and min_lng <= lng <= max_lng)
+
+    def test_nearest_should_filter_by_radius_and_sort_by_distance(self):
+        candidates = [
+            ("far", 37.60, 126.9780),
+            ("near", 37.5670, 126.9780),
+            ("middle", 37.5700, 126.9780),
+            ("no_location", None, None),
+        ]
+
+        result = nearest(candidates, *CITY_HALL, 1000, 10)
+        self.assertEqual([key for key, _ in result], ["near", "middle"])
+        self.assertLess(result[0][1], result[1][1])
+
+        self.assertEqual([key for key, _ in nearest(candidates, *CITY_HALL, 1000, 1)], ["near"])
+
+
+# 주변 관광지 API 테스트
+class PlacesNearbyAPITest(APITestCase):
+
+    def setUp(self):
+        rng = random.Random(42)
+        self.places = []
+        for index in range(60):
+            place = Place.objects.create(
+                content_id=f"nearby_{index}",
+                latitude=round(CITY_HALL[0] + rng.uniform(-0.05, 0.05), 6),
+                longitude=round(CITY_HALL[1] + rng.uniform(-0.05, 0.05), 6),
+                category_id=1 if index % 2 == 0 else 2
+            )
+            PlaceTranslation.objects.create(place=place, lang="en", name=f"Place {index}")
+            self.places.append(place)
+        # 좌표 없는 관광지는 결과에서 제외
+        Place.objects.create(content_id="no_location")
+
+    def expected_ids(self, radius, limit, matches=lambda place: True):
+        candidates = [(p.id, p.latitude, p.longitude) for p in self.places if matches(p)]
+        return [place_id for place_id, _ in nearest(candidates, *CITY_HALL, radius, limit)]
+
+    def test_nearby_should_match_python_engine(self):
+        with self.assertNumQueries(2):
+            response = self.client.get(f"/api/places/nearby/?lat={CITY_HALL[0]}&lng={CITY_HALL[1]}&radius=3000&limit=100&lang=en")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        ids = [place["id"] for place in response.data["places"]]
+        self.assertEqual(ids, self.expected_ids(3000, 100))
+        self.assertTrue(0 < len(ids) < len(self.places))
+
+        distances = [place["distance"] for place in response.data["places"]]
+        self.assertEqual(distances, sorted(distances))
+        self.assertTrue(all(distance <= 3000 for distance in distances))
+        self.assertTrue(response.data["places"][0]["name"].startswith("Place "))
+
+    def test_nearby_should_respect_limit_and_filters(self):
+        response = self.client.get(f"/api/places/nearby/?lat={CITY_HALL[0]}&lng={CITY_HALL[1]}&radius=5000&limit=5&category_id=2")
+
+        ids = [place["id"] for place in response.data["places"]]
+        self.assertEqual(ids, self.expected_ids(5000, 5, lambda place: place.category_id == 2))
+
+    # DB는 근사 거리순으로 limit의 몇 배만 읽어도 전체를 계산한 결과와 같아야 함
+    def test_nearest_ids_should_read_capped_candidates(self):
+        for limit in (1, 3, 10):
+            with CaptureQueriesContext(connection) as queries:
+                result = Place.objects.nearest_ids(*CITY_HALL, 10000, limit)
+
+            self.assertEqual([place_id for place_id, _ in result], self.expected_ids(10000, limit))
+            self.assertIn(f"LIMIT {limit * NEAREST_CANDIDATE_FACTOR}", queries[0]["sql"])
+
+    def test_nearby_without_results_should_return_empty_list(self):
+        response = self.client.get("/api/places/nearby/?lat=33.5&lng=126.5")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["places"], [])
+
+    def test_invalid_params_should_return_400(self):
+        for query in ["lng=126.9", "lat=abc&lng=126.9", "lat=91&lng=126.9", "lat=37.5&lng=126.9&radius=0",
+                      "lat=37.5&lng=126.9&radius=50000", "lat=37.5&lng=126.9&limit=0", "lat=nan&lng=126.9"]:
+            response = self.client.get(f"/api/places/nearby/?{query}")
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST, query)
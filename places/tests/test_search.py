@@ -0,0 +1,87 @@
+import importlib
+from django.core.cache import cache
+from django.test import SimpleTestCase
+from rest_framework import status
+from rest_framework.test import APITestCase
+from places.models import Place, PlaceTranslation
+from places.search import SEARCH_CONFIGS, search_places, search_terms
+
+
+def create_place(content_id, favorite_count=0, **translations):
+    place = Place.objects.create(content_id=content_id, favorite_count=favorite_count)
+    for lang, fields in translations.items():
+        PlaceTranslation.objects.create(place=place, lang=lang, **fields)
+    return place
+
+
+class SearchTermsTest(SimpleTestCase):
+
+    def test_search_terms_should_drop_query_syntax(self):
+        self.assertEqual(search_terms("Gyeongbok' & !palace:*"), ["gyeongbok", "palace"])
+        self.assertEqual(search_terms("  경복궁  야경 "), ["경복궁", "야경"])
+        self.assertEqual(search_terms("&|!"), [])
+
+    # 트리거의 언어별 설정이 검색 설정과 같아야 인덱스가 맞음
+    def test_trigger_should_use_same_configs(self):
+        migration = importlib.import_module("places.migrations.0011_place_translation_search_vector")
+        for lang, config in SEARCH_CONFIGS.items():
+            if config != "simple":
+                self.assertIn(f"WHEN '{lang}' THEN '{config}'", migration.CREATE_SEARCH_TRIGGER)
+
+
+# 검색 엔진 테스트 (SQLite에서는 같은 가중치의 LIKE 검색)
+class SearchPlacesTest(APITestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.by_name = create_place("1", ko={"name": "경복궁", "address": "서울 종로구"})
+        self.by_address = create_place("2", ko={"name": "국립고궁박물관", "address": "경복궁 내"})
+        self.by_description = create_place("3", ko={"name": "광화문", "description": "경복궁의 정문"})
+        self.english = create_place("4", en={"name": "Gyeongbokgung Palace"})
+
+    # 이름 > 주소 > 설명 순으로 점수
+    def test_name_should_rank_above_address_and_description(self):
+        found = search_places("경복궁", "ko")
+        self.assertEqual(
+            [place_id for place_id, _ in found],
+            [self.by_name.id, self.by_address.id, self.by_description.id]
+        )
+
+    def test_every_term_should_match(self):
+        found = search_places("경복궁 정문", "ko")
+        self.assertEqual([place_id for place_id, _ in found], [self.by_description.id])
+
+    def test_search_should_use_requested_language(self):
+        self.assertEqual([place_id for place_id, _ in search_places("palace", "en")], [self.english.id])
+        self.assertEqual(search_places("palace", "ko"), [])
+
+    # 관련도가 같으면 즐겨찾기가 많은 관광지가 위로
+    def test_favorites_should_boost_score(self):
+        popular = create_place("5", favorite_count=100, ko={"name": "경복궁 야간개장"})
+        found = search_places("경복궁", "ko")
+        self.assertEqual(found[0][0], popular.id)
+
+    def test_duplicates_should_be_excluded(self):
+        Place.objects.filter(id=self.by_address.id).update(canonical_id=self.by_name.id)
+        found = search_places("경복궁", "ko")
+        self.assertNotIn(self.by_address.id, [place_id for place_id, _ in found])
+
+    def test_search_api_should_return_ranked_places(self):
+        # 검색 1번 + 관광지 조회 1번
+        with self.assertNumQueries(2):
+            response = self.client.get("/api/places/search/?q=경복궁&lang=ko&limit=2")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        places = response.data["places"]
+        self.assertEqual([place["id"] for place in places], [self.by_name.id, self.by_address.id])
+        self.assertEqual(places[0]["name"], "경복궁")
+        self.assertGreater(places[0]["score"], places[1]["score"])
+
+    def test_search_api_should_validate_params(self):
+        for query in ["q=&lang=ko", f"q={'가' * 101}", "q=경복궁&lang=xx", "q=경복궁&limit=0", "q=경복궁&limit=abc"]:
+            response = self.client.get(f"/api/places/search/?{query}")
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST, query)
+
+    def test_search_api_without_terms_should_return_empty(self):
+        response = self.client.get("/api/places/search/?q=!!!")
+        self.assertEqual(response.data["places"], [])
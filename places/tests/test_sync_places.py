@@ -0,0 +1,404 @@
+import json
+import os
+import tempfile
+from io import BytesIO, StringIO
+from unittest import mock
+from django.core.cache import cache
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+from categories.models import Category, CategoryCodeMapping, SubCategory
+from places.metrics import find_regressions
+from places.models import Place, PlaceTranslation, SyncRun
+from places.sync import PlaceSyncer, SyncError, parse_place_item
+from places.tests.tour_api_stub import TourAPIStub, load_fixture
+from places.tour_api import TourAPIClient, TourAPIError, get_items, iter_items, scan_page
+from regions.models import Region, SubRegion
+
+
+# TourAPI 응답 파싱 테스트
+class TourAPIParsingTest(TestCase):
+
+    def test_get_items_should_handle_empty_and_single_item(self):
+        self.assertEqual(get_items({"items": ""}), [])
+        self.assertEqual(get_items({"items": {"item": {"contentid": "1"}}}), [{"contentid": "1"}])
+        self.assertEqual(len(get_items(load_fixture("tour_api_area_based_list.json")["response"]["body"])), 8)
+
+    def test_parse_place_item(self):
+        item = load_fixture("tour_api_area_based_list.json")["response"]["body"]["items"]["item"][0]
+
+        content_id, place_fields, translation_fields = parse_place_item(item)
+
+        self.assertEqual(content_id, "126508")
+        self.assertEqual(str(place_fields["latitude"]), "37.57608366")
+        self.assertEqual(str(place_fields["longitude"]), "126.97673758")
+        self.assertEqual(place_fields["region_code"], "1")
+        self.assertEqual(translation_fields["name"], "경복궁")
+        self.assertEqual(translation_fields["address"], "서울특별시 종로구 사직로 161")
+
+
+# 목록 응답 스트리밍 파싱 테스트
+class TourAPIStreamingTest(TestCase):
+
+    def response(self, items, total_count=0):
+        body = {"items": items, "numOfRows": 10, "pageNo": 1, "totalCount": total_count}
+        payload = {"response": {"header": {"resultCode": "0000", "resultMsg": "OK"}, "body": body}}
+        return BytesIO(json.dumps(payload, ensure_ascii=False).encode("utf-8"))
+
+    def test_iter_items_should_handle_empty_single_and_nested_items(self):
+        self.assertEqual(list(iter_items(self.response(""))), [])
+        self.assertEqual(list(iter_items(self.response({"item": {"contentid": "1"}}))), [{"contentid": "1"}])
+
+        items = [{"contentid": "1", "mapx": 126.97, "extra": {"item": {"a": 1}}}, {"contentid": "2"}]
+        self.assertEqual(list(iter_items(self.response({"item": items}))), items)
+
+    def test_scan_page_should_read_header_and_total_count(self):
+        self.assertEqual(
+            scan_page("areaBasedList1", self.response({"item": []}, total_count=42)),
+            ({"resultCode": "0000", "resultMsg": "OK"}, 42)
+        )
+
+        truncated = BytesIO(self.response({"item": [{"contentid": "1"}]}).getvalue()[:-20])
+        with self.assertRaises(TourAPIError):
+            scan_page("areaBasedList1", truncated)
+
+    def test_stream_page_should_match_get_page(self):
+        client = TourAPIClient(service_key="test-key", rate=0, max_retries=0)
+        with TourAPIStub() as stub:
+            client.base_url = stub.base_url
+            items, total_count = client.get_page("areaBasedList1", 2, 3)
+            with client.stream_page("areaBasedList1", 2, 3) as page:
+                self.assertEqual(page.total_count, total_count)
+                # 여러 번 순회해도 처음부터 다시 파싱
+                self.assertEqual(list(page), items)
+                self.assertEqual(list(page), items)
+
+            stub.failures = {1: -1}
+            with self.assertRaises(TourAPIError):
+                client.stream_page("areaBasedList1", 1, 3)
+        client.close()
+
+
+# 로컬 스텁 서버를 상대로 한 동기화 테스트
+class SyncPlacesTest(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.checkpoint_path = os.path.join(self.temp_dir.name, "checkpoint.json")
+
+        self.seoul = Region.objects.create()
+        SubRegion.objects.create(region=self.seoul, latitude=37.5735, longitude=126.9790)
+        self.busan = Region.objects.create()
+        SubRegion.objects.create(region=self.busan, latitude=35.1631, longitude=129.1636)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def make_syncer(self, stub, **options):
+        client = TourAPIClient(base_url=stub.base_url, service_key="test-key", rate=0, backoff=0.01, max_retries=2)
+        return PlaceSyncer(client, num_of_rows=2, workers=3, checkpoint_path=self.checkpoint_path, **options)
+
+    def test_sync_should_save_every_page(self):
+        with TourAPIStub() as stub:
+            stats = self.make_syncer(stub).run()
+
+        self.assertEqual(stats.inserted, 8)
+        self.assertEqual(Place.objects.count(), 8)
+        self.assertEqual(set(stub.requests), {1, 2, 3, 4})
+
+        gyeongbokgung = Place.objects.get(content_id="126508")
+        self.assertEqual(gyeongbokgung.get_name("ko"), "경복궁")
+        self.assertEqual(gyeongbokgung.region_id, self.seoul.id)
+        self.assertIsNotNone(gyeongbokgung.last_synced_at)
+        self.assertEqual(Place.objects.get(content_id="126078").region_id, self.busan.id)
+
+        # 좌표 0은 좌표 없음으로 저장
+        no_location = Place.objects.get(content_id="2733967")
+        self.assertIsNone(no_location.latitude)
+        self.assertIsNone(no_location.region_id)
+
+        # 완료되면 체크포인트 삭제
+        self.assertFalse(os.path.exists(self.checkpoint_path))
+
+    def test_sync_should_be_idempotent(self):
+        with TourAPIStub() as stub:
+            self.make_syncer(stub).run()
+            stats = self.make_syncer(stub).run()
+
+        self.assertEqual((stats.inserted, stats.updated, stats.unchanged), (0, 0, 8))
+        self.assertEqual(Place.objects.count(), 8)
+        self.assertEqual(PlaceTranslation.objects.count(), 8)
+
+    def test_transient_failures_should_be_retried(self):
+        with TourAPIStub() as stub:
+            stub.failures = {2: 2, 3: 1}
+            stats = self.make_syncer(stub).run()
+
+        self.assertEqual(stats.total, 8)
+        self.assertEqual(stub.requests[2], 3)
+        self.assertEqual(stub.requests[3], 2)
+
+    # 중단된 동기화는 실패한 페이지만 다시 가져옴
+    def test_interrupted_sync_should_resume_from_checkpoint(self):
+        with TourAPIStub() as stub:
+            stub.failures = {3: -1}
+            with self.assertRaises(SyncError) as context:
+                self.make_syncer(stub).run()
+
+            self.assertEqual(list(context.exception.failed_pages), ["ko:3"])
+            with open(self.checkpoint_path, encoding="utf-8") as f:
+                self.assertEqual(json.load(f)["completed_pages"], {"ko": [1, 2, 4]})
+            self.assertEqual(Place.objects.count(), 6)
+
+            stub.failures = {}
+            stub.requests.clear()
+            stats = self.make_syncer(stub).run()
+
+        self.assertEqual(stats.inserted, 2)
+        self.assertEqual(dict(stub.requests), {3: 1})
+        self.assertEqual(Place.objects.count(), 8)
+
+    def test_checkpoint_with_other_params_should_be_ignored(self):
+        with TourAPIStub() as stub:
+            stub.failures = {3: -1}
+            with self.assertRaises(SyncError):
+                self.make_syncer(stub).run()
+
+            stub.failures = {}
+            stub.requests.clear()
+            self.make_syncer(stub, params={"areaCode": "1"}).run()
+
+        self.assertEqual(set(stub.requests), {1, 2, 3, 4})
+
+    def test_connection_error_should_raise_after_retries(self):
+        client = TourAPIClient(base_url="http://127.0.0.1:1", service_key="x", rate=0, backoff=0.01, max_retries=1)
+        with self.assertRaises(TourAPIError):
+            client.get("areaBasedList1")
+
+    def test_command_should_sync_and_report_failure(self):
+        with TourAPIStub() as stub:
+            call_command(
+                "sync_places", base_url=stub.base_url, rows=3, rate=0,
+                checkpoint=self.checkpoint_path, stdout=StringIO()
+            )
+            self.assertEqual(Place.objects.count(), 8)
+            # 기본으로 모든 언어 서비스를 가져옴
+            self.assertEqual(
+                set(stub.service_requests), {"KorService1", "EngService1", "JpnService1", "ChsService1"}
+            )
+
+            stub.failures = {1: -1}
+            with self.assertRaises(CommandError):
+                call_command(
+                    "sync_places", base_url=stub.base_url, rows=3, rate=0, retries=0,
+                    checkpoint=self.checkpoint_path, restart=True, stdout=StringIO()
+                )
+
+    # 동기화 뒤 단계에서 예상 못한 오류가 나도 실행 중으로 남지 않음
+    def test_unexpected_error_should_mark_run_failed(self):
+        with TourAPIStub() as stub, mock.patch(
+            "places.management.commands.sync_places.PlaceDeduplicator.run", side_effect=RuntimeError("boom")
+        ):
+            with self.assertRaises(RuntimeError):
+                call_command(
+                    "sync_places", base_url=stub.base_url, rows=3, rate=0, langs="ko",
+                    checkpoint=self.checkpoint_path, stdout=StringIO()
+                )
+
+        run = SyncRun.objects.get()
+        self.assertEqual((run.status, run.error), (SyncRun.STATUS_FAILED, "boom"))
+        self.assertIsNotNone(run.finished_at)
+        self.assertIn("parse", run.metrics["stages"])
+
+    def test_command_should_map_categories_and_report_unmapped_codes(self):
+        culture = Category.objects.create()
+        history = SubCategory.objects.create(category=culture)
+        nature = Category.objects.create()
+        CategoryCodeMapping.objects.create(cat_code="A0201", category=culture, sub_category=history)
+        CategoryCodeMapping.objects.create(content_type_id="12", cat_code="A01", category=nature)
+
+        with TourAPIStub() as stub:
+            for item in stub.items:
+                if item["contentid"] == "126078":
+                    item.update(cat1="A01", cat2="A0101", cat3="A01011200")
+                if item["contentid"] == "126498":
+                    item.update(contenttypeid="38", cat1="A04", cat2="A0401", cat3="A04010100")
+            call_command(
+                "sync_places", base_url=stub.base_url, rows=3, rate=0, langs="ko",
+                checkpoint=self.checkpoint_path, stdout=StringIO()
+            )
+
+        gyeongbokgung = Place.objects.get(content_id="126508")
+        self.assertEqual((gyeongbokgung.category_id, gyeongbokgung.sub_category_id), (culture.id, history.id))
+        haeundae = Place.objects.get(content_id="126078")
+        self.assertEqual((haeundae.category_id, haeundae.sub_category_id), (nature.id, None))
+        self.assertIsNone(Place.objects.get(content_id="126498").category_id)
+        self.assertEqual(SyncRun.objects.get().report["unmapped_categories"], [
+            {"content_type_id": "38", "cat_code": "A04010100", "count": 1}
+        ])
+
+    def test_sync_should_record_stage_metrics(self):
+        with TourAPIStub() as stub:
+            stub.failures = {2: 1}
+            syncer = self.make_syncer(stub)
+            syncer.run()
+
+        counters = syncer.metrics.counters
+        self.assertEqual((counters["requests"], counters["retries"]), (5, 1))
+        self.assertEqual((counters["pages"], counters["items"]), (4, 8))
+        self.assertGreater(counters["bytes"], 0)
+        self.assertGreater(counters["queries"], 0)
+        self.assertGreater(syncer.elapsed, 0)
+        for stage in ["fetch", "parse", "locate", "store", "db"]:
+            self.assertIn(stage, syncer.metrics.timings)
+
+    def test_command_should_save_metrics_for_report(self):
+        with TourAPIStub() as stub:
+            call_command(
+                "sync_places", base_url=stub.base_url, rows=3, rate=0, langs="ko",
+                checkpoint=self.checkpoint_path, stdout=StringIO()
+            )
+
+        metrics = SyncRun.objects.get().metrics
+        self.assertEqual(metrics["counters"]["items"], 8)
+        self.assertGreater(metrics["rows_per_second"], 0)
+        self.assertIn("images", metrics["stages"])
+
+        out = StringIO()
+        call_command("sync_report", stdout=out)
+        self.assertIn("8행", out.getvalue())
+        self.assertIn("비교할 이전 실행이 없습니다", out.getvalue())
+
+    def test_command_should_reject_unknown_language(self):
+        with self.assertRaises(CommandError):
+            call_command("sync_places", langs="ko,xx", stdout=StringIO())
+
+
+# 여러 언어 서비스 동시 동기화 테스트
+class MultiLanguageSyncTest(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.checkpoint_path = os.path.join(self.temp_dir.name, "checkpoint.json")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def make_syncer(self, stub, langs=("ko", "en", "jp", "cn"), num_of_rows=2, **options):
+        client = TourAPIClient(base_url=stub.base_url, service_key="test-key", rate=0, backoff=0.01, max_retries=0)
+        return PlaceSyncer(
+            client, num_of_rows=num_of_rows, workers=4, checkpoint_path=self.checkpoint_path, langs=langs, **options
+        )
+
+    def test_sync_should_merge_translations_on_content_id(self):
+        with TourAPIStub() as stub:
+            syncer = self.make_syncer(stub)
+            stats = syncer.run()
+
+        self.assertEqual(stats.inserted, 8)
+        # 국문 8 + 영문 7 + 일문 3 + 중문 3 (국문에 없는 영문 1개는 제외)
+        self.assertEqual(stats.translations_written, 21)
+        self.assertEqual(PlaceTranslation.objects.count(), 21)
+        self.assertEqual(syncer.unmatched, 1)
+        self.assertFalse(Place.objects.filter(content_id="9990001").exists())
+
+        gyeongbokgung = Place.objects.get(content_id="126508")
+        self.assertEqual(gyeongbokgung.get_name("ko"), "경복궁")
+        self.assertEqual(gyeongbokgung.get_name("en"), "Gyeongbokgung Palace")
+        self.assertEqual(gyeongbokgung.get_name("jp"), "景福宮")
+        self.assertEqual(gyeongbokgung.get_name("cn"), "景福宫")
+        self.assertFalse(os.path.exists(self.checkpoint_path))
+
+    # 큰 페이지도 batch_size개씩 나눠 저장하고 결과는 같음
+    def test_large_pages_should_be_stored_in_batches(self):
+        with TourAPIStub() as stub:
+            syncer = self.make_syncer(stub, num_of_rows=100, batch_size=3)
+            stats = syncer.run()
+
+        self.assertEqual(sum(stub.service_requests.values()), 4)
+        self.assertEqual((stats.inserted, stats.translations_written, syncer.unmatched), (8, 21, 1))
+        self.assertFalse(os.path.exists(self.checkpoint_path))
+
+    # 관광지보다 먼저 도착한 번역은 관광지 페이지와 함께 저장되고, 그때 페이지가 완료됨
+    def test_translation_page_before_place_page_should_wait(self):
+        with TourAPIStub() as stub:
+            en_items = stub.localized["EngService1"][:2]
+            ko_items = stub.items[:2]
+        syncer = self.make_syncer(stub, langs=("ko", "en"))
+
+        syncer.store_page("en", 1, en_items)
+        self.assertEqual(PlaceTranslation.objects.count(), 0)
+        self.assertEqual(syncer.checkpoint.completed_pages["en"], set())
+
+        with self.assertNumQueries(9):
+            syncer.store_page("ko", 1, ko_items)
+
+        self.assertEqual(PlaceTranslation.objects.filter(lang="en").count(), 2)
+        self.assertEqual(syncer.checkpoint.completed_pages, {"ko": {1}, "en": {1}})
+
+    # 한 언어만 실패하면 그 언어 페이지만 다시 가져옴
+    def test_failed_language_should_resume_alone(self):
+        with TourAPIStub() as stub:
+            stub.failures = {("EngService1", 1): -1}
+            with self.assertRaises(SyncError) as context:
+                self.make_syncer(stub).run()
+            self.assertEqual(list(context.exception.failed_pages), ["en:1"])
+
+            stub.failures = {}
+            stub.service_requests.clear()
+            stats = self.make_syncer(stub).run()
+
+        self.assertEqual(dict(stub.service_requests), {"EngService1": 4})
+        self.assertEqual(stats.inserted, 0)
+        self.assertEqual(PlaceTranslation.objects.filter(lang="en").count(), 7)
+
+
+# 동기화 성능 비교 테스트
+class SyncReportTest(TestCase):
+
+    def make_metrics(self, rows_per_second, parse, items=10000):
+        return {
+            "elapsed": items / rows_per_second,
+            "rows_per_second": rows_per_second,
+            "stages": {"fetch": items / 500, "parse": parse},
+            "counters": {"items": items, "requests": 10},
+        }
+
+    def make_run(self, metrics, status=SyncRun.STATUS_SUCCESS):
+        return SyncRun.objects.create(kind=SyncRun.KIND_FULL, scope="all", status=status, metrics=metrics)
+
+    def test_find_regressions_should_compare_with_median(self):
+        previous = [self.make_metrics(1000, 1.0), self.make_metrics(1100, 1.2), self.make_metrics(200, 9.0)]
+
+        self.assertEqual(find_regressions(self.make_metrics(1000, 1.1), previous, 0.2), [])
+        self.assertEqual(find_regressions(self.make_metrics(500, 3.0), previous, 0.2), [
+            ("rows_per_second", 1000, 500), ("parse", 0.12, 0.3)
+        ])
+
+    # 행 수가 달라도 1000행당 시간으로 비교
+    def test_find_regressions_should_scale_by_rows(self):
+        previous = [self.make_metrics(1000, 1.0, items=10000)]
+        self.assertEqual(find_regressions(self.make_metrics(1000, 0.2, items=2000), previous, 0.2), [])
+
+    def test_report_should_warn_about_slower_stages(self):
+        self.make_run(self.make_metrics(1000, 1.0))
+        self.make_run(self.make_metrics(1000, 1.0))
+        self.make_run(self.make_metrics(10, 50.0), status=SyncRun.STATUS_FAILED)
+        latest = self.make_run(self.make_metrics(1000, 5.0))
+
+        out = StringIO()
+        call_command("sync_report", stdout=out)
+
+        output = out.getvalue()
+        self.assertEqual(output.count("10,000행"), 4)
+        self.assertIn(f"⚠️ #{latest.id} parse 1000행당 0.10s → 0.50s (+400%) (이전 2회 중앙값 대비)", output)
+        self.assertNotIn("처리 속도", output)
+
+    def test_report_without_metrics(self):
+        SyncRun.objects.create(kind=SyncRun.KIND_FULL, scope="all")
+
+        out = StringIO()
+        call_command("sync_report", stdout=out)
+        self.assertIn("성능 지표가 있는 동기화 기록이 없습니다", out.getvalue())
@@ -0,0 +1,81 @@
+from datetime import timedelta
+from decimal import Decimal
+from django.test import TestCase
+from django.utils import timezone
+from places.models import Place, PlaceTranslation
+from places.upsert import upsert_places
+
+
+def make_records(count, name_suffix="", phone="02-000-0000"):
+    return [
+        (
+            f"content_{index}",
+            {"latitude": Decimal("37.5"), "longitude": Decimal("127.0"), "phone_number": phone, "region_code": "1"},
+            {"name": f"관광지{index}{name_suffix}", "address": "서울"},
+        )
+        for index in range(count)
+    ]
+
+
+# 관광지 일괄 저장 테스트
+class UpsertPlacesTest(TestCase):
+
+    def test_first_sync_should_insert_everything(self):
+        stats = upsert_places(make_records(5))
+
+        self.assertEqual((stats.inserted, stats.updated, stats.unchanged), (5, 0, 0))
+        self.assertEqual(stats.translations_written, 5)
+        self.assertEqual(Place.objects.count(), 5)
+        self.assertEqual(Place.objects.get(content_id="content_3").get_name("ko"), "관광지3")
+
+    def test_same_data_should_only_touch_last_synced_at(self):
+        upsert_places(make_records(5), synced_at=timezone.now() - timedelta(days=1))
+        before = {place.content_id: place.updated_at for place in Place.objects.all()}
+
+        synced_at = timezone.now()
+        stats = upsert_places(make_records(5), synced_at=synced_at)
+
+        self.assertEqual((stats.inserted, stats.updated, stats.unchanged), (0, 0, 5))
+        self.assertEqual(stats.translations_written, 0)
+        for place in Place.objects.all():
+            self.assertEqual(place.last_synced_at, synced_at)
+            self.assertEqual(place.updated_at, before[place.content_id])
+
+    def test_changed_rows_should_be_updated(self):
+        upsert_places(make_records(5))
+        created_at = Place.objects.get(content_id="content_0").created_at
+
+        records = make_records(5)
+        records[0][1]["phone_number"] = "02-999-9999"
+        records[1][2]["name"] = "새 이름"
+        records.append(("content_new", {"region_code": "6"}, {"name": "신규", "address": ""}))
+        stats = upsert_places(records)
+
+        self.assertEqual((stats.inserted, stats.updated, stats.unchanged), (1, 1, 4))
+        self.assertEqual(stats.translations_written, 2)
+
+        changed = Place.objects.get(content_id="content_0")
+        self.assertEqual(changed.phone_number, "02-999-9999")
+        self.assertEqual(changed.created_at, created_at)
+        self.assertEqual(Place.objects.get(content_id="content_1").get_name("ko"), "새 이름")
+        self.assertEqual(PlaceTranslation.objects.count(), 6)
+
+    def test_other_language_should_be_separate_row(self):
+        upsert_places(make_records(3))
+        upsert_places(make_records(3, name_suffix="-en"), lang="en")
+
+        place = Place.objects.get(content_id="content_2")
+        self.assertEqual(place.get_name("ko"), "관광지2")
+        self.assertEqual(place.get_name("en"), "관광지2-en")
+
+    # 배치 크기 안에서는 행 수와 무관하게 쿼리 수가 일정 (행마다 save() 하지 않음)
+    def test_query_count_should_not_depend_on_row_count(self):
+        upsert_places(make_records(10))
+
+        records = make_records(40, phone="02-111-1111")
+        # 바뀐 관광지 변경 기록은 관광지/번역을 합쳐서 INSERT 한 번
+        with self.assertNumQueries(8):
+            stats = upsert_places(records)
+
+        self.assertEqual((stats.inserted, stats.updated), (30, 10))
+        self.assertGreater(stats.throughput, 0)
@@ -0,0 +1,126 @@
+import base64
+import json
+from datetime import timedelta
+from django.utils import timezone
+from rest_framework.test import APITestCase
+from rest_framework import status
+from places.models import Place, PlaceTranslation
+
+LANGS = ["ko", "en", "jp", "cn"]
+
+
+def create_place(content_id, favorite_count=0, **fields):
+    place = Place.objects.create(content_id=content_id, favorite_count=favorite_count, **fields)
+    for lang in LANGS:
+        PlaceTranslation.objects.create(
+            place=place,
+            lang=lang,
+            name=f"{content_id}-{lang}",
+            description=f"설명-{lang}",
+            address=f"주소-{lang}"
+        )
+    return place
+
+
+# 관광지 목록 API 테스트
+class PlacesAPITest(APITestCase):
+
+    def setUp(self):
+        self.places = [
+            create_place(
+                f"place_{index}",
+                favorite_count=index % 3,
+                region_id=1 if index % 2 == 0 else 2,
+                region_code="11" if index % 2 == 0 else "26",
+                category_id=10 + index % 2,
+                sub_category_id=100 + index % 4
+            )
+            for index in range(7)
+        ]
+        # 최신순 검증용 생성일시 - 일괄 저장처럼 모두 같은 밀리초 안에서 100µs씩 차이
+        now = timezone.now().replace(microsecond=0)
+        for index, place in enumerate(self.places):
+            created_at = now + timedelta(microseconds=100 * (len(self.places) - 1 - index))
+            Place.objects.filter(id=place.id).update(created_at=created_at)
+
+    def fetch_all_pages(self, url):
+        ids = []
+        next_cursor = None
+        while True:
+            page_url = url if next_cursor is None else f"{url}&cursor={next_cursor}"
+            with self.assertNumQueries(1):
+                response = self.client.get(page_url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            ids.extend(place["id"] for place in response.data["places"])
+            next_cursor = response.data["next_cursor"]
+            if next_cursor is None:
+                return ids
+
+    def test_popular_pages_should_cover_all_rows_in_order(self):
+        ids = self.fetch_all_pages("/api/places/?lang=en&limit=2")
+
+        expected = [p.id for p in sorted(self.places, key=lambda p: (-p.favorite_count, -p.id))]
+        self.assertEqual(ids, expected)
+
+    def test_recent_pages_should_cover_all_rows_in_order(self):
+        ids = self.fetch_all_pages("/api/places/?lang=en&limit=3&sort=recent")
+        self.assertEqual(ids, [place.id for place in self.places])
+
+    def test_filters_should_be_applied(self):
+        cases = {
+            "region_id=2": lambda p: p.region_id == 2,
+            "region_code=11": lambda p: p.region_code == "11",
+            "category_id=10": lambda p: p.category_id == 10,
+            "sub_category_id=101": lambda p: p.sub_category_id == 101,
+            "region_id=1&category_id=10": lambda p: p.region_id == 1 and p.category_id == 10,
+        }
+        for query, matches in cases.items():
+            ids = self.fetch_all_pages(f"/api/places/?lang=ko&limit=2&{query}")
+            self.assertEqual(sorted(ids), sorted(p.id for p in self.places if matches(p)), query)
+
+    def test_list_should_use_requested_language(self):
+        response = self.client.get("/api/places/?lang=jp&limit=1")
+
+        place = response.data["places"][0]
+        self.assertTrue(place["name"].endswith("-jp"))
+        self.assertEqual(place["address"], "주소-jp")
+        self.assertNotIn("description", place)
+
+    def test_missing_translation_should_return_empty_name(self):
+        place = Place.objects.create(content_id="no_translation", favorite_count=99)
+
+        response = self.client.get("/api/places/?lang=en&limit=1")
+        self.assertEqual(response.data["places"][0]["id"], place.id)
+        self.assertEqual(response.data["places"][0]["name"], "")
+
+    def test_invalid_params_should_return_400(self):
+        for query in ["lang=fr", "sort=name", "limit=0", "limit=abc", "region_id=abc", "cursor=not-a-cursor"]:
+            response = self.client.get(f"/api/places/?{query}")
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST, query)
+
+    # 형식은 맞지만 값의 타입이 틀린 커서
+    def test_tampered_cursor_values_should_return_400(self):
+        for sort, values in [("popular", ["abc", 1]), ("popular", [[1], 2]), ("recent", ["어제", 1])]:
+            cursor = base64.urlsafe_b64encode(json.dumps(values).encode()).decode()
+            response = self.client.get(f"/api/places/?sort={sort}&cursor={cursor}")
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST, values)
+
+
+# 관광지 상세 API 테스트
+class PlaceDetailAPITest(APITestCase):
+
+    def setUp(self):
+        self.place = create_place("detail_place", phone_number="02-1234-5678")
+
+    def test_detail_should_return_single_language_in_one_query(self):
+        with self.assertNumQueries(1):
+            response = self.client.get(f"/api/places/{self.place.id}/?lang=en")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["place"]["name"], "detail_place-en")
+        self.assertEqual(response.data["place"]["description"], "설명-en")
+        self.assertEqual(response.data["place"]["phone_number"], "02-1234-5678")
+
+    def test_missing_place_should_return_404(self):
+        response = self.client.get("/api/places/9999/?lang=ko")
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
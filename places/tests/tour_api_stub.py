@@ -0,0 +1,112 @@
+import json
+import os
+import threading
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), "fixtures")
+
+# 언어별 서비스의 녹화 응답 (국문 서비스는 fixture 인자)
+LOCALIZED_FIXTURES = {
+    "EngService1": "tour_api_area_based_list_en.json",
+    "JpnService1": "tour_api_area_based_list_jp.json",
+    "ChsService1": "tour_api_area_based_list_cn.json",
+}
+
+
+def load_fixture(name):
+    with open(os.path.join(FIXTURES_DIR, name), encoding="utf-8") as f:
+        return json.load(f)
+
+
+class TourAPIStub:
+    """녹화한 TourAPI 응답을 페이지 단위로 잘라서 돌려주는 로컬 HTTP 서버 (테스트용)
+
+    items는 국문 서비스, localized는 {서비스 이름: 아이템 목록}인 다른 언어 서비스 응답
+    failures에 {페이지 번호 또는 (서비스 이름, 페이지 번호): 실패 횟수}를 넣으면 그 횟수만큼 500 응답 (-1이면 계속 실패)
+    hidden의 content_id는 목록에서 빠지고, 동기화 목록(areaBasedSyncList1)에는 showflag=0으로 나옴
+    requests는 페이지 번호별, service_requests는 서비스별 요청 수
+    """
+
+    def __init__(self, fixture="tour_api_area_based_list.json"):
+        self.items = load_fixture(fixture)["response"]["body"]["items"]["item"]
+        self.localized = {
+            service: load_fixture(name)["response"]["body"]["items"]["item"]
+            for service, name in LOCALIZED_FIXTURES.items()
+        }
+        self.failures = {}
+        self.hidden = set()
+        self.requests = Counter()
+        self.service_requests = Counter()
+        self.lock = threading.Lock()
+
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                status, body = stub.handle(self.path)
+                payload = json.dumps(body, ensure_ascii=False).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json;charset=UTF-8")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.base_url = f"http://127.0.0.1:{self.server.server_port}"
+
+    def handle(self, path):
+        url = urlparse(path)
+        query = {key: values[0] for key, values in parse_qs(url.query).items()}
+        page_no = int(query.get("pageNo", 1))
+        num_of_rows = int(query.get("numOfRows", 10))
+        # 경로는 /{서비스 이름}/{오퍼레이션}
+        service, operation = (["KorService1"] + url.path.strip("/").split("/"))[-2:]
+
+        with self.lock:
+            self.requests[page_no] += 1
+            self.service_requests[service] += 1
+            key = (service, page_no) if (service, page_no) in self.failures else page_no
+            remaining = self.failures.get(key, 0)
+            if remaining:
+                self.failures[key] = remaining - 1 if remaining > 0 else remaining
+                return 500, {"error": "stub failure"}
+
+        items = self.list_items(self.localized.get(service, self.items), operation, query)
+        page_items = items[(page_no - 1) * num_of_rows:page_no * num_of_rows]
+        return 200, {
+            "response": {
+                "header": {"resultCode": "0000", "resultMsg": "OK"},
+                "body": {
+                    "items": {"item": page_items} if page_items else "",
+                    "numOfRows": num_of_rows,
+                    "pageNo": page_no,
+                    "totalCount": len(items),
+                },
+            }
+        }
+
+    def list_items(self, items, operation, query):
+        if operation != "areaBasedSyncList1":
+            return [item for item in items if item["contentid"] not in self.hidden]
+
+        # 동기화 목록은 modifiedtime(YYYYMMDD) 이후 변경분만
+        since = query.get("modifiedtime", "")
+        return [
+            {**item, "showflag": "0" if item["contentid"] in self.hidden else "1"}
+            for item in items
+            if item["modifiedtime"][:len(since)] >= since
+        ]
+
+    def __enter__(self):
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def __exit__(self, *args):
+        self.server.shutdown()
+        self.server.server_close()
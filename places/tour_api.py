@@ -0,0 +1,253 @@
+import random
+import tempfile
+import threading
+import time
+
+import ijson
+import requests
+from ijson.common import ObjectBuilder
+from places.metrics import SyncMetrics
+from requests.adapters import HTTPAdapter
+from django.conf import settings
+
+# 성공 응답 코드 (서비스 버전에 따라 "0000" 또는 "00")
+SUCCESS_CODES = {"0000", "00", "0"}
+
+# 재시도해도 소용없는 오류 (키/권한 문제)
+FATAL_ERRORS = [
+    "SERVICE_KEY_IS_NOT_REGISTERED_ERROR",
+    "SERVICE_ACCESS_DENIED_ERROR",
+    "NO_OPENAPI_SERVICE_ERROR",
+]
+
+# 재시도할 HTTP 상태 코드
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+# 목록 응답을 받아두는 임시 파일 (이 크기까지는 메모리, 넘으면 디스크)
+SPOOL_MAX_BYTES = 1024 * 1024
+READ_CHUNK_SIZE = 64 * 1024
+
+# 목록 아이템 위치 (여러 개면 배열, 1개면 객체 하나로 옴)
+ITEM_PREFIXES = {"response.body.items.item", "response.body.items.item.item"}
+
+
+class TourAPIError(Exception):
+    """TourAPI 호출 실패 (retryable=False면 재시도하지 않음)"""
+
+    def __init__(self, message, retryable=True):
+        super().__init__(message)
+        self.retryable = retryable
+
+
+class RateLimiter:
+    """초당 요청 수 제한 (여러 스레드가 공유, 요청 간격을 일정하게 유지)"""
+
+    def __init__(self, rate):
+        self.interval = 1.0 / rate if rate else 0
+        self._next_time = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self):
+        """다음 요청 차례까지 대기하고 대기한 시간(초) 반환"""
+        if not self.interval:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            wait_time = self._next_time - now
+            self._next_time = max(now, self._next_time) + self.interval
+        if wait_time > 0:
+            time.sleep(wait_time)
+            return wait_time
+        return 0.0
+
+
+class TourAPIClient:
+    """한국관광공사 TourAPI 클라이언트 (커넥션 풀 세션 + 요청 속도 제한 + 백오프 재시도)
+
+    요청/재시도 수, 받은 바이트, 속도 제한 대기 시간은 metrics에 기록 (동기화 실행마다 바꿔 끼움)
+    """
+
+    def __init__(self, base_url=None, service_key=None, rate=10, max_retries=4,
+                 backoff=0.5, timeout=15, pool_size=10):
+        self.base_url = (base_url or settings.TOUR_API_BASE_URL).rstrip("/")
+        self.service_key = service_key if service_key is not None else settings.TOUR_API_SERVICE_KEY
+        self.rate_limiter = RateLimiter(rate)
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.timeout = timeout
+        self.metrics = SyncMetrics()
+
+        # 스레드들이 같은 세션의 커넥션을 재사용
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def close(self):
+        self.session.close()
+
+    def _send(self, operation, params, stream=False):
+        """요청 후 상태 코드 확인 (재시도할 오류는 retryable TourAPIError)"""
+        self.metrics.add_time("throttle", self.rate_limiter.wait())
+        self.metrics.incr("requests")
+        query = {
+            "serviceKey": self.service_key,
+            "MobileOS": "ETC",
+            "MobileApp": "KORIP",
+            "_type": "json",
+            **params,
+        }
+        try:
+            response = self.session.get(
+                f"{self.base_url}/{operation}", params=query, timeout=self.timeout, stream=stream
+            )
+        except requests.RequestException as e:
+            raise TourAPIError(f"{operation} 연결 실패: {e}")
+
+        if response.status_code != 200:
+            response.close()
+            raise TourAPIError(
+                f"{operation} HTTP {response.status_code}",
+                retryable=response.status_code in RETRY_STATUS_CODES
+            )
+        return response
+
+    def _request(self, operation, params):
+        response = self._send(operation, params)
+        self.metrics.incr("bytes", len(response.content))
+
+        # 키 오류 등은 JSON이 아닌 XML로 내려옴
+        check_fatal_error(operation, response.text)
+        try:
+            data = response.json()
+        except ValueError:
+            raise TourAPIError(f"{operation} JSON이 아닌 응답: {response.text[:100]}")
+
+        header = data.get("response", {}).get("header", {})
+        if header.get("resultCode") not in SUCCESS_CODES:
+            raise TourAPIError(f"{operation} 오류 응답: {header.get('resultCode')} {header.get('resultMsg')}")
+        return data["response"].get("body", {})
+
+    def _request_page(self, operation, params):
+        """목록 응답을 임시 파일로 받고 헤더/전체 개수만 스트리밍 파싱으로 확인 → PageStream"""
+        spool = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_BYTES)
+        try:
+            with self._send(operation, params, stream=True) as response:
+                try:
+                    for chunk in response.iter_content(READ_CHUNK_SIZE):
+                        spool.write(chunk)
+                        self.metrics.incr("bytes", len(chunk))
+                except requests.RequestException as e:
+                    raise TourAPIError(f"{operation} 응답 수신 실패: {e}")
+
+            spool.seek(0)
+            head = spool.read(READ_CHUNK_SIZE)
+            if head.lstrip()[:1] == b"<":
+                text = head.decode("utf-8", "replace")
+                check_fatal_error(operation, text)
+                raise TourAPIError(f"{operation} JSON이 아닌 응답: {text[:100]}")
+
+            spool.seek(0)
+            header, total_count = scan_page(operation, spool)
+            if header.get("resultCode") not in SUCCESS_CODES:
+                raise TourAPIError(f"{operation} 오류 응답: {header.get('resultCode')} {header.get('resultMsg')}")
+        except BaseException:
+            spool.close()
+            raise
+        return PageStream(spool, total_count)
+
+    def _with_retries(self, request, operation, params):
+        """일시적 오류는 지수 백오프로 재시도"""
+        attempt = 0
+        while True:
+            try:
+                return request(operation, params)
+            except TourAPIError as e:
+                if not e.retryable or attempt >= self.max_retries:
+                    raise
+                self.metrics.incr("retries")
+                # 지수 백오프 + 지터 (여러 스레드가 동시에 재시도하지 않게)
+                time.sleep(self.backoff * (2 ** attempt) * (0.5 + random.random()))
+                attempt += 1
+
+    def get(self, operation, **params):
+        """API 호출 후 응답 body 반환 (일시적 오류는 지수 백오프로 재시도)"""
+        return self._with_retries(self._request, operation, params)
+
+    def get_page(self, operation, page_no, num_of_rows, **params):
+        """목록 API 한 페이지 조회 → (아이템 목록, 전체 개수)"""
+        body = self.get(operation, pageNo=page_no, numOfRows=num_of_rows, **params)
+        return get_items(body), int(body.get("totalCount") or 0)
+
+    def stream_page(self, operation, page_no, num_of_rows, **params):
+        """목록 API 한 페이지를 본문 전체를 메모리에 올리지 않고 조회 → PageStream (다 쓰면 close)"""
+        return self._with_retries(
+            self._request_page, operation, {"pageNo": page_no, "numOfRows": num_of_rows, **params}
+        )
+
+
+class PageStream:
+    """임시 파일로 받아둔 목록 페이지 (순회할 때마다 아이템을 하나씩 파싱)"""
+
+    def __init__(self, file, total_count):
+        self.file = file
+        self.total_count = total_count
+
+    def __iter__(self):
+        self.file.seek(0)
+        return iter_items(self.file)
+
+    def close(self):
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+def check_fatal_error(operation, text):
+    for error in FATAL_ERRORS:
+        if error in text:
+            raise TourAPIError(f"{operation} {error}", retryable=False)
+
+
+def scan_page(operation, file):
+    """목록 응답 전체를 아이템을 만들지 않고 훑어서 (header, 전체 개수) 반환 (잘린 응답이면 TourAPIError)"""
+    header = {}
+    total_count = 0
+    try:
+        for prefix, event, value in ijson.parse(file):
+            if prefix in ("response.header.resultCode", "response.header.resultMsg"):
+                header[prefix.rsplit(".", 1)[1]] = str(value)
+            elif prefix == "response.body.totalCount" and value not in (None, ""):
+                total_count = int(value)
+    except (ijson.JSONError, ValueError) as e:
+        raise TourAPIError(f"{operation} 잘못된 JSON 응답: {e}")
+    return header, total_count
+
+
+def iter_items(file):
+    """목록 응답에서 아이템을 하나씩 만들어 반환 (한 번에 아이템 하나만 메모리에 올라감)"""
+    builder = None
+    for prefix, event, value in ijson.parse(file, use_float=True):
+        if builder is not None:
+            builder.event(event, value)
+            # 아이템 안의 객체는 prefix가 더 길어서 아이템 끝에서만 맞음
+            if event == "end_map" and prefix == item_prefix:
+                yield builder.value
+                builder = None
+        elif event == "start_map" and prefix in ITEM_PREFIXES:
+            builder = ObjectBuilder()
+            builder.event(event, value)
+            item_prefix = prefix
+
+
+def get_items(body):
+    """응답 body에서 아이템 목록 꺼내기 (결과가 없으면 items가 빈 문자열, 1개면 dict로 옴)"""
+    items = body.get("items") or {}
+    if not isinstance(items, dict):
+        return []
+    item = items.get("item") or []
+    return item if isinstance(item, list) else [item]
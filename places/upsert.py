@@ -0,0 +1,170 @@
+import hashlib
+import json
+import time
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.utils import timezone
+from outbox.changes import collect, record
+from outbox.models import CatalogChange
+from places.models import Place, PlaceTranslation
+
+# 한 번의 INSERT ... ON CONFLICT에 넣을 최대 행 수
+BATCH_SIZE = 500
+
+
+def content_hash(fields):
+    """필드 값 dict의 해시 (키 순서와 무관)"""
+    raw = json.dumps(fields, cls=DjangoJSONEncoder, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+class UpsertStats:
+    """일괄 저장 결과 집계 (추가/변경/동일 행 수, 처리 속도)"""
+
+    def __init__(self):
+        self.inserted = 0
+        self.updated = 0
+        self.unchanged = 0
+        self.translations_written = 0
+        self.elapsed = 0.0
+
+    @property
+    def total(self):
+        return self.inserted + self.updated + self.unchanged
+
+    @property
+    def throughput(self):
+        return self.total / self.elapsed if self.elapsed else 0.0
+
+    def merge(self, other):
+        self.inserted += other.inserted
+        self.updated += other.updated
+        self.unchanged += other.unchanged
+        self.translations_written += other.translations_written
+        self.elapsed += other.elapsed
+
+    def __str__(self):
+        return (
+            f"추가 {self.inserted} / 변경 {self.updated} / 동일 {self.unchanged} "
+            f"(번역 {self.translations_written}행 저장, {self.elapsed:.2f}초, {self.throughput:.0f}행/초)"
+        )
+
+
+def upsert_places(records, lang="ko", synced_at=None):
+    """(content_id, Place 필드, 번역 필드) 목록을 content_id / (place, lang) 기준으로 일괄 저장
+
+    해시가 같은 행은 last_synced_at만 일괄 갱신하고, 바뀐 행만 INSERT ... ON CONFLICT DO UPDATE
+    행 수와 무관하게 배치당 쿼리 수가 일정함 (바뀐 관광지 변경 기록도 INSERT 한 번)
+    """
+    started = time.monotonic()
+    with collect():
+        stats, place_ids = upsert_place_rows(
+            [(content_id, place_fields) for content_id, place_fields, _ in records],
+            synced_at
+        )
+        stats.translations_written = upsert_translations({
+            (place_ids[content_id], lang): translation_fields
+            for content_id, _, translation_fields in records
+        })
+    stats.elapsed = time.monotonic() - started
+    return stats
+
+
+def upsert_place_rows(records, synced_at=None):
+    """(content_id, Place 필드) 목록 일괄 저장 → (UpsertStats, {content_id: place_id})
+
+    추가/변경된 관광지는 변경 기록에 남김 (호출하는 쪽에서 collect()로 묶기)
+    """
+    stats = UpsertStats()
+    synced_at = synced_at or timezone.now()
+
+    # 같은 배치 안에 중복된 content_id는 마지막 값 사용
+    records = dict(records)
+    if not records:
+        return stats, {}
+
+    existing = {
+        content_id: (place_id, place_hash)
+        for content_id, place_id, place_hash in Place.objects.filter(
+            content_id__in=records
+        ).order_by().values_list("content_id", "id", "content_hash")
+    }
+
+    changed_places = []
+    unchanged_ids = []
+    place_fields_names = set()
+    for content_id, place_fields in records.items():
+        place_hash = content_hash(place_fields)
+        place_fields_names.update(place_fields)
+        if content_id in existing and existing[content_id][1] == place_hash:
+            unchanged_ids.append(existing[content_id][0])
+            stats.unchanged += 1
+            continue
+
+        if content_id in existing:
+            stats.updated += 1
+        else:
+            stats.inserted += 1
+        changed_places.append(Place(
+            content_id=content_id,
+            content_hash=place_hash,
+            last_synced_at=synced_at,
+            **place_fields
+        ))
+
+    if changed_places:
+        Place.objects.bulk_create(
+            changed_places,
+            batch_size=BATCH_SIZE,
+            update_conflicts=True,
+            unique_fields=["content_id"],
+            update_fields=sorted(place_fields_names | {"content_hash", "last_synced_at", "updated_at"})
+        )
+    if unchanged_ids:
+        Place.objects.filter(id__in=unchanged_ids).update(last_synced_at=synced_at)
+
+    # 새로 추가된 관광지 ID 조회 (DB마다 bulk_create가 돌려주는 ID가 달라서 다시 조회)
+    place_ids = {content_id: place_id for content_id, (place_id, _) in existing.items()}
+    new_content_ids = [content_id for content_id in records if content_id not in place_ids]
+    if new_content_ids:
+        place_ids.update(
+            Place.objects.filter(content_id__in=new_content_ids).order_by().values_list("content_id", "id")
+        )
+    record(CatalogChange.ENTITY_PLACE, [place_ids[place.content_id] for place in changed_places])
+    return stats, place_ids
+
+
+def upsert_translations(translations):
+    """{(place_id, lang): 번역 필드} 중 해시가 바뀐 것만 한 번에 일괄 저장 (여러 언어 섞여도 됨), 저장한 행 수 반환
+
+    번역이 바뀐 관광지는 변경 기록에 남김 (호출하는 쪽에서 collect()로 묶기)
+    """
+    if not translations:
+        return 0
+    existing = {
+        (place_id, lang): translation_hash
+        for place_id, lang, translation_hash in PlaceTranslation.objects.filter(
+            place_id__in={place_id for place_id, _ in translations},
+            lang__in={lang for _, lang in translations}
+        ).order_by().values_list("place_id", "lang", "content_hash")
+    }
+
+    changed = []
+    field_names = set()
+    for (place_id, lang), fields in translations.items():
+        translation_hash = content_hash(fields)
+        if existing.get((place_id, lang)) == translation_hash:
+            continue
+        field_names.update(fields)
+        changed.append(PlaceTranslation(place_id=place_id, lang=lang, content_hash=translation_hash, **fields))
+
+    if changed:
+        PlaceTranslation.objects.bulk_create(
+            changed,
+            batch_size=BATCH_SIZE,
+            update_conflicts=True,
+            unique_fields=["place", "lang"],
+            update_fields=sorted(field_names | {"content_hash", "updated_at"})
+        )
+        record(CatalogChange.ENTITY_PLACE, {translation.place_id for translation in changed})
+    return len(changed)
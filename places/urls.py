@@ -0,0 +1,11 @@
+from django.urls import path
+from places.views import PlacesAPI, PlacesNearbyAPI, PlacesSearchAPI, PlaceDetailAPI
+
+app_name = "places"
+
+urlpatterns = [
+    path("", PlacesAPI.as_view(), name="places_list"),
+    path("nearby/", PlacesNearbyAPI.as_view(), name="places_nearby"),
+    path("search/", PlacesSearchAPI.as_view(), name="places_search"),
+    path("<int:place_id>/", PlaceDetailAPI.as_view(), name="place_detail"),
+]
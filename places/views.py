@@ -0,0 +1,293 @@
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework import status
+from rest_framework.permissions import AllowAny
+from helper.keyset_pagination import InvalidCursor, KeysetPaginator
+from places.models import Place
+from places.search import search_places
+from places.serializers import PlaceDetailSerializer, PlaceListSerializer, PlaceNearbySerializer, PlaceSearchSerializer
+
+# 정렬별 키셋 페이지네이션 (마지막 id로 동점 구분, Place 복합 인덱스와 같은 순서)
+place_paginators = {
+    "popular": KeysetPaginator(["-favorite_count", "-id"]),
+    "recent": KeysetPaginator(["-created_at", "-id"]),
+}
+
+# 숫자 ID 필터 / 문자열 필터
+ID_FILTERS = ["region_id", "category_id", "sub_category_id"]
+TEXT_FILTERS = ["region_code"]
+
+# 주변 검색 반경 (미터) / 최대 결과 수
+NEARBY_DEFAULT_RADIUS = 1000
+NEARBY_MAX_RADIUS = 20000
+NEARBY_DEFAULT_LIMIT = 20
+NEARBY_MAX_LIMIT = 100
+
+# 검색 최대 결과 수
+SEARCH_DEFAULT_LIMIT = 20
+SEARCH_MAX_LIMIT = 50
+SEARCH_MAX_QUERY_LENGTH = 100
+
+
+def parse_filters(query_params):
+    """쿼리 파라미터에서 목록 필터 추출 (숫자 필터가 숫자가 아니면 ValueError)"""
+    filters = {}
+    for field in ID_FILTERS:
+        value = query_params.get(field)
+        if not value:
+            continue
+        if not value.isdigit():
+            raise ValueError(f"{field}는 숫자여야 합니다.")
+        filters[field] = int(value)
+    for field in TEXT_FILTERS:
+        value = query_params.get(field)
+        if value:
+            filters[field] = value
+    return filters
+
+
+class PlacesAPI(APIView):
+    # 공개 관광지 목록이라 로그인 없이 조회
+    permission_classes = [AllowAny]
+
+    def get(self, request):
+        lang = request.query_params.get("lang", "ko")
+
+        supported_languages = ["ko", "en", "jp", "cn"]
+        if lang not in supported_languages:
+            return Response(
+                {"error": f"지원하지 않는 언어입니다. 지원 언어: {', '.join(supported_languages)}"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        sort = request.query_params.get("sort", "popular")
+        paginator = place_paginators.get(sort)
+        if paginator is None:
+            return Response(
+                {"error": f"지원하지 않는 정렬입니다. 지원 정렬: {', '.join(place_paginators)}"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        try:
+            limit = paginator.get_limit(request.query_params.get("limit"))
+        except ValueError:
+            return Response(
+                {"error": f"limit은 1~{paginator.max_limit} 사이의 숫자여야 합니다."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        try:
+            filters = parse_filters(request.query_params)
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            # 요청 언어의 번역 한 행만 JOIN 해서 페이지당 쿼리 1번 (중복으로 연결된 관광지는 제외)
+            places_queryset = Place.objects.canonical().filter(**filters).with_translation(lang, "name", "address")
+
+            try:
+                places, next_cursor = paginator.paginate(
+                    places_queryset,
+                    cursor=request.query_params.get("cursor"),
+                    limit=limit
+                )
+            except InvalidCursor as e:
+                return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+            serializer = PlaceListSerializer(
+                places,
+                many=True,
+                context={"lang": lang}
+            )
+            return Response(
+                {"places": serializer.data, "next_cursor": next_cursor},
+                status=status.HTTP_200_OK
+            )
+
+        except Exception as e:
+            return Response(
+                {"error": "관광지 목록 조회 중 오류가 발생했습니다."},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+
+class PlacesNearbyAPI(APIView):
+    permission_classes = [AllowAny]
+
+    def get(self, request):
+        lang = request.query_params.get("lang", "ko")
+
+        supported_languages = ["ko", "en", "jp", "cn"]
+        if lang not in supported_languages:
+            return Response(
+                {"error": f"지원하지 않는 언어입니다. 지원 언어: {', '.join(supported_languages)}"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        try:
+            lat = float(request.query_params["lat"])
+            lng = float(request.query_params["lng"])
+            if not (-90 <= lat <= 90 and -180 <= lng <= 180):
+                raise ValueError
+        except (KeyError, ValueError):
+            return Response(
+                {"error": "lat(-90~90)과 lng(-180~180)을 숫자로 입력해주세요."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        try:
+            radius = float(request.query_params.get("radius") or NEARBY_DEFAULT_RADIUS)
+            if not 0 < radius <= NEARBY_MAX_RADIUS:
+                raise ValueError
+        except ValueError:
+            return Response(
+                {"error": f"radius는 0~{NEARBY_MAX_RADIUS} 사이의 미터 값이어야 합니다."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        try:
+            limit = int(request.query_params.get("limit") or NEARBY_DEFAULT_LIMIT)
+            if not 1 <= limit <= NEARBY_MAX_LIMIT:
+                raise ValueError
+        except ValueError:
+            return Response(
+                {"error": f"limit은 1~{NEARBY_MAX_LIMIT} 사이의 숫자여야 합니다."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        try:
+            filters = parse_filters(request.query_params)
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            # 1) 인덱스로 bounding box 안의 좌표만 읽고 거리 계산 → 2) 가까운 limit개만 번역 JOIN 조회
+            nearest = Place.objects.canonical().filter(**filters).nearest_ids(lat, lng, radius, limit)
+            distances = dict(nearest)
+
+            places = {
+                place.id: place
+                for place in Place.objects.filter(id__in=distances).with_translation(lang, "name", "address")
+            }
+            ordered_places = []
+            for place_id, distance in nearest:
+                place = places[place_id]
+                place.distance = distance
+                ordered_places.append(place)
+
+            serializer = PlaceNearbySerializer(
+                ordered_places,
+                many=True,
+                context={"lang": lang}
+            )
+            return Response(
+                {"places": serializer.data},
+                status=status.HTTP_200_OK
+            )
+
+        except Exception as e:
+            return Response(
+                {"error": "주변 관광지 조회 중 오류가 발생했습니다."},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+
+class PlacesSearchAPI(APIView):
+    permission_classes = [AllowAny]
+
+    def get(self, request):
+        lang = request.query_params.get("lang", "ko")
+
+        supported_languages = ["ko", "en", "jp", "cn"]
+        if lang not in supported_languages:
+            return Response(
+                {"error": f"지원하지 않는 언어입니다. 지원 언어: {', '.join(supported_languages)}"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        query = request.query_params.get("q", "").strip()
+        if not query or len(query) > SEARCH_MAX_QUERY_LENGTH:
+            return Response(
+                {"error": f"q는 1~{SEARCH_MAX_QUERY_LENGTH}자의 검색어여야 합니다."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        try:
+            limit = int(request.query_params.get("limit") or SEARCH_DEFAULT_LIMIT)
+            if not 1 <= limit <= SEARCH_MAX_LIMIT:
+                raise ValueError
+        except ValueError:
+            return Response(
+                {"error": f"limit은 1~{SEARCH_MAX_LIMIT} 사이의 숫자여야 합니다."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        try:
+            # 1) 번역 검색 인덱스로 점수 높은 limit개 ID → 2) 그 관광지만 번역 JOIN 조회
+            found = search_places(query, lang, limit)
+            scores = dict(found)
+
+            places = {
+                place.id: place
+                for place in Place.objects.filter(id__in=scores).with_translation(lang, "name", "address")
+            }
+            ordered_places = []
+            for place_id, score in found:
+                place = places[place_id]
+                place.score = score
+                ordered_places.append(place)
+
+            serializer = PlaceSearchSerializer(
+                ordered_places,
+                many=True,
+                context={"lang": lang}
+            )
+            return Response(
+                {"places": serializer.data},
+                status=status.HTTP_200_OK
+            )
+
+        except Exception as e:
+            return Response(
+                {"error": "관광지 검색 중 오류가 발생했습니다."},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+
+class PlaceDetailAPI(APIView):
+    permission_classes = [AllowAny]
+
+    def get(self, request, place_id):
+        lang = request.query_params.get("lang", "ko")
+
+        supported_languages = ["ko", "en", "jp", "cn"]
+        if lang not in supported_languages:
+            return Response(
+                {"error": f"지원하지 않는 언어입니다. 지원 언어: {', '.join(supported_languages)}"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        try:
+            place = (
+                Place.objects
+                .with_translation(lang, "name", "address", "description")
+                .filter(id=place_id)
+                .first()
+            )
+            if place is None:
+                return Response(
+                    {"error": "존재하지 않는 관광지입니다."},
+                    status=status.HTTP_404_NOT_FOUND
+                )
+
+            serializer = PlaceDetailSerializer(place, context={"lang": lang})
+            return Response(
+                {"place": serializer.data},
+                status=status.HTTP_200_OK
+            )
+
+        except Exception as e:
+            return Response(
+                {"error": "관광지 상세 정보 조회 중 오류가 발생했습니다."},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
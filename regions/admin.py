@@ -1,4 +1,5 @@
 from django.contrib import admin
+from django.db.models import Count, Prefetch
 from regions.models import Region, SubRegion, RegionTranslation, SubRegionTranslation
 
 
@@ -30,17 +31,18 @@ class RegionAdmin(admin.ModelAdmin):
     readonly_fields = ["created_at", "updated_at"]
     inlines = [RegionTranslationInline, SubRegionInline]
 
+    def get_queryset(self, request):
+        return super().get_queryset(request).with_translations("ko").annotate(
+            subregion_count=Count("subregions")
+        )
+
     def get_korean_name(self, obj):
-        try:
-            korean_translation = obj.translations.get(lang="ko")
-            return korean_translation.name
-        except RegionTranslation.DoesNotExist:
-            return f"Region {obj.id}"
+        return obj.get_name("ko") or f"Region {obj.id}"
 
     get_korean_name.short_description = "지역명 (한국어)"
 
     def get_subregion_count(self, obj):
-        return obj.subregions.count()
+        return obj.subregion_count
 
     get_subregion_count.short_description = "지역구 수"
 
@@ -64,21 +66,20 @@ class SubRegionAdmin(admin.ModelAdmin):
     ]
     inlines = [SubRegionTranslationInline]
 
+    def get_queryset(self, request):
+        return super().get_queryset(request).with_translations("ko").prefetch_related(
+            Prefetch("region", queryset=Region.objects.with_translations("ko"))
+        )
+
     def get_korean_name(self, obj):
-        try:
-            korean_translation = obj.translations.get(lang="ko")
-            return korean_translation.name
-        except SubRegionTranslation.DoesNotExist:
-            return f"SubRegion {obj.id}"
+        return obj.get_name("ko") or f"SubRegion {obj.id}"
 
     get_korean_name.short_description = "지역구명 (한국어)"
 
     def get_region_name(self, obj):
-        try:
-            region_translation = obj.region.translations.get(lang="ko")
-            return region_translation.name
-        except (RegionTranslation.DoesNotExist, AttributeError):
+        if obj.region is None:
             return "지역 없음"
+        return obj.region.get_name("ko") or "지역 없음"
 
     get_region_name.short_description = "소속 지역"
 
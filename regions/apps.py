@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class RegionsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'regions'
+
+    def ready(self):
+        import regions.signals  # noqa: F401
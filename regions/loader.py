@@ -0,0 +1,183 @@
+import json
+from decimal import Decimal
+from pathlib import Path
+
+from django.utils import timezone
+from helper.translation_helper import TranslationDiff
+from outbox.changes import collect, record
+from outbox.models import CatalogChange
+from regions.models import Region, RegionTranslation, SubRegion, SubRegionTranslation
+
+# 지역 기본 데이터 파일 (내용을 바꾸면 version도 올리기)
+DATA_FILE = Path(__file__).resolve().parent / "data" / "regions.json"
+SUPPORTED_VERSIONS = {1}
+
+# 서브지역 필드 중 데이터 파일 값으로 갱신하는 것 (favorite_count는 운영 중 쌓인 값이라 추가할 때만 사용)
+SUBREGION_FIELDS = ["region_id", "latitude", "longitude"]
+
+
+def read_dataset(path=DATA_FILE):
+    """지역 데이터 파일 읽기 (형식이 맞지 않으면 ValueError)"""
+    with open(path, encoding="utf-8") as f:
+        dataset = json.load(f)
+
+    if dataset.get("version") not in SUPPORTED_VERSIONS:
+        raise ValueError(f"지원하지 않는 지역 데이터 버전: {dataset.get('version')}")
+
+    region_ids = {region["id"] for region in dataset["regions"]}
+    keys = set()
+    for subregion in dataset["subregions"]:
+        if subregion["region_id"] not in region_ids:
+            raise ValueError(f"없는 지역 ID를 가리키는 서브지역: {subregion['translations']['ko']['name']}")
+        key = subregion_key(subregion["region_id"], subregion["translations"]["ko"]["name"])
+        if key in keys:
+            raise ValueError(f"중복된 서브지역: {key}")
+        keys.add(key)
+    return dataset
+
+
+def subregion_key(region_id, korean_name):
+    """서브지역은 고정 ID가 없어서 (지역 ID, 한국어 이름)으로 같은 행인지 판단"""
+    return region_id, korean_name
+
+
+def to_decimal(value):
+    return Decimal(str(value)) if value is not None else None
+
+
+class RegionLoadResult:
+    """모델별 추가/수정/삭제 행 수"""
+
+    LABELS = {
+        Region: "Region",
+        RegionTranslation: "RegionTranslation",
+        SubRegion: "SubRegion",
+        SubRegionTranslation: "SubRegionTranslation",
+    }
+
+    def __init__(self):
+        self.counts = {model: {"created": 0, "updated": 0, "deleted": 0} for model in self.LABELS}
+
+    def add(self, model, created=0, updated=0, deleted=0):
+        counts = self.counts[model]
+        counts["created"] += created
+        counts["updated"] += updated
+        counts["deleted"] += deleted
+
+    def add_translations(self, diff):
+        self.add(diff.model, len(diff.to_create), len(diff.to_update), len(diff.to_delete))
+
+    @property
+    def changed(self):
+        return any(any(counts.values()) for counts in self.counts.values())
+
+    def lines(self):
+        return [
+            f"{label}: 추가 {self.counts[model]['created']} / 수정 {self.counts[model]['updated']} "
+            f"/ 삭제 {self.counts[model]['deleted']}"
+            for model, label in self.LABELS.items()
+        ]
+
+
+def load_regions(dataset):
+    """데이터 파일 내용과 현재 지역 데이터를 비교해서 바뀐 행만 한 트랜잭션으로 반영 → RegionLoadResult
+
+    기존 행의 ID와 즐겨찾기 수는 그대로 두고, 데이터 파일에 없는 지역/서브지역만 삭제
+    바뀐 지역/서브지역은 같은 트랜잭션에서 변경 기록에 남김 (삭제는 signal로 기록)
+    """
+    result = RegionLoadResult()
+    with collect():
+        # 지역: 데이터 파일의 ID 기준
+        wanted_region_ids = [region["id"] for region in dataset["regions"]]
+        existing_region_ids = set(Region.objects.values_list("id", flat=True))
+        removed_region_ids = existing_region_ids - set(wanted_region_ids)
+        if removed_region_ids:
+            Region.objects.filter(id__in=removed_region_ids).delete()
+        new_regions = [Region(id=region_id) for region_id in wanted_region_ids if region_id not in existing_region_ids]
+        Region.objects.bulk_create(new_regions)
+        result.add(Region, created=len(new_regions), deleted=len(removed_region_ids))
+        record(CatalogChange.ENTITY_REGION, [region.id for region in new_regions])
+
+        region_translations = TranslationDiff(
+            RegionTranslation,
+            "region",
+            {
+                (region["id"], lang): fields
+                for region in dataset["regions"]
+                for lang, fields in region["translations"].items()
+            },
+            parent_ids=wanted_region_ids
+        )
+        region_translations.apply()
+        result.add_translations(region_translations)
+        record(CatalogChange.ENTITY_REGION, region_translations.changed_parent_ids())
+
+        # 서브지역: (지역 ID, 한국어 이름) 기준 (지역이 지워진 서브지역은 CASCADE로 이미 삭제됨)
+        existing_subregions = {
+            subregion.id: subregion
+            for subregion in SubRegion.objects.order_by().only("id", *SUBREGION_FIELDS)
+        }
+        existing_keys = {
+            subregion_key(existing_subregions[sub_region_id].region_id, name): sub_region_id
+            for sub_region_id, name in SubRegionTranslation.objects.filter(
+                lang="ko", sub_region_id__in=existing_subregions
+            ).values_list("sub_region_id", "name")
+        }
+
+        new_subregions = []
+        changed_subregions = []
+        matched = {}
+        for data in dataset["subregions"]:
+            key = subregion_key(data["region_id"], data["translations"]["ko"]["name"])
+            values = {
+                "region_id": data["region_id"],
+                "latitude": to_decimal(data.get("latitude")),
+                "longitude": to_decimal(data.get("longitude")),
+            }
+            if key not in existing_keys:
+                subregion = SubRegion(favorite_count=data.get("favorite_count", 0), **values)
+                new_subregions.append((subregion, data))
+                continue
+
+            subregion = existing_subregions[existing_keys[key]]
+            matched[subregion.id] = data
+            if any(getattr(subregion, name) != value for name, value in values.items()):
+                for name, value in values.items():
+                    setattr(subregion, name, value)
+                subregion.updated_at = timezone.now()
+                changed_subregions.append(subregion)
+
+        # 한국어 번역이 없거나 데이터 파일에 없는 서브지역은 삭제 (번역은 CASCADE)
+        removed_subregion_ids = set(existing_subregions) - set(matched)
+        if removed_subregion_ids:
+            SubRegion.objects.filter(id__in=removed_subregion_ids).delete()
+        SubRegion.objects.bulk_create([subregion for subregion, _ in new_subregions])
+        if changed_subregions:
+            SubRegion.objects.bulk_update(changed_subregions, SUBREGION_FIELDS + ["updated_at"])
+        result.add(
+            SubRegion,
+            created=len(new_subregions),
+            updated=len(changed_subregions),
+            deleted=len(removed_subregion_ids)
+        )
+        record(
+            CatalogChange.ENTITY_SUBREGION,
+            [subregion.id for subregion, _ in new_subregions] + [subregion.id for subregion in changed_subregions]
+        )
+
+        for subregion, data in new_subregions:
+            matched[subregion.id] = data
+        subregion_translations = TranslationDiff(
+            SubRegionTranslation,
+            "sub_region",
+            {
+                (sub_region_id, lang): fields
+                for sub_region_id, data in matched.items()
+                for lang, fields in data["translations"].items()
+            },
+            parent_ids=matched
+        )
+        subregion_translations.apply()
+        result.add_translations(subregion_translations)
+        record(CatalogChange.ENTITY_SUBREGION, subregion_translations.changed_parent_ids())
+    return result
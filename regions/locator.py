@@ -0,0 +1,51 @@
+from helper.catalog_cache import regions_cache
+from helper.geo_helper import GridIndex
+from regions.models import SubRegion
+
+# 이 거리(미터)보다 먼 지역구만 있으면 국내가 아닌 것으로 보고 결과 없음
+LOCATE_MAX_DISTANCE = 30000
+
+
+class SubRegionLocator:
+    """좌표 → 가장 가까운 지역구 찾기 (지역구 중심 좌표의 격자 인덱스를 프로세스 메모리에 보관)
+
+    지역 카탈로그 버전이 바뀌면(지역구 변경 시그널, load_regions) 다음 조회 때 다시 빌드
+    """
+
+    def __init__(self, catalog_cache):
+        self.catalog_cache = catalog_cache
+        self._index = None
+        self._version = None
+
+    def build(self):
+        rows = SubRegion.objects.order_by().values_list("id", "region_id", "latitude", "longitude")
+        return GridIndex(((subregion_id, region_id), lat, lng) for subregion_id, region_id, lat, lng in rows)
+
+    def get_index(self):
+        # 빌드 중에 버전이 바뀌면 다음 조회에서 다시 빌드되도록 버전을 먼저 읽기
+        version = self.catalog_cache.get_version()
+        if self._index is None or self._version != version:
+            self._index = self.build()
+            self._version = version
+        return self._index
+
+    def _locate(self, index, lat, lng, max_distance):
+        if lat is None or lng is None:
+            return None
+        found = index.nearest(lat, lng, max_distance=max_distance)
+        if found is None:
+            return None
+        (subregion_id, region_id), distance = found
+        return {"subregion_id": subregion_id, "region_id": region_id, "distance": distance}
+
+    def locate(self, lat, lng, max_distance=LOCATE_MAX_DISTANCE):
+        """가장 가까운 지역구 {subregion_id, region_id, distance} 반환 (없으면 None)"""
+        return self._locate(self.get_index(), lat, lng, max_distance)
+
+    def locate_many(self, coordinates, max_distance=LOCATE_MAX_DISTANCE):
+        """(위도, 경도) 목록을 한 번에 조회 (관광지 일괄 임포트용, 인덱스 버전 확인도 한 번)"""
+        index = self.get_index()
+        return [self._locate(index, lat, lng, max_distance) for lat, lng in coordinates]
+
+
+subregion_locator = SubRegionLocator(regions_cache)
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.18 on 2026-10-17 19:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('regions', '0004_alter_subregiontranslation_options_and_more'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='subregion',
+            options={'ordering': ['-favorite_count', 'id'], 'verbose_name': '지역구', 'verbose_name_plural': '지역구'},
+        ),
+        migrations.AddIndex(
+            model_name='subregion',
+            index=models.Index(fields=['-favorite_count', 'id'], name='subregion_popularity_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='subregion',
+            index=models.Index(fields=['region', '-favorite_count', 'id'], name='subregion_region_pop_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='subregiontranslation',
+            index=models.Index(fields=['lang', 'name'], name='subregion_tr_lang_name_idx'),
+        ),
+    ]
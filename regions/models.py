@@ -1,4 +1,8 @@
 from django.db import models
+from django.db.models import F, FilteredRelation, Q, Value
+from django.db.models.functions import Coalesce
+from helper.translation_helper import TranslatableMixin, TranslationQuerySet
+from outbox.changes import AtomicSaveMixin
 
 LANGUAGE_CHOICES = [
     ("ko", "한국어"),
@@ -9,10 +13,12 @@ LANGUAGE_CHOICES = [
 
 
 # 기본 지역 모델
-class Region(models.Model):
+class Region(TranslatableMixin, AtomicSaveMixin, models.Model):
     created_at = models.DateTimeField(auto_now_add=True, verbose_name="생성일시")
     updated_at = models.DateTimeField(auto_now=True, verbose_name="수정일시")
 
+    objects = TranslationQuerySet.as_manager()
+
     class Meta:
         db_table = "region"
         verbose_name = "지역"
@@ -25,23 +31,15 @@ class Region(models.Model):
 
     # 지정한 언어의 지역 이름 가져오기
     def get_name(self, lang="ko"):
-        try:
-            translation = self.translations.get(lang=lang)
-            return translation.name
-        except RegionTranslation.DoesNotExist:
-            return None
+        return self.get_translated_field("name", lang)
 
     # 지정한 언어의 지역 설명 가져오기
     def get_description(self, lang="ko"):
-        try:
-            translation = self.translations.get(lang=lang)
-            return translation.description
-        except RegionTranslation.DoesNotExist:
-            return ""
+        return self.get_translated_field("description", lang, "")
 
 
 # 지역 번역 테이블
-class RegionTranslation(models.Model):
+class RegionTranslation(AtomicSaveMixin, models.Model):
     region = models.ForeignKey(
         Region,
         on_delete=models.CASCADE,
@@ -75,8 +73,23 @@ class RegionTranslation(models.Model):
         return f"{self.region.id} - {self.lang}: {self.name}"
 
 
+class SubRegionQuerySet(TranslationQuerySet):
+
+    # 인기순(즐겨찾기 수 많은 순) → 한국어 이름순 정렬 (한국어 번역만 JOIN 해서 DB에서 정렬)
+    POPULARITY_ORDERING = ["-favorite_count", "ko_name", "id"]
+
+    def with_korean_name(self):
+        return self.annotate(
+            ko_translation=FilteredRelation("translations", condition=Q(translations__lang="ko")),
+            ko_name=Coalesce(F("ko_translation__name"), Value(""))
+        )
+
+    def order_by_popularity(self):
+        return self.with_korean_name().order_by(*self.POPULARITY_ORDERING)
+
+
 # 지역구 모델 (즐겨찾기 수, 날씨 연동용 위치 정보 포함)
-class SubRegion(models.Model):
+class SubRegion(TranslatableMixin, AtomicSaveMixin, models.Model):
     region = models.ForeignKey(
         Region,
         on_delete=models.CASCADE,
@@ -112,12 +125,18 @@ class SubRegion(models.Model):
     created_at = models.DateTimeField(auto_now_add=True, verbose_name="생성일시")
     updated_at = models.DateTimeField(auto_now=True, verbose_name="수정일시")
 
+    objects = SubRegionQuerySet.as_manager()
+
     class Meta:
         db_table = "subregion"
         verbose_name = "지역구"
         verbose_name_plural = "지역구"
-        # 즐겨찾기 수 많은 순 → 한국어 이름순으로 자동 정렬
-        ordering = ["-favorite_count", "translations__name"]
+        # 번역 테이블 JOIN 없이 정렬 (한국어 이름순이 필요하면 order_by_popularity() 사용)
+        ordering = ["-favorite_count", "id"]
+        indexes = [
+            models.Index(fields=["-favorite_count", "id"], name="subregion_popularity_idx"),
+            models.Index(fields=["region", "-favorite_count", "id"], name="subregion_region_pop_idx"),
+        ]
 
     def __str__(self):
         korean_name = self.get_name("ko")
@@ -128,27 +147,15 @@ class SubRegion(models.Model):
 
     # 지정한 언어의 지역구 이름 가져오기
     def get_name(self, lang="ko"):
-        try:
-            translation = self.translations.get(lang=lang)
-            return translation.name
-        except SubRegionTranslation.DoesNotExist:
-            return None
+        return self.get_translated_field("name", lang)
 
     # 지정한 언어의 지역구 설명 가져오기
     def get_description(self, lang="ko"):
-        try:
-            translation = self.translations.get(lang=lang)
-            return translation.description
-        except SubRegionTranslation.DoesNotExist:
-            return ""
+        return self.get_translated_field("description", lang, "")
 
     # 지정한 언어의 지역구 특징 가져오기
     def get_features(self, lang="ko"):
-        try:
-            translation = self.translations.get(lang=lang)
-            return translation.features
-        except SubRegionTranslation.DoesNotExist:
-            return ""
+        return self.get_translated_field("features", lang, "")
 
     # 이 지역구의 즐겨찾기 수 업데이트 (UserFavoriteRegion 모델 연결 후 구현 예정)
     def update_favorite_count(self):
@@ -156,7 +163,7 @@ class SubRegion(models.Model):
 
 
 # 지역구 번역 테이블
-class SubRegionTranslation(models.Model):
+class SubRegionTranslation(AtomicSaveMixin, models.Model):
     sub_region = models.ForeignKey(
         SubRegion,
         on_delete=models.CASCADE,
@@ -193,6 +200,10 @@ class SubRegionTranslation(models.Model):
         verbose_name_plural = "지역구 번역"
         # 같은 지역구에 같은 언어 조합은 한 번만 허용
         unique_together = [("sub_region", "lang")]
+        indexes = [
+            # 한국어 이름 정렬/검색용
+            models.Index(fields=["lang", "name"], name="subregion_tr_lang_name_idx"),
+        ]
 
     def __str__(self):
         return f"{self.sub_region.id} - {self.lang}: {self.name}"
@@ -88,6 +88,9 @@ class RegionSerializer(serializers.ModelSerializer):
         return obj.get_description(lang)
 
     def get_subregion_count(self, obj):
+        # 뷰에서 annotate 한 값이 있으면 추가 쿼리 없이 사용
+        if hasattr(obj, "subregion_count"):
+            return obj.subregion_count
         return obj.subregions.count()
 
 
@@ -114,19 +117,15 @@ class RegionDetailSerializer(serializers.ModelSerializer):
         return obj.get_description(lang)
 
     def get_subregions(self, obj):
-        subregions = obj.subregions.select_related().prefetch_related(
-            'translations'
-        ).all()
-
-        def sort_key(subregion):
-            korean_name = subregion.get_name("ko") or f"SubRegion {subregion.id}"
-            return (-subregion.favorite_count, korean_name)
-
-        sorted_subregions = sorted(subregions, key=sort_key)
-
         lang = self.context.get("lang", "ko")
+        # 스냅샷 빌드처럼 subregions를 미리 prefetch 했으면 그대로 사용 (이미 인기순 정렬됨)
+        if "subregions" in getattr(obj, "_prefetched_objects_cache", {}):
+            subregions = obj.subregions.all()
+        else:
+            subregions = obj.subregions.order_by_popularity().with_translations(lang)
+
         serializer = SubRegionListSerializer(
-            sorted_subregions,
+            subregions,
             many=True,
             context={"lang": lang}
         )
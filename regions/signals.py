@@ -0,0 +1,30 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from helper.catalog_cache import regions_cache
+from outbox.changes import track
+from outbox.consumer import register
+from outbox.models import CatalogChange
+from regions.models import Region, RegionTranslation, SubRegion, SubRegionTranslation
+from regions.snapshots import regions_snapshot
+
+
+# 지역 데이터가 바뀌면 지역 카탈로그 캐시 무효화
+@receiver([post_save, post_delete], sender=Region)
+@receiver([post_save, post_delete], sender=RegionTranslation)
+@receiver([post_save, post_delete], sender=SubRegion)
+@receiver([post_save, post_delete], sender=SubRegionTranslation)
+def invalidate_regions_cache(sender, **kwargs):
+    regions_cache.invalidate()
+
+
+# 변경 기록 (번역은 부모 지역/서브지역의 변경으로)
+track(Region, CatalogChange.ENTITY_REGION)
+track(RegionTranslation, CatalogChange.ENTITY_REGION, parent_field="region")
+track(SubRegion, CatalogChange.ENTITY_SUBREGION)
+track(SubRegionTranslation, CatalogChange.ENTITY_SUBREGION, parent_field="sub_region")
+
+
+# 지역이 바뀐 배치에서만 스냅샷을 미리 빌드 (첫 요청이 빌드 비용을 내지 않게)
+@register(CatalogChange.ENTITY_REGION, CatalogChange.ENTITY_SUBREGION)
+def rebuild_regions_snapshot(changes):
+    regions_snapshot.rebuild()
@@ -0,0 +1,51 @@
+from django.db.models import Count, Prefetch
+from helper.catalog_cache import regions_cache
+from helper.catalog_snapshot import CatalogSnapshot
+from regions.models import Region, SubRegion
+from regions.serializers import (
+    RegionSerializer,
+    RegionDetailSerializer,
+    SubRegionSerializer,
+    SubRegionListSerializer
+)
+
+# 기본 지역 (DefaultRegionAPI)
+DEFAULT_REGION_NAME = "서울"
+
+
+def build_regions_snapshot(lang):
+    """지역 트리 전체를 한 번에 조회해서 엔드포인트별 응답 데이터로 만들기"""
+    context = {"lang": lang}
+    regions = list(
+        Region.objects.with_translations("ko", lang).annotate(
+            subregion_count=Count("subregions")
+        ).prefetch_related(
+            Prefetch("subregions", queryset=SubRegion.objects.order_by_popularity().with_translations(lang))
+        ).order_by("id")
+    )
+
+    payloads = {
+        "regions": {"regions": RegionSerializer(regions, many=True, context=context).data}
+    }
+
+    for region in regions:
+        region_data = RegionDetailSerializer(region, context=context).data
+        payloads[f"regions/{region.id}"] = {"region": region_data}
+        payloads[f"regions/{region.id}/subregions"] = {"subregions": region_data["subregions"]}
+
+        if region.get_name("ko") == DEFAULT_REGION_NAME and "default" not in payloads:
+            payloads["default"] = {"region": region_data}
+
+        for subregion in region.subregions.all():
+            payloads[f"subregions/{subregion.id}"] = {
+                "subregion": SubRegionSerializer(subregion, context=context).data
+            }
+
+    all_subregions = SubRegion.objects.order_by_popularity().with_translations(lang)
+    payloads["subregions"] = {
+        "subregions": SubRegionListSerializer(all_subregions, many=True, context=context).data
+    }
+    return payloads
+
+
+regions_snapshot = CatalogSnapshot(regions_cache, build_regions_snapshot)
@@ -0,0 +1,102 @@
+from io import StringIO
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import call_command
+from rest_framework.test import APITestCase
+from rest_framework import status
+from helper.catalog_cache import regions_cache
+from regions.models import Region, RegionTranslation, SubRegion, SubRegionTranslation
+
+User = get_user_model()
+
+
+# 지역 카탈로그 응답 캐시 테스트
+class RegionsCacheTest(APITestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(email="cache@test.com", password="testpass123")
+        self.client.force_authenticate(user=self.user)
+
+        self.seoul = Region.objects.create()
+        self.seoul_ko = RegionTranslation.objects.create(region=self.seoul, lang="ko", name="서울")
+        RegionTranslation.objects.create(region=self.seoul, lang="en", name="Seoul")
+
+        self.gangnam = SubRegion.objects.create(region=self.seoul, favorite_count=10)
+        SubRegionTranslation.objects.create(sub_region=self.gangnam, lang="ko", name="강남구")
+
+    # 두 번째 요청부터는 DB를 조회하지 않아야 함
+    def test_cached_response_should_not_hit_database(self):
+        urls = [
+            "/api/regions/?lang=ko",
+            f"/api/regions/{self.seoul.id}/?lang=ko",
+            f"/api/regions/{self.seoul.id}/subregions/?lang=ko",
+            f"/api/regions/subregions/{self.gangnam.id}/?lang=ko",
+            "/api/regions/subregions/?lang=ko",
+            "/api/regions/default/?lang=ko",
+        ]
+        for url in urls:
+            first = self.client.get(url)
+            with self.assertNumQueries(0):
+                second = self.client.get(url)
+
+            self.assertEqual(second.status_code, status.HTTP_200_OK)
+            self.assertEqual(first.data, second.data)
+
+    # 언어와 파라미터별로 따로 캐시되어야 함
+    def test_cache_key_should_include_lang_and_params(self):
+        busan = Region.objects.create()
+        RegionTranslation.objects.create(region=busan, lang="ko", name="부산")
+
+        ko_response = self.client.get("/api/regions/?lang=ko")
+        en_response = self.client.get("/api/regions/?lang=en")
+        self.assertEqual(ko_response.data["regions"][0]["name"], "서울")
+        self.assertEqual(en_response.data["regions"][0]["name"], "Seoul")
+
+        all_response = self.client.get("/api/regions/subregions/?lang=ko")
+        busan_response = self.client.get(f"/api/regions/subregions/?lang=ko&region_id={busan.id}")
+        self.assertEqual(len(all_response.data["subregions"]), 1)
+        self.assertEqual(len(busan_response.data["subregions"]), 0)
+
+    # 번역이 수정되면 캐시가 무효화되어야 함
+    def test_translation_update_should_invalidate_cache(self):
+        self.client.get("/api/regions/?lang=ko")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.seoul_ko.name = "서울특별시"
+            self.seoul_ko.save()
+
+        response = self.client.get("/api/regions/?lang=ko")
+        self.assertEqual(response.data["regions"][0]["name"], "서울특별시")
+
+    # 지역구가 삭제되면 캐시가 무효화되어야 함
+    def test_subregion_delete_should_invalidate_cache(self):
+        response = self.client.get(f"/api/regions/{self.seoul.id}/subregions/?lang=ko")
+        self.assertEqual(len(response.data["subregions"]), 1)
+
+        self.gangnam.delete()
+
+        response = self.client.get(f"/api/regions/{self.seoul.id}/subregions/?lang=ko")
+        self.assertEqual(len(response.data["subregions"]), 0)
+
+    # 커밋 전과 커밋 후 모두 버전이 바뀌어야 함
+    def test_invalidate_should_bump_version_before_and_after_commit(self):
+        version = regions_cache.get_version()
+
+        with self.captureOnCommitCallbacks(execute=False) as callbacks:
+            regions_cache.invalidate()
+        self.assertNotEqual(regions_cache.get_version(), version)
+
+        before_commit = regions_cache.get_version()
+        for callback in callbacks:
+            callback()
+        self.assertNotEqual(regions_cache.get_version(), before_commit)
+
+    # load_regions 실행 후 새 데이터가 보여야 함
+    def test_load_regions_should_invalidate_cache(self):
+        self.client.get("/api/regions/?lang=ko")
+
+        call_command("load_regions", stdout=StringIO())
+
+        response = self.client.get("/api/regions/?lang=ko")
+        self.assertEqual(response.data["regions"][0]["name"], "서울특별시")
@@ -0,0 +1,128 @@
+import json
+import os
+import tempfile
+from io import StringIO
+from django.core.cache import cache
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+from helper.catalog_cache import regions_cache
+from regions.loader import load_regions, read_dataset
+from regions.models import Region, RegionTranslation, SubRegion, SubRegionTranslation
+
+
+def make_dataset():
+    return {
+        "version": 1,
+        "regions": [
+            {"id": 1, "translations": {
+                "ko": {"name": "서울특별시", "description": "수도"},
+                "en": {"name": "Seoul", "description": "Capital"},
+            }},
+            {"id": 2, "translations": {
+                "ko": {"name": "부산광역시", "description": "항구"},
+            }},
+        ],
+        "subregions": [
+            {"region_id": 1, "latitude": 37.5172, "longitude": 127.0473, "favorite_count": 15, "translations": {
+                "ko": {"name": "강남구", "description": "번화가", "features": "쇼핑"},
+                "en": {"name": "Gangnam-gu", "description": "Downtown", "features": "Shopping"},
+            }},
+            {"region_id": 1, "latitude": 37.5636, "longitude": 126.9976, "favorite_count": 12, "translations": {
+                "ko": {"name": "중구", "description": "도심", "features": "명동"},
+            }},
+            {"region_id": 2, "latitude": 35.1631, "longitude": 129.1636, "favorite_count": 20, "translations": {
+                "ko": {"name": "해운대구", "description": "해변", "features": "해수욕장"},
+            }},
+        ],
+    }
+
+
+# 지역 데이터 차분 로더 테스트
+class RegionLoaderTest(TestCase):
+
+    def setUp(self):
+        cache.clear()
+
+    def test_bundled_data_file_should_load(self):
+        dataset = read_dataset()
+        call_command("load_regions", stdout=StringIO())
+
+        self.assertEqual(Region.objects.count(), len(dataset["regions"]))
+        self.assertEqual(SubRegion.objects.count(), len(dataset["subregions"]))
+        self.assertEqual(SubRegionTranslation.objects.count(), len(dataset["subregions"]) * 4)
+        self.assertEqual(Region.objects.get(id=1).get_name("en"), "Seoul")
+
+    def test_reload_without_changes_should_only_read(self):
+        load_regions(make_dataset())
+
+        # 지역/번역/서브지역/서브지역 이름/서브지역 번역 조회 + SAVEPOINT
+        with self.assertNumQueries(7):
+            result = load_regions(make_dataset())
+
+        self.assertFalse(result.changed)
+
+    def test_reload_should_apply_diff_and_keep_ids(self):
+        load_regions(make_dataset())
+        gangnam = SubRegion.objects.get(translations__lang="ko", translations__name="강남구")
+        jung = SubRegion.objects.get(translations__lang="ko", translations__name="중구")
+        # 운영 중 쌓인 즐겨찾기 수
+        SubRegion.objects.filter(id=gangnam.id).update(favorite_count=100)
+
+        dataset = make_dataset()
+        dataset["subregions"][0]["latitude"] = 37.5173
+        dataset["subregions"][0]["translations"]["en"]["features"] = "Shopping and nightlife"
+        del dataset["subregions"][2]
+        dataset["subregions"].append({
+            "region_id": 2, "latitude": 35.1, "longitude": 129.0, "favorite_count": 3,
+            "translations": {"ko": {"name": "사하구", "description": "", "features": "감천문화마을"}},
+        })
+        dataset["regions"][0]["translations"].pop("en")
+
+        result = load_regions(dataset)
+
+        gangnam.refresh_from_db()
+        self.assertEqual(gangnam.favorite_count, 100)
+        self.assertEqual(str(gangnam.latitude), "37.51730000")
+        self.assertEqual(gangnam.get_features("en"), "Shopping and nightlife")
+        self.assertTrue(SubRegion.objects.filter(id=jung.id).exists())
+        self.assertFalse(SubRegionTranslation.objects.filter(name="해운대구").exists())
+        self.assertEqual(SubRegion.objects.get(translations__name="사하구").favorite_count, 3)
+        self.assertFalse(RegionTranslation.objects.filter(region_id=1, lang="en").exists())
+
+        self.assertEqual(result.counts[SubRegion], {"created": 1, "updated": 1, "deleted": 1})
+        self.assertEqual(result.counts[SubRegionTranslation], {"created": 1, "updated": 1, "deleted": 0})
+        self.assertEqual(result.counts[RegionTranslation], {"created": 0, "updated": 0, "deleted": 1})
+
+    def test_removed_region_should_be_deleted(self):
+        load_regions(make_dataset())
+        dataset = make_dataset()
+        dataset["regions"] = dataset["regions"][:1]
+        dataset["subregions"] = dataset["subregions"][:2]
+
+        result = load_regions(dataset)
+
+        self.assertEqual(result.counts[Region]["deleted"], 1)
+        self.assertEqual(list(Region.objects.values_list("id", flat=True)), [1])
+        self.assertEqual(SubRegion.objects.count(), 2)
+
+    def test_command_should_invalidate_cache_only_when_changed(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "regions.json")
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(make_dataset(), f)
+
+            call_command("load_regions", file=path, stdout=StringIO())
+            version = regions_cache.get_version()
+            call_command("load_regions", file=path, stdout=StringIO())
+
+        self.assertEqual(regions_cache.get_version(), version)
+
+    def test_unknown_version_should_be_rejected(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "regions.json")
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump({**make_dataset(), "version": 99}, f)
+
+            with self.assertRaises(CommandError):
+                call_command("load_regions", file=path, stdout=StringIO())
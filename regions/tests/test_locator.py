@@ -0,0 +1,104 @@
+import random
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase
+from rest_framework.test import APITestCase
+from rest_framework import status
+from helper.geo_helper import GridIndex, haversine_distance
+from regions.locator import subregion_locator
+from regions.models import Region, RegionTranslation, SubRegion, SubRegionTranslation
+
+
+def create_subregion(region, name, lat, lng):
+    subregion = SubRegion.objects.create(region=region, latitude=lat, longitude=lng)
+    SubRegionTranslation.objects.create(sub_region=subregion, lang="ko", name=name)
+    SubRegionTranslation.objects.create(sub_region=subregion, lang="en", name=f"{name}-en")
+    return subregion
+
+
+# 격자 인덱스 최근접 조회 테스트
+class GridIndexTest(SimpleTestCase):
+
+    # 전수 비교와 같은 결과가 나와야 함
+    def test_nearest_should_match_brute_force(self):
+        rng = random.Random(3)
+        points = [(index, rng.uniform(33.0, 38.5), rng.uniform(124.5, 131.0)) for index in range(300)]
+        index = GridIndex(points)
+
+        for _ in range(300):
+            lat, lng = rng.uniform(32.5, 39.0), rng.uniform(124.0, 131.5)
+            expected = min(points, key=lambda point: haversine_distance(lat, lng, point[1], point[2]))
+
+            key, distance = index.nearest(lat, lng)
+            self.assertEqual(key, expected[0])
+            self.assertAlmostEqual(distance, haversine_distance(lat, lng, expected[1], expected[2]))
+
+    def test_max_distance_and_empty_index(self):
+        index = GridIndex([("seoul", 37.5665, 126.9780), ("no_location", None, None)])
+
+        self.assertEqual(len(index), 1)
+        self.assertEqual(index.nearest(37.57, 126.98, max_distance=1000)[0], "seoul")
+        self.assertIsNone(index.nearest(35.1796, 129.0756, max_distance=30000))
+        self.assertIsNone(GridIndex([]).nearest(37.57, 126.98))
+
+
+# 지역구 위치 조회 서비스 테스트
+class SubRegionLocatorTest(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.seoul = Region.objects.create()
+        self.busan = Region.objects.create()
+        self.jongno = create_subregion(self.seoul, "종로구", 37.5735, 126.9790)
+        self.gangnam = create_subregion(self.seoul, "강남구", 37.5172, 127.0473)
+        self.haeundae = create_subregion(self.busan, "해운대구", 35.1631, 129.1636)
+
+    def test_locate_should_return_nearest_subregion(self):
+        located = subregion_locator.locate(37.5110, 127.0590)
+
+        self.assertEqual(located["subregion_id"], self.gangnam.id)
+        self.assertEqual(located["region_id"], self.seoul.id)
+        self.assertIsNone(subregion_locator.locate(35.6762, 139.6503))
+
+    # 일괄 조회는 인덱스를 한 번만 읽고 관광지마다 DB 조회를 하지 않음
+    def test_locate_many_should_not_query_per_coordinate(self):
+        subregion_locator.locate(37.5, 127.0)
+
+        with self.assertNumQueries(0):
+            results = subregion_locator.locate_many([(37.57, 126.98), (35.16, 129.16), (None, None)] * 100)
+
+        self.assertEqual(results[0]["subregion_id"], self.jongno.id)
+        self.assertEqual(results[1]["subregion_id"], self.haeundae.id)
+        self.assertIsNone(results[2])
+
+    def test_index_should_be_rebuilt_after_subregion_change(self):
+        self.assertEqual(subregion_locator.locate(35.1, 129.03)["subregion_id"], self.haeundae.id)
+
+        jung = create_subregion(self.busan, "중구", 35.1060, 129.0324)
+        self.assertEqual(subregion_locator.locate(35.1, 129.03)["subregion_id"], jung.id)
+
+
+# 위치 기반 지역구 조회 API 테스트
+class LocateSubRegionAPITest(APITestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.seoul = Region.objects.create()
+        RegionTranslation.objects.create(region=self.seoul, lang="ko", name="서울")
+        self.jongno = create_subregion(self.seoul, "종로구", 37.5735, 126.9790)
+
+    def test_locate_should_return_subregion_in_requested_language(self):
+        response = self.client.get("/api/regions/locate/?lat=37.57&lng=126.98&lang=en")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["subregion"]["id"], self.jongno.id)
+        self.assertEqual(response.data["subregion"]["name"], "종로구-en")
+        self.assertEqual(response.data["region_id"], self.seoul.id)
+
+    def test_locate_outside_korea_should_return_404(self):
+        response = self.client.get("/api/regions/locate/?lat=35.6762&lng=139.6503")
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_invalid_coordinates_should_return_400(self):
+        for query in ["lat=37.5", "lat=abc&lng=127", "lat=37.5&lng=200"]:
+            response = self.client.get(f"/api/regions/locate/?{query}")
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST, query)
@@ -0,0 +1,103 @@
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase
+from rest_framework import status
+from regions.models import Region, RegionTranslation, SubRegion, SubRegionTranslation
+
+User = get_user_model()
+
+LANGS = ["ko", "en", "jp", "cn"]
+
+
+# 지역 API 쿼리 수가 데이터 개수와 무관하게 일정한지 확인하는 회귀 테스트
+# (어느 엔드포인트든 캐시가 없으면 지역 트리 스냅샷 전체를 6번의 쿼리로 빌드)
+class RegionsAPIQueryCountTest(APITestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(email="query@test.com", password="testpass123")
+        self.client.force_authenticate(user=self.user)
+
+        self.seoul = self.create_region("서울", "Seoul")
+        self.busan = self.create_region("부산", "Busan")
+        self.gangnam = self.add_subregions(self.seoul, 3)[0]
+
+    def create_region(self, ko_name, en_name):
+        region = Region.objects.create()
+        for lang in LANGS:
+            RegionTranslation.objects.create(
+                region=region,
+                lang=lang,
+                name=ko_name if lang == "ko" else en_name,
+                description=f"{en_name} ({lang})"
+            )
+        return region
+
+    def add_subregions(self, region, count):
+        subregions = []
+        for index in range(count):
+            subregion = SubRegion.objects.create(region=region, favorite_count=index)
+            for lang in LANGS:
+                SubRegionTranslation.objects.create(
+                    sub_region=subregion,
+                    lang=lang,
+                    name=f"지역구{subregion.id}-{lang}",
+                    description="설명",
+                    features="특징"
+                )
+            subregions.append(subregion)
+        return subregions
+
+    def count_queries(self, url):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return len(context.captured_queries)
+
+    # 행 수가 늘어나도 쿼리 수가 그대로인지 확인
+    def assert_constant_queries(self, url, grow):
+        before = self.count_queries(url)
+        grow()
+        after = self.count_queries(url)
+        self.assertEqual(before, after)
+        return after
+
+    def test_regions_list_query_count(self):
+        queries = self.assert_constant_queries(
+            "/api/regions/?lang=en",
+            lambda: [self.create_region(f"지역{i}", f"Region{i}") for i in range(5)]
+        )
+        self.assertEqual(queries, 6)
+
+    def test_region_detail_query_count(self):
+        queries = self.assert_constant_queries(
+            f"/api/regions/{self.seoul.id}/?lang=en",
+            lambda: self.add_subregions(self.seoul, 10)
+        )
+        self.assertEqual(queries, 6)
+
+    def test_default_region_query_count(self):
+        queries = self.assert_constant_queries(
+            "/api/regions/default/?lang=en",
+            lambda: self.add_subregions(self.seoul, 10)
+        )
+        self.assertEqual(queries, 6)
+
+    def test_region_subregions_query_count(self):
+        queries = self.assert_constant_queries(
+            f"/api/regions/{self.seoul.id}/subregions/?lang=en",
+            lambda: self.add_subregions(self.seoul, 10)
+        )
+        self.assertEqual(queries, 6)
+
+    def test_all_subregions_query_count(self):
+        queries = self.assert_constant_queries(
+            "/api/regions/subregions/?lang=en",
+            lambda: self.add_subregions(self.busan, 10)
+        )
+        self.assertEqual(queries, 6)
+
+    def test_subregion_detail_query_count(self):
+        with self.assertNumQueries(6):
+            response = self.client.get(f"/api/regions/subregions/{self.gangnam.id}/?lang=en")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
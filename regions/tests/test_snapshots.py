@@ -0,0 +1,147 @@
+import hashlib
+import json
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+from rest_framework.test import APITestCase
+from rest_framework import status
+from helper.catalog_cache import regions_cache
+from helper.catalog_snapshot import CatalogSnapshot
+from regions.models import Region, RegionTranslation, SubRegion, SubRegionTranslation
+from regions.snapshots import build_regions_snapshot, regions_snapshot
+
+User = get_user_model()
+
+
+def create_seoul():
+    seoul = Region.objects.create()
+    RegionTranslation.objects.create(region=seoul, lang="ko", name="서울", description="수도")
+    RegionTranslation.objects.create(region=seoul, lang="en", name="Seoul", description="Capital")
+
+    gangnam = SubRegion.objects.create(region=seoul, favorite_count=10)
+    SubRegionTranslation.objects.create(sub_region=gangnam, lang="ko", name="강남구", features="쇼핑")
+    SubRegionTranslation.objects.create(sub_region=gangnam, lang="en", name="Gangnam-gu", features="Shopping")
+    return seoul, gangnam
+
+
+# 지역 스냅샷 빌더 테스트
+class RegionsSnapshotBuilderTest(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.seoul, self.gangnam = create_seoul()
+
+    def test_snapshot_should_contain_every_endpoint_payload(self):
+        payloads = build_regions_snapshot("en")
+
+        self.assertEqual(payloads["regions"]["regions"][0]["name"], "Seoul")
+        self.assertEqual(payloads["regions"]["regions"][0]["subregion_count"], 1)
+        self.assertEqual(payloads[f"regions/{self.seoul.id}"]["region"]["subregions"][0]["name"], "Gangnam-gu")
+        self.assertEqual(payloads[f"regions/{self.seoul.id}/subregions"]["subregions"][0]["features"], "Shopping")
+        self.assertEqual(payloads[f"subregions/{self.gangnam.id}"]["subregion"]["name"], "Gangnam-gu")
+        self.assertEqual(payloads["subregions"]["subregions"][0]["id"], self.gangnam.id)
+        self.assertEqual(payloads["default"], payloads[f"regions/{self.seoul.id}"])
+
+    def test_etag_should_be_content_hash(self):
+        body, etag = regions_snapshot.get("regions", "ko")
+
+        self.assertEqual(etag, f'"{hashlib.sha1(body).hexdigest()}"')
+        self.assertEqual(json.loads(body)["regions"][0]["name"], "서울")
+
+    # 다른 프로세스(새 인스턴스)는 Redis에 저장된 스냅샷을 DB 조회 없이 사용
+    def test_snapshot_should_be_shared_through_redis(self):
+        regions_snapshot.get("regions", "ko")
+
+        other_process = CatalogSnapshot(regions_cache, build_regions_snapshot)
+        with self.assertNumQueries(0):
+            payload = other_process.get("regions", "ko")
+
+        self.assertEqual(payload, regions_snapshot.get("regions", "ko"))
+
+    def test_snapshot_should_be_rebuilt_after_version_bump(self):
+        regions_snapshot.get("regions", "ko")
+
+        RegionTranslation.objects.filter(region=self.seoul, lang="ko").update(name="서울특별시")
+        regions_cache.bump_version()
+
+        body, _ = regions_snapshot.get("regions", "ko")
+        self.assertEqual(json.loads(body)["regions"][0]["name"], "서울특별시")
+
+
+# 스냅샷 기반 지역 API 응답 테스트
+class RegionsSnapshotAPITest(APITestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(email="snapshot@test.com", password="testpass123")
+        self.client.force_authenticate(user=self.user)
+        self.seoul, self.gangnam = create_seoul()
+
+    def test_response_should_be_served_from_snapshot_bytes(self):
+        response = self.client.get("/api/regions/?lang=ko")
+        body, etag = regions_snapshot.get("regions", "ko")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.content, body)
+        self.assertEqual(response["ETag"], etag)
+        self.assertEqual(response["Content-Type"], "application/json")
+
+    def test_missing_region_should_return_404(self):
+        response = self.client.get("/api/regions/9999/?lang=ko")
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+        response = self.client.get("/api/regions/subregions/?lang=ko&region_id=9999")
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+# 조건부 GET (ETag / If-None-Match) 및 Cache-Control 테스트
+class RegionsConditionalGetTest(APITestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.seoul, self.gangnam = create_seoul()
+
+    def test_catalog_should_be_public_without_login(self):
+        response = self.client.get("/api/regions/?lang=ko")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_response_should_have_cache_control(self):
+        response = self.client.get("/api/regions/?lang=ko")
+
+        cache_control = response["Cache-Control"]
+        self.assertIn("public", cache_control)
+        self.assertIn("max-age=", cache_control)
+        self.assertIn("stale-while-revalidate=", cache_control)
+
+    def test_matching_etag_should_return_304_without_database(self):
+        etag = self.client.get(f"/api/regions/{self.seoul.id}/?lang=ko")["ETag"]
+
+        with self.assertNumQueries(0):
+            response = self.client.get(f"/api/regions/{self.seoul.id}/?lang=ko", HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response.content, b"")
+        self.assertEqual(response["ETag"], etag)
+
+    # nginx gzip 등으로 약한 ETag가 되어 돌아와도 일치로 처리
+    def test_weak_etag_should_match(self):
+        etag = self.client.get("/api/regions/?lang=ko")["ETag"]
+
+        response = self.client.get("/api/regions/?lang=ko", HTTP_IF_NONE_MATCH=f'"other", W/{etag}')
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_changed_catalog_should_return_200_with_new_etag(self):
+        etag = self.client.get("/api/regions/?lang=ko")["ETag"]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            SubRegion.objects.create(region=self.seoul)
+
+        response = self.client.get("/api/regions/?lang=ko", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_etag_should_differ_by_language(self):
+        ko_etag = self.client.get("/api/regions/?lang=ko")["ETag"]
+
+        response = self.client.get("/api/regions/?lang=en", HTTP_IF_NONE_MATCH=ko_etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
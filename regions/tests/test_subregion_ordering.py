@@ -0,0 +1,124 @@
+import base64
+import json
+from django.core.cache import cache
+from django.test import TestCase
+from rest_framework.test import APITestCase
+from rest_framework import status
+from regions.models import Region, RegionTranslation, SubRegion, SubRegionTranslation
+
+LANGS = ["ko", "en", "jp", "cn"]
+
+
+def create_subregion(region, ko_name, en_name, favorite_count):
+    subregion = SubRegion.objects.create(region=region, favorite_count=favorite_count)
+    for lang in LANGS:
+        SubRegionTranslation.objects.create(
+            sub_region=subregion,
+            lang=lang,
+            name=ko_name if lang == "ko" else en_name
+        )
+    return subregion
+
+
+# DB 정렬 (인기순 → 한국어 이름순) 테스트
+class SubRegionOrderingTest(TestCase):
+
+    def setUp(self):
+        self.seoul = Region.objects.create()
+        RegionTranslation.objects.create(region=self.seoul, lang="ko", name="서울")
+
+        # 영어 이름 순서와 한국어 이름 순서를 일부러 다르게
+        self.mapo = create_subregion(self.seoul, "마포구", "A-Mapo", 5)
+        self.gangnam = create_subregion(self.seoul, "강남구", "Z-Gangnam", 5)
+        self.jongno = create_subregion(self.seoul, "종로구", "Jongno", 30)
+        self.unnamed = SubRegion.objects.create(region=self.seoul, favorite_count=5)
+
+    # 번역이 여러 언어여도 지역구가 중복되지 않아야 함
+    def test_default_ordering_should_not_duplicate_rows(self):
+        self.assertEqual(SubRegion.objects.count(), 4)
+        self.assertEqual(len(list(SubRegion.objects.all())), 4)
+        self.assertEqual(len(list(self.seoul.subregions.all())), 4)
+
+    def test_order_by_popularity_should_sort_by_favorite_count_then_korean_name(self):
+        ordered = list(SubRegion.objects.order_by_popularity())
+
+        self.assertEqual(ordered, [self.jongno, self.unnamed, self.gangnam, self.mapo])
+        self.assertEqual(ordered[2].ko_name, "강남구")
+
+    def test_order_by_popularity_should_be_single_query(self):
+        with self.assertNumQueries(2):
+            subregions = list(SubRegion.objects.order_by_popularity().with_translations("en"))
+            names = [subregion.get_name("en") for subregion in subregions]
+
+        self.assertEqual(names, ["Jongno", None, "Z-Gangnam", "A-Mapo"])
+
+
+# 전체 지역구 키셋 페이지네이션 테스트
+class AllSubRegionsPaginationTest(APITestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.seoul = Region.objects.create()
+        RegionTranslation.objects.create(region=self.seoul, lang="ko", name="서울")
+        self.busan = Region.objects.create()
+        RegionTranslation.objects.create(region=self.busan, lang="ko", name="부산")
+
+        names = ["가", "나", "다", "라", "마", "바", "사"]
+        self.subregions = [
+            create_subregion(self.seoul if index % 2 == 0 else self.busan, name, f"Name {name}", index % 3)
+            for index, name in enumerate(names)
+        ]
+        self.expected_ids = [
+            subregion.id for subregion in SubRegion.objects.order_by_popularity()
+        ]
+
+    def fetch_all_pages(self, url):
+        ids = []
+        next_cursor = None
+        while True:
+            page_url = url if next_cursor is None else f"{url}&cursor={next_cursor}"
+            with self.assertNumQueries(2):
+                response = self.client.get(page_url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            ids.extend(subregion["id"] for subregion in response.data["subregions"])
+            next_cursor = response.data["next_cursor"]
+            if next_cursor is None:
+                return ids
+
+    def test_pages_should_cover_all_rows_in_order_without_duplicates(self):
+        ids = self.fetch_all_pages("/api/regions/subregions/?lang=en&limit=2")
+        self.assertEqual(ids, self.expected_ids)
+
+    def test_pages_should_respect_region_filter(self):
+        ids = self.fetch_all_pages(f"/api/regions/subregions/?lang=ko&limit=3&region_id={self.busan.id}")
+
+        busan_ids = [subregion.id for subregion in self.subregions if subregion.region_id == self.busan.id]
+        self.assertEqual(sorted(ids), sorted(busan_ids))
+        self.assertEqual(ids, [i for i in self.expected_ids if i in busan_ids])
+
+    def test_page_should_use_requested_language(self):
+        response = self.client.get("/api/regions/subregions/?lang=en&limit=1")
+        self.assertTrue(response.data["subregions"][0]["name"].startswith("Name "))
+
+    def test_invalid_cursor_should_return_400(self):
+        response = self.client.get("/api/regions/subregions/?lang=ko&cursor=not-a-cursor")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    # 형식은 맞지만 값의 타입이 틀린 커서
+    def test_tampered_cursor_values_should_return_400(self):
+        for values in [["abc", "강남구", 1], [[1], "강남구", 2], [1, "강남구", "x"]]:
+            cursor = base64.urlsafe_b64encode(json.dumps(values).encode()).decode()
+            response = self.client.get(f"/api/regions/subregions/?lang=ko&cursor={cursor}")
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST, values)
+
+    def test_invalid_limit_should_return_400(self):
+        for limit in ["0", "abc", "1000"]:
+            response = self.client.get(f"/api/regions/subregions/?lang=ko&limit={limit}")
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    # 페이지 파라미터가 없으면 기존처럼 전체 목록
+    def test_without_page_params_should_return_full_list(self):
+        response = self.client.get("/api/regions/subregions/?lang=ko")
+
+        self.assertEqual([s["id"] for s in response.data["subregions"]], self.expected_ids)
+        self.assertNotIn("next_cursor", response.data)
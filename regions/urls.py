@@ -5,13 +5,15 @@ from regions.views import (
     RegionSubRegionsAPI,
     SubRegionDetailAPI,
     AllSubRegionsAPI,
-    DefaultRegionAPI
+    DefaultRegionAPI,
+    LocateSubRegionAPI
 )
 
 app_name = "regions"
 
 urlpatterns = [
     path("default/", DefaultRegionAPI.as_view(), name="default_region"),
+    path("locate/", LocateSubRegionAPI.as_view(), name="locate_subregion"),
     path("", RegionsAPI.as_view(), name="regions_list"),
     path("<int:region_id>/", RegionDetailAPI.as_view(), name="region_detail"),
     path("<int:region_id>/subregions/", RegionSubRegionsAPI.as_view(), name="region_subregions"),
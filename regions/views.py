@@ -1,17 +1,21 @@
+import json
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
-from django.shortcuts import get_object_or_404
-from regions.models import Region, SubRegion
-from regions.serializers import (
-    RegionSerializer,
-    RegionDetailSerializer,
-    SubRegionSerializer,
-    SubRegionListSerializer
-)
+from rest_framework.permissions import AllowAny
+from helper.keyset_pagination import InvalidCursor, KeysetPaginator
+from regions.locator import subregion_locator
+from regions.models import SubRegion, SubRegionQuerySet
+from regions.serializers import SubRegionListSerializer
+from regions.snapshots import regions_snapshot
+
+subregion_paginator = KeysetPaginator(SubRegionQuerySet.POPULARITY_ORDERING, max_limit=300)
 
 
 class RegionsAPI(APIView):
+    # 공개 참조 데이터라 로그인 없이 조회 (nginx/클라이언트 공용 캐시 대상)
+    permission_classes = [AllowAny]
+
     def get(self, request):
         lang = request.query_params.get("lang", "ko")
 
@@ -23,17 +27,7 @@ class RegionsAPI(APIView):
             )
 
         try:
-            regions = Region.objects.all().order_by("id")
-            serializer = RegionSerializer(
-                regions,
-                many=True,
-                context={"lang": lang}
-            )
-
-            return Response(
-                {"regions": serializer.data},
-                status=status.HTTP_200_OK
-            )
+            return regions_snapshot.response("regions", lang, request)
 
         except Exception as e:
             return Response(
@@ -43,6 +37,8 @@ class RegionsAPI(APIView):
 
 
 class RegionDetailAPI(APIView):
+    permission_classes = [AllowAny]
+
     def get(self, request, region_id):
         lang = request.query_params.get("lang", "ko")
         supported_languages = ["ko", "en", "jp", "cn"]
@@ -53,16 +49,14 @@ class RegionDetailAPI(APIView):
             )
 
         try:
-            region = get_object_or_404(Region, id=region_id)
-            serializer = RegionDetailSerializer(
-                region,
-                context={"lang": lang}
-            )
+            response = regions_snapshot.response(f"regions/{region_id}", lang, request)
+            if response is None:
+                return Response(
+                    {"error": "존재하지 않는 지역입니다."},
+                    status=status.HTTP_404_NOT_FOUND
+                )
 
-            return Response(
-                {"region": serializer.data},
-                status=status.HTTP_200_OK
-            )
+            return response
 
         except Exception as e:
             return Response(
@@ -72,6 +66,8 @@ class RegionDetailAPI(APIView):
 
 
 class RegionSubRegionsAPI(APIView):
+    permission_classes = [AllowAny]
+
     def get(self, request, region_id):
         lang = request.query_params.get("lang", "ko")
 
@@ -83,25 +79,14 @@ class RegionSubRegionsAPI(APIView):
             )
 
         try:
-            region = get_object_or_404(Region, id=region_id)
-            subregions = region.subregions.select_related().prefetch_related(
-                'translations'
-            ).all()
-            def sort_key(subregion):
-                korean_name = subregion.get_name("ko") or f"SubRegion {subregion.id}"
-                return (-subregion.favorite_count, korean_name)
-
-            sorted_subregions = sorted(subregions, key=sort_key)
-            serializer = SubRegionListSerializer(
-                sorted_subregions,
-                many=True,
-                context={"lang": lang}
-            )
+            response = regions_snapshot.response(f"regions/{region_id}/subregions", lang, request)
+            if response is None:
+                return Response(
+                    {"error": "존재하지 않는 지역입니다."},
+                    status=status.HTTP_404_NOT_FOUND
+                )
 
-            return Response(
-                {"subregions": serializer.data},
-                status=status.HTTP_200_OK
-            )
+            return response
 
         except Exception as e:
             return Response(
@@ -111,6 +96,8 @@ class RegionSubRegionsAPI(APIView):
 
 
 class SubRegionDetailAPI(APIView):
+    permission_classes = [AllowAny]
+
     def get(self, request, subregion_id):
         lang = request.query_params.get("lang", "ko")
         supported_languages = ["ko", "en", "jp", "cn"]
@@ -121,16 +108,14 @@ class SubRegionDetailAPI(APIView):
             )
 
         try:
-            subregion = get_object_or_404(SubRegion, id=subregion_id)
-            serializer = SubRegionSerializer(
-                subregion,
-                context={"lang": lang}
-            )
+            response = regions_snapshot.response(f"subregions/{subregion_id}", lang, request)
+            if response is None:
+                return Response(
+                    {"error": "존재하지 않는 서브지역입니다."},
+                    status=status.HTTP_404_NOT_FOUND
+                )
 
-            return Response(
-                {"subregion": serializer.data},
-                status=status.HTTP_200_OK
-            )
+            return response
 
         except Exception as e:
             return Response(
@@ -140,6 +125,8 @@ class SubRegionDetailAPI(APIView):
 
 
 class DefaultRegionAPI(APIView):
+    permission_classes = [AllowAny]
+
     def get(self, request):
         lang = request.query_params.get("lang", "ko")
         supported_languages = ["ko", "en", "jp", "cn"]
@@ -150,29 +137,14 @@ class DefaultRegionAPI(APIView):
             )
 
         try:
-            seoul_region = None
-            regions = Region.objects.all()
-
-            for region in regions:
-                if region.get_name("ko") == "서울":
-                    seoul_region = region
-                    break
-
-            if not seoul_region:
+            response = regions_snapshot.response("default", lang, request)
+            if response is None:
                 return Response(
                     {"error": "기본 지역(서울)을 찾을 수 없습니다."},
                     status=status.HTTP_404_NOT_FOUND
                 )
 
-            serializer = RegionDetailSerializer(
-                seoul_region,
-                context={"lang": lang}
-            )
-
-            return Response(
-                {"region": serializer.data},
-                status=status.HTTP_200_OK
-            )
+            return response
 
         except Exception as e:
             return Response(
@@ -182,6 +154,8 @@ class DefaultRegionAPI(APIView):
 
 
 class AllSubRegionsAPI(APIView):
+    permission_classes = [AllowAny]
+
     def get(self, request):
         lang = request.query_params.get("lang", "ko")
         region_id = request.query_params.get("region_id")
@@ -192,33 +166,120 @@ class AllSubRegionsAPI(APIView):
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        try:
-            subregions_queryset = SubRegion.objects.select_related().prefetch_related(
-                'translations'
-            ).all()
+        # cursor/limit가 있으면 DB 키셋 페이지네이션, 없으면 전체 목록 스냅샷
+        if "cursor" in request.query_params or "limit" in request.query_params:
+            return self._get_page(request, lang, region_id)
 
+        try:
             if region_id:
-                region = get_object_or_404(Region, id=region_id)
-                subregions_queryset = subregions_queryset.filter(region=region)
-            def sort_key(subregion):
-                korean_name = subregion.get_name("ko") or f"SubRegion {subregion.id}"
-                return (-subregion.favorite_count, korean_name)
+                response = regions_snapshot.response(f"regions/{region_id}/subregions", lang, request)
+            else:
+                response = regions_snapshot.response("subregions", lang, request)
+
+            if response is None:
+                return Response(
+                    {"error": "존재하지 않는 지역입니다."},
+                    status=status.HTTP_404_NOT_FOUND
+                )
+
+            return response
+
+        except Exception as e:
+            return Response(
+                {"error": "서브지역 목록 조회 중 오류가 발생했습니다."},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+    def _get_page(self, request, lang, region_id):
+        try:
+            limit = subregion_paginator.get_limit(request.query_params.get("limit"))
+        except ValueError:
+            return Response(
+                {"error": f"limit은 1~{subregion_paginator.max_limit} 사이의 숫자여야 합니다."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        if region_id and not region_id.isdigit():
+            return Response(
+                {"error": "region_id는 숫자여야 합니다."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        subregions_queryset = SubRegion.objects.with_korean_name().with_translations(lang)
+        if region_id:
+            subregions_queryset = subregions_queryset.filter(region_id=region_id)
+
+        try:
+            subregions, next_cursor = subregion_paginator.paginate(
+                subregions_queryset,
+                cursor=request.query_params.get("cursor"),
+                limit=limit
+            )
+        except InvalidCursor as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        serializer = SubRegionListSerializer(
+            subregions,
+            many=True,
+            context={"lang": lang}
+        )
+        return Response(
+            {"subregions": serializer.data, "next_cursor": next_cursor},
+            status=status.HTTP_200_OK
+        )
+
 
-            sorted_subregions = sorted(subregions_queryset, key=sort_key)
+class LocateSubRegionAPI(APIView):
+    permission_classes = [AllowAny]
 
-            serializer = SubRegionListSerializer(
-                sorted_subregions,
-                many=True,
-                context={"lang": lang}
+    def get(self, request):
+        lang = request.query_params.get("lang", "ko")
+
+        supported_languages = ["ko", "en", "jp", "cn"]
+        if lang not in supported_languages:
+            return Response(
+                {"error": f"지원하지 않는 언어입니다. 지원 언어: {', '.join(supported_languages)}"},
+                status=status.HTTP_400_BAD_REQUEST
             )
 
+        try:
+            lat = float(request.query_params["lat"])
+            lng = float(request.query_params["lng"])
+            if not (-90 <= lat <= 90 and -180 <= lng <= 180):
+                raise ValueError
+        except (KeyError, ValueError):
             return Response(
-                {"subregions": serializer.data},
+                {"error": "lat(-90~90)과 lng(-180~180)을 숫자로 입력해주세요."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        try:
+            located = subregion_locator.locate(lat, lng)
+            if located is None:
+                return Response(
+                    {"error": "해당 위치의 지역구를 찾을 수 없습니다."},
+                    status=status.HTTP_404_NOT_FOUND
+                )
+
+            # 지역구 정보는 스냅샷에서 (DB 조회 없음)
+            payload = regions_snapshot.get(f"subregions/{located['subregion_id']}", lang)
+            if payload is None:
+                return Response(
+                    {"error": "해당 위치의 지역구를 찾을 수 없습니다."},
+                    status=status.HTTP_404_NOT_FOUND
+                )
+
+            return Response(
+                {
+                    "subregion": json.loads(payload[0])["subregion"],
+                    "region_id": located["region_id"],
+                    "distance": round(located["distance"], 1)
+                },
                 status=status.HTTP_200_OK
             )
 
         except Exception as e:
             return Response(
-                {"error": "서브지역 목록 조회 중 오류가 발생했습니다."},
+                {"error": "위치 기반 지역구 조회 중 오류가 발생했습니다."},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
@@ -0,0 +1,129 @@
+import re
+from collections import defaultdict
+
+from django.db import transaction
+from categories.models import CategoryTranslation, SubCategoryTranslation
+from outbox.models import CatalogChange
+from places.models import PlaceTranslation
+from regions.models import RegionTranslation, SubRegionTranslation
+from search.models import EntityAlias
+from search.suggest import suggest_key
+
+REGION = CatalogChange.ENTITY_REGION
+SUBREGION = CatalogChange.ENTITY_SUBREGION
+CATEGORY = CatalogChange.ENTITY_CATEGORY
+SUBCATEGORY = CatalogChange.ENTITY_SUBCATEGORY
+PLACE = CatalogChange.ENTITY_PLACE
+
+# {대상: (번역 모델 조회, 부모 ID 필드)} - 관광지는 대표 관광지만
+ALIAS_SOURCES = {
+    REGION: (lambda: RegionTranslation.objects.all(), "region_id"),
+    SUBREGION: (lambda: SubRegionTranslation.objects.all(), "sub_region_id"),
+    CATEGORY: (lambda: CategoryTranslation.objects.all(), "category_id"),
+    SUBCATEGORY: (lambda: SubCategoryTranslation.objects.all(), "sub_category_id"),
+    PLACE: (lambda: PlaceTranslation.objects.filter(place__canonical_id__isnull=True), "place_id"),
+}
+
+# 같은 별칭이면 지역 → 지역구 → 카테고리 → 서브카테고리 → 관광지 순
+ENTITY_ORDER = {entity: order for order, entity in enumerate(ALIAS_SOURCES)}
+
+# 지역/지역구 이름 끝의 행정구역 단위 ("강남구", "江南区", "Gangnam-gu" → "강남"/"江南"/"gangnam"도 별칭으로)
+ADMIN_SUFFIX = re.compile(
+    r"(특별자치시|특별자치도|특별시|광역시|[시도군구]"
+    r"|特別自治市|特別自治道|特别自治市|特别自治道|特別市|特别市|広域市|广域市|[市道郡区區县縣]"
+    r"|[\s\-](?:gu|gun|si|do))$"
+)
+ADMIN_ENTITIES = {REGION, SUBREGION}
+
+# 접미사를 뗀 별칭의 최소 길이 ("중구" → "중"은 너무 흔해서 만들지 않음)
+MIN_STRIPPED_LENGTH = 2
+
+# 별칭 최대 길이 (검색어도 같은 길이로 잘라서 비교)
+ALIAS_MAX_LENGTH = EntityAlias._meta.get_field("alias").max_length
+
+# 한 번에 다시 만들 대상 수
+ALIAS_BATCH_SIZE = 1000
+
+
+def alias_key(text):
+    """별칭 비교용 키 (suggest_key를 컬럼 길이로 자름 - NFKC로 원본보다 길어질 수 있음)"""
+    return suggest_key(text)[:ALIAS_MAX_LENGTH]
+
+
+def alias_keys(entity, name):
+    """이름으로 만드는 별칭 집합 (정규화한 이름, 지역/지역구는 행정구역 단위를 뗀 이름도)"""
+    key = alias_key(name)
+    if not key:
+        return set()
+    keys = {key}
+    if entity in ADMIN_ENTITIES:
+        stripped = alias_key(ADMIN_SUFFIX.sub("", (name or "").strip().lower()))
+        if len(stripped) >= MIN_STRIPPED_LENGTH:
+            keys.add(stripped)
+    return keys
+
+
+def rebuild_aliases(entity, entity_ids=None):
+    """대상의 모든 언어 이름으로 별칭을 다시 만들고 만든 별칭 수 반환 (entity_ids를 주면 그 대상만)
+
+    지운 대상/중복 관광지는 번역을 읽지 못하므로 별칭만 지워짐 (다시 실행해도 결과가 같음)
+    """
+    translations, parent_field = ALIAS_SOURCES[entity]
+    translations = translations().order_by()
+    aliases = EntityAlias.objects.filter(entity=entity)
+    if entity_ids is not None:
+        translations = translations.filter(**{f"{parent_field}__in": entity_ids})
+        aliases = aliases.filter(entity_id__in=entity_ids)
+
+    keys = set()
+    for entity_id, name in translations.values_list(parent_field, "name").iterator():
+        keys.update((alias, entity_id) for alias in alias_keys(entity, name))
+
+    with transaction.atomic():
+        aliases.delete()
+        EntityAlias.objects.bulk_create(
+            [EntityAlias(alias=alias, entity=entity, entity_id=entity_id) for alias, entity_id in keys],
+            batch_size=ALIAS_BATCH_SIZE
+        )
+    return len(keys)
+
+
+def update_aliases(changes):
+    """변경 기록 배치(ChangeSet)의 바뀐/지운 대상 별칭만 다시 만들기"""
+    for entity in ALIAS_SOURCES:
+        entity_ids = sorted(changes.upserted.get(entity, set()) | changes.deleted.get(entity, set()))
+        for start in range(0, len(entity_ids), ALIAS_BATCH_SIZE):
+            rebuild_aliases(entity, entity_ids[start:start + ALIAS_BATCH_SIZE])
+
+
+def resolve_alias(query, lang="ko", limit=10):
+    """어느 언어의 이름으로든 대상을 찾아서 [{"type", "id", "name"}]을 요청한 언어 이름으로 반환
+
+    별칭 테이블을 한 번 조회해서 대상을 찾고, 찾은 대상 종류별로 lang 이름만 읽음 (lang 번역이 없으면 한국어)
+    """
+    key = alias_key(query)
+    if not key:
+        return []
+    refs = sorted(
+        set(EntityAlias.objects.filter(alias=key).values_list("entity", "entity_id")),
+        key=lambda ref: (ENTITY_ORDER[ref[0]], ref[1])
+    )[:limit]
+
+    ids_by_entity = defaultdict(list)
+    for entity, entity_id in refs:
+        ids_by_entity[entity].append(entity_id)
+
+    names = {}
+    for entity, entity_ids in ids_by_entity.items():
+        translations, parent_field = ALIAS_SOURCES[entity]
+        rows = translations().filter(
+            **{f"{parent_field}__in": entity_ids}, lang__in={lang, "ko"}
+        ).order_by().values_list(parent_field, "lang", "name")
+        for entity_id, translation_lang, name in rows:
+            if translation_lang == lang or (entity, entity_id) not in names:
+                names[(entity, entity_id)] = name
+
+    return [
+        {"type": entity, "id": entity_id, "name": names[(entity, entity_id)]}
+        for entity, entity_id in refs if (entity, entity_id) in names
+    ]
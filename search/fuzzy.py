@@ -0,0 +1,144 @@
+import re
+import threading
+from collections import Counter, defaultdict
+
+from django.contrib.postgres.lookups import TrigramSimilar
+from django.contrib.postgres.search import TrigramSimilarity
+from django.db import connection
+from django.db.models import F
+from places.models import PlaceTranslation
+from regions.models import RegionTranslation, SubRegionTranslation
+from search.suggest import (
+    ENTITY_ORDER, LANGUAGES, PLACE, REGION, SUBREGION, load_places, load_regions, suggest_cache
+)
+
+# 이 유사도 이상인 이름만 후보 (pg_trgm 기본값과 같음, "Gangnum" → "Gangnam-gu" 0.38)
+SIMILARITY_THRESHOLD = 0.3
+
+# pg_trgm과 같은 단어 기준 (영문/숫자/한글 등 글자가 이어진 부분)
+TRIGRAM_WORD = re.compile(r"[^\W_]+")
+
+# (대상, 번역 모델 조회, 대상 ID 필드) - 관광지는 대표 관광지만
+FUZZY_TARGETS = [
+    (REGION, lambda: RegionTranslation.objects.all(), "region_id"),
+    (SUBREGION, lambda: SubRegionTranslation.objects.all(), "sub_region_id"),
+    (PLACE, lambda: PlaceTranslation.objects.filter(place__canonical_id__isnull=True), "place_id"),
+]
+
+
+def trigrams(text):
+    """pg_trgm과 같은 트라이그램 집합 (소문자, 단어마다 앞에 공백 2칸, 뒤에 1칸을 붙여서 3글자씩)"""
+    grams = set()
+    for word in TRIGRAM_WORD.findall((text or "").lower()):
+        padded = f"  {word} "
+        grams.update(padded[index:index + 3] for index in range(len(padded) - 2))
+    return grams
+
+
+def similarity(a, b):
+    """pg_trgm similarity() - 공통 트라이그램 수 / 합친 트라이그램 수"""
+    a_grams, b_grams = trigrams(a), trigrams(b)
+    if not a_grams or not b_grams:
+        return 0.0
+    shared = len(a_grams & b_grams)
+    return shared / (len(a_grams) + len(b_grams) - shared)
+
+
+class TrigramIndex:
+    """트라이그램 → 이름 목록 역색인 (검색어와 트라이그램이 하나라도 겹치는 이름만 유사도 계산)"""
+
+    def __init__(self):
+        self._postings = defaultdict(list)
+        self._sizes = {}
+
+    def add(self, ref, text):
+        grams = trigrams(text)
+        if not grams:
+            return
+        self._sizes[ref] = len(grams)
+        for gram in grams:
+            self._postings[gram].append(ref)
+
+    def search(self, text, threshold=SIMILARITY_THRESHOLD):
+        """[(ref, 유사도)] - 유사도가 threshold 이상인 것만 (순서 없음)"""
+        grams = trigrams(text)
+        shared = Counter()
+        for gram in grams:
+            shared.update(self._postings.get(gram, ()))
+        results = []
+        for ref, count in shared.items():
+            score = count / (len(grams) + self._sizes[ref] - count)
+            if score >= threshold:
+                results.append((ref, score))
+        return results
+
+
+class FuzzyNameIndex:
+    """지역/지역구/관광지 이름 트라이그램 인덱스 (PostgreSQL이 아닐 때 pg_trgm GIN 인덱스 대신)
+
+    처음 검색할 때 빌드하고, 자동완성 인덱스 버전이 바뀌면 다시 빌드
+    """
+
+    def __init__(self, version_cache=suggest_cache):
+        self.version_cache = version_cache
+        self._lock = threading.RLock()
+        self._version = None
+        # 언어별 (TrigramIndex, {(대상, ID): 이름})
+        self._indexes = {}
+
+    def build(self):
+        version = self.version_cache.get_version()
+        indexes = {lang: (TrigramIndex(), {}) for lang in LANGUAGES}
+        for ref, (_, names) in {**load_regions(), **load_places()}.items():
+            for lang, name in names.items():
+                if lang in indexes:
+                    indexes[lang][0].add(ref, name)
+                    indexes[lang][1][ref] = name
+        with self._lock:
+            self._indexes = indexes
+            self._version = version
+
+    def search(self, query, lang="ko", threshold=SIMILARITY_THRESHOLD):
+        with self._lock:
+            if self._version != self.version_cache.get_version():
+                self.build()
+            index, names = self._indexes.get(lang, (TrigramIndex(), {}))
+            return [
+                {"type": entity, "id": entity_id, "name": names[(entity, entity_id)], "score": score}
+                for (entity, entity_id), score in index.search(query, threshold)
+            ]
+
+
+fuzzy_index = FuzzyNameIndex()
+
+
+def fuzzy_search(query, lang="ko", limit=10, threshold=SIMILARITY_THRESHOLD):
+    """오타가 있어도 비슷한 이름을 [{"type", "id", "name", "score"}]로 유사도 높은 순 반환
+
+    PostgreSQL은 번역 이름의 pg_trgm GIN 인덱스(% 연산자)로 후보만 찾고 similarity()로 정렬
+    다른 DB(테스트용 SQLite 등)는 같은 방식으로 계산하는 메모리 트라이그램 인덱스 사용
+    """
+    if not trigrams(query):
+        return []
+    if connection.vendor == "postgresql":
+        results = _search_postgresql(query, lang, limit, threshold)
+    else:
+        results = fuzzy_index.search(query, lang, threshold)
+    results.sort(key=lambda result: (-result["score"], ENTITY_ORDER[result["type"]], result["id"]))
+    return results[:limit]
+
+
+def _search_postgresql(query, lang, limit, threshold):
+    # % 연산자의 기준 유사도 (세션 설정이라 매번 지정)
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT set_limit(%s)", [threshold])
+
+    results = []
+    for entity, translations, id_field in FUZZY_TARGETS:
+        rows = translations().filter(TrigramSimilar(F("name"), query), lang=lang).annotate(
+            score=TrigramSimilarity("name", query)
+        ).order_by("-score", id_field).values_list(id_field, "name", "score")[:limit]
+        results.extend(
+            {"type": entity, "id": entity_id, "name": name, "score": score} for entity_id, name, score in rows
+        )
+    return results
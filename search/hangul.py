@@ -0,0 +1,62 @@
+import re
+import unicodedata
+
+# 한글 음절 (가~힣) = 0xAC00 + (초성 × 21 + 중성) × 28 + 종성
+SYLLABLE_BASE = 0xAC00
+SYLLABLE_LAST = 0xD7A3
+
+CHOSUNG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+JUNGSUNG = "ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ"
+JONGSUNG = ["", *"ㄱㄲㄳㄴㄵㄶㄷㄹㄺㄻㄼㄽㄾㄿㅀㅁㅂㅄㅅㅆㅇㅈㅊㅋㅌㅍㅎ"]
+
+# 겹모음/겹받침은 입력 순서대로 나눔 ("고" 입력 중에도 "과"가, "달" 입력 중에도 "닭"이 앞부분 일치하게)
+COMPOUND_JAMO = {
+    "ㅘ": "ㅗㅏ", "ㅙ": "ㅗㅐ", "ㅚ": "ㅗㅣ", "ㅝ": "ㅜㅓ", "ㅞ": "ㅜㅔ", "ㅟ": "ㅜㅣ", "ㅢ": "ㅡㅣ",
+    "ㄳ": "ㄱㅅ", "ㄵ": "ㄴㅈ", "ㄶ": "ㄴㅎ", "ㄺ": "ㄹㄱ", "ㄻ": "ㄹㅁ", "ㄼ": "ㄹㅂ", "ㄽ": "ㄹㅅ",
+    "ㄾ": "ㄹㅌ", "ㄿ": "ㄹㅍ", "ㅀ": "ㄹㅎ", "ㅄ": "ㅂㅅ",
+}
+
+# 키보드로 입력하는 호환용 자모 (ㄱ~ㅣ)
+COMPATIBILITY_JAMO = re.compile(r"[ㄱ-ㆎ]+")
+NOT_COMPATIBILITY_JAMO = re.compile(r"[^ㄱ-ㆎ]+")
+CONSONANTS = set(CHOSUNG)
+
+
+def normalize(text):
+    """NFKC 정규화 (호환용 자모는 그대로 - NFKC는 ㄱ을 조합용 자모 ᄀ로 바꿔서 검색어와 달라짐)"""
+    return NOT_COMPATIBILITY_JAMO.sub(lambda match: unicodedata.normalize("NFKC", match.group()), text)
+
+
+def is_syllable(char):
+    return SYLLABLE_BASE <= ord(char) <= SYLLABLE_LAST
+
+
+def has_hangul(text):
+    return any(is_syllable(char) or COMPATIBILITY_JAMO.match(char) for char in text)
+
+
+def is_chosung_query(text):
+    """자음만 입력한 검색어인지 (ㄱㄴㄱ → 초성 검색)"""
+    return bool(text) and all(char in CONSONANTS for char in text)
+
+
+def decompose(text):
+    """음절을 자모로 풀어서 이어 붙임 ("강남" → "ㄱㅏㅇㄴㅏㅁ", 한글이 아닌 글자는 그대로)"""
+    jamo = []
+    for char in text:
+        if is_syllable(char):
+            code = ord(char) - SYLLABLE_BASE
+            jamo.append(CHOSUNG[code // 588])
+            jamo.append(JUNGSUNG[code // 28 % 21])
+            jamo.append(JONGSUNG[code % 28])
+        else:
+            jamo.append(char)
+    return "".join(COMPOUND_JAMO.get(char, char) for char in "".join(jamo))
+
+
+def chosung(text):
+    """음절의 초성만 이어 붙임 ("강남구" → "ㄱㄴㄱ", 자음은 그대로, 그 밖의 글자는 버림)"""
+    return "".join(
+        CHOSUNG[(ord(char) - SYLLABLE_BASE) // 588] if is_syllable(char) else char
+        for char in text if is_syllable(char) or char in CONSONANTS
+    )
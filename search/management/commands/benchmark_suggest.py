@@ -0,0 +1,64 @@
+import random
+import time
+
+from django.core.management.base import BaseCommand
+from search.hangul import chosung
+from search.suggest import SuggestIndex
+
+# 일치 수를 셀 검색어 수 (전체를 훑어서 세므로 짧은 검색어는 느림)
+MATCH_SAMPLE = 20
+
+# 가상 관광지 이름 재료 (실제 이름처럼 앞부분이 겹치게 음절 수를 제한)
+SYLLABLES = list("가강경고광구국남대도동명문미부산서성소수신안양연영용원월인장전정제중진천청춘평포한해호화")
+SUFFIXES = ["", "", "공원", "시장", "박물관", "해수욕장", "타워", "사", "궁", "마을"]
+
+# (이름, 검색어 만드는 함수) - 첫 글자 / 초성 1~2자 / 이름 앞부분 / 초성 / 입력 중인 음절 / 중간 음절
+# (첫 글자, 초성 1~2자는 카탈로그 대부분과 일치 - 미리 계산한 상위 목록을 읽음)
+QUERY_KINDS = [
+    ("첫 글자", lambda name: name[:1]),
+    ("초성 1자", lambda name: chosung(name[:1])),
+    ("초성 2자", lambda name: chosung(name[:2])),
+    ("이름", lambda name: name[:3]),
+    ("초성", lambda name: chosung(name[:4])),
+    ("입력 중", lambda name: name[:2] + chosung(name[2])),
+    ("중간", lambda name: name[1:4]),
+]
+
+
+def make_name(rng):
+    return "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(3, 5))) + rng.choice(SUFFIXES)
+
+
+class Command(BaseCommand):
+    help = "자동완성 인덱스 조회 시간을 카탈로그 크기별로 측정합니다. (DB 없이 가상 이름으로 빌드)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--sizes", type=str, default="1000,10000,100000", help="이름 수 (쉼표 구분)")
+        parser.add_argument("--queries", type=int, default=2000, help="종류별 조회 횟수")
+        parser.add_argument("--seed", type=int, default=42)
+
+    def handle(self, *args, **options):
+        rng = random.Random(options["seed"])
+        for size in [int(size) for size in options["sizes"].split(",")]:
+            entries = {("place", place_id): (rng.randrange(1000), {"ko": make_name(rng)}) for place_id in range(size)}
+            index = SuggestIndex()
+            started = time.perf_counter()
+            index.load(entries)
+            build_time = time.perf_counter() - started
+
+            names = [entries[("place", rng.randrange(size))][1]["ko"] for _ in range(options["queries"])]
+            timings = []
+            for kind, make_query in QUERY_KINDS:
+                queries = [make_query(name) for name in names]
+                started = time.perf_counter()
+                for query in queries:
+                    index.lookup(query, "ko")
+                elapsed = time.perf_counter() - started
+                # 긴 검색어의 조회 시간은 전체 크기가 아니라 일치하는 항목 수에 비례 (일치 수를 같이 출력)
+                sample = queries[:MATCH_SAMPLE]
+                matched = sum(len(index.lookup(query, "ko", limit=size)) for query in sample)
+                timings.append(f"{kind} {elapsed / len(queries) * 1e6:.1f}µs (일치 {matched / len(sample):.1f}개)")
+
+            self.stdout.write(
+                f"📏 이름 {size:,}개 (키 {len(index):,}개, 빌드 {build_time:.2f}초) | " + " · ".join(timings)
+            )
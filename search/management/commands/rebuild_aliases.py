@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+from search.aliases import ALIAS_SOURCES, rebuild_aliases
+
+
+class Command(BaseCommand):
+    help = "지역/지역구/카테고리/관광지의 모든 언어 이름으로 검색 별칭을 다시 만듭니다. (평소에는 변경 기록으로 갱신)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--entity", choices=list(ALIAS_SOURCES), help="이 대상만 다시 만들기")
+
+    def handle(self, *args, **options):
+        entities = [options["entity"]] if options["entity"] else list(ALIAS_SOURCES)
+        for entity in entities:
+            count = rebuild_aliases(entity)
+            self.stdout.write(f"🏷️  {entity}: 별칭 {count}개")
+        self.stdout.write(self.style.SUCCESS("✅ 검색 별칭 다시 만들기 완료"))
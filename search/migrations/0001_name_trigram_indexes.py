@@ -0,0 +1,38 @@
+from django.db import migrations
+
+# 오타 검색(search.fuzzy)용 번역 이름 트라이그램 인덱스
+CREATE_TRIGRAM_INDEXES = """
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+CREATE INDEX IF NOT EXISTS region_tr_name_trgm_idx ON region_translation USING gin (name gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS subregion_tr_name_trgm_idx ON subregion_translation USING gin (name gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS place_tr_name_trgm_idx ON place_translation USING gin (name gin_trgm_ops);
+"""
+
+DROP_TRIGRAM_INDEXES = """
+DROP INDEX IF EXISTS region_tr_name_trgm_idx;
+DROP INDEX IF EXISTS subregion_tr_name_trgm_idx;
+DROP INDEX IF EXISTS place_tr_name_trgm_idx;
+"""
+
+
+# pg_trgm 인덱스는 PostgreSQL에서만 (다른 DB에서는 search.fuzzy가 메모리 인덱스로 대신함)
+def create_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor == "postgresql":
+        schema_editor.execute(CREATE_TRIGRAM_INDEXES)
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor == "postgresql":
+        schema_editor.execute(DROP_TRIGRAM_INDEXES)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('places', '0011_place_translation_search_vector'),
+        ('regions', '0005_subregion_popularity_ordering'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.18 on 2026-10-17 20:28
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('search', '0001_name_trigram_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EntityAlias',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('alias', models.CharField(max_length=100, verbose_name='별칭')),
+                ('entity', models.CharField(choices=[('place', '관광지'), ('region', '지역'), ('subregion', '서브지역'), ('category', '카테고리'), ('subcategory', '서브카테고리')], max_length=20, verbose_name='대상')),
+                ('entity_id', models.BigIntegerField(verbose_name='대상 ID')),
+            ],
+            options={
+                'verbose_name': '검색 별칭',
+                'verbose_name_plural': '검색 별칭',
+                'db_table': 'search_alias',
+                'indexes': [models.Index(fields=['entity', 'entity_id'], name='search_alias_entity_idx')],
+                'constraints': [models.UniqueConstraint(fields=('alias', 'entity', 'entity_id'), name='search_alias_unique')],
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-17 20:51
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('search', '0002_entity_alias'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='entityalias',
+            name='alias',
+            field=models.CharField(max_length=200, verbose_name='별칭'),
+        ),
+    ]
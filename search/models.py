@@ -0,0 +1,32 @@
+from django.db import models
+from outbox.models import CatalogChange
+
+
+# 모든 언어의 이름을 정규화한 별칭 → 지역/지역구/카테고리/관광지 (search.aliases가 변경 기록으로 갱신)
+class EntityAlias(models.Model):
+    id = models.BigAutoField(primary_key=True)
+    # search.suggest.suggest_key로 정규화한 이름 (행정구역 접미사를 뗀 이름도 따로 저장)
+    # 가장 긴 원본 이름(관광지명 200자)만큼, NFKC로 길어진 이름은 search.aliases가 잘라서 저장
+    alias = models.CharField(max_length=200, verbose_name="별칭")
+    entity = models.CharField(
+        max_length=20,
+        choices=CatalogChange.ENTITY_CHOICES,
+        verbose_name="대상"
+    )
+    entity_id = models.BigIntegerField(verbose_name="대상 ID")
+
+    class Meta:
+        db_table = "search_alias"
+        verbose_name = "검색 별칭"
+        verbose_name_plural = "검색 별칭"
+        constraints = [
+            # 별칭으로 찾을 때도 이 인덱스 사용
+            models.UniqueConstraint(fields=["alias", "entity", "entity_id"], name="search_alias_unique"),
+        ]
+        indexes = [
+            # 대상이 바뀌면 그 대상의 별칭만 지우고 다시 만들기
+            models.Index(fields=["entity", "entity_id"], name="search_alias_entity_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.alias} → {self.get_entity_display()} {self.entity_id}"
@@ -0,0 +1,19 @@
+from outbox.consumer import register
+from outbox.models import CatalogChange
+from search.aliases import update_aliases
+from search.suggest import suggest_cache
+
+
+# 이름이 바뀔 수 있는 변경이 처리되면 버전을 바꿔서 워커들이 바뀐 것만 다시 읽게
+@register(CatalogChange.ENTITY_PLACE, CatalogChange.ENTITY_REGION, CatalogChange.ENTITY_SUBREGION)
+def invalidate_suggest_index(changes):
+    suggest_cache.invalidate()
+
+
+# 이름이 바뀐 대상의 별칭만 다시 만들기 (핸들러가 실패하면 배치 전체가 다시 처리됨)
+@register(
+    CatalogChange.ENTITY_PLACE, CatalogChange.ENTITY_REGION, CatalogChange.ENTITY_SUBREGION,
+    CatalogChange.ENTITY_CATEGORY, CatalogChange.ENTITY_SUBCATEGORY
+)
+def update_entity_aliases(changes):
+    update_aliases(changes)
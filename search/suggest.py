@@ -0,0 +1,444 @@
+import bisect
+import heapq
+import re
+import sys
+import threading
+import time
+from collections import defaultdict
+from datetime import timedelta
+
+from django.conf import settings
+from django.utils import timezone
+from helper.catalog_cache import CatalogCache
+from outbox.models import CatalogChange
+from places.models import Place, PlaceTranslation
+from regions.models import RegionTranslation, SubRegion, SubRegionTranslation
+from search.hangul import chosung, decompose, has_hangul, is_chosung_query, normalize
+
+LANGUAGES = ["ko", "en", "jp", "cn"]
+
+REGION = CatalogChange.ENTITY_REGION
+SUBREGION = CatalogChange.ENTITY_SUBREGION
+PLACE = CatalogChange.ENTITY_PLACE
+
+# 인기도가 같으면 지역 → 지역구 → 관광지 순
+ENTITY_ORDER = {REGION: 0, SUBREGION: 1, PLACE: 2}
+
+# 버전 확인 간격 (초) - 이 간격 안의 조회는 Redis도 보지 않고 메모리에서만
+CHECK_INTERVAL = 1.0
+
+# 변경 기록을 겹쳐 읽는 시간 (늦게 커밋된 기록이나 서버 간 시계 차이로 놓치지 않게, 다시 적용해도 결과는 같음)
+CHANGE_OVERLAP = timedelta(minutes=1)
+
+# 바뀐 관광지가 이보다 많으면 부분 갱신 대신 다시 빌드
+REBUILD_THRESHOLD = 5000
+
+# 언어별로 바뀐 키가 이보다 적으면 키마다 bisect로 넣고 빼고, 많으면 배열 전체를 한 번에 다시 정렬
+# (키 하나에 배열 크기만큼 옮기는 비용, 100만 키 배열에서 약 0.5ms - 전체 정렬 약 2초와 비슷해지는 지점보다 작게)
+INSORT_MAX_KEYS = 2000
+
+# 접두어별 결과 캐시 최대 개수 (인덱스가 바뀌면 새로 시작)
+RESULT_CACHE_SIZE = 10000
+
+# 자동완성 인덱스 버전 (outbox 핸들러가 지역/관광지 변경을 처리하면 바뀜)
+suggest_cache = CatalogCache("suggest")
+
+# 한글 이름의 초성/자모 키 구분 (같은 정렬 배열에서 이름 키와 섞이지 않게)
+CHOSUNG_TAG = "\x01"
+JAMO_TAG = "\x02"
+
+# 한글 이름은 앞에서부터 이 음절 수까지 각 음절에서 시작하는 초성/자모 키도 저장 (중간 일치용)
+MAX_INFIX_OFFSETS = 10
+
+# 자모 키 최대 길이 (검색어도 같은 길이로 잘라서 비교)
+MAX_JAMO_KEY_LENGTH = 30
+
+# 태그를 뺀 길이가 이 이하인 검색어 키는 상위 TOP_K개를 미리 계산 (이보다 긴 키는 일치하는 항목이 적어서 훑어도 빠름)
+# 자모는 음절 하나가 최대 5자 ("괅" → ㄱㅗㅏㄹㄱ) - 한 글자 입력은 모두 미리 계산한 목록으로
+SHORT_PREFIX_LENGTHS = {"": 2, CHOSUNG_TAG: 2, JAMO_TAG: 5}
+
+# 미리 계산하는 상위 개수 (API 최대 limit - search.views.SUGGEST_MAX_LIMIT, 더 많이 요청하면 훑음)
+TOP_K = 20
+
+# 접두어 구간의 끝을 bisect로 찾을 때 붙이는 가장 큰 글자
+MAX_CHAR = chr(sys.maxunicode)
+
+NON_WORD = re.compile(r"[\W_]+")
+
+
+def suggest_key(text):
+    """이름/접두어 비교용 키 (전각/반각 통일, 소문자, 공백/기호 제거)"""
+    return NON_WORD.sub("", normalize(text or "").lower())
+
+
+def index_keys(name):
+    """이름의 [(키, 시작 음절 위치)] - 이름 키, 한글이면 음절마다 초성 키와 자모 키 (빌드할 때 한 번만 분해)"""
+    key = suggest_key(name)
+    if not key:
+        return []
+    keys = [(key, 0)]
+    if has_hangul(key):
+        # 글자마다 한 번만 분해해서 음절 위치별 키는 이어 붙이기만 함
+        initials = [chosung(char) for char in key]
+        jamo = [decompose(char) for char in key]
+        for offset in range(min(len(key), MAX_INFIX_OFFSETS)):
+            # 한글이 아닌 글자에서 시작하는 중간 키는 만들지 않음
+            if offset and not has_hangul(key[offset]):
+                continue
+            if initials[offset]:
+                keys.append((CHOSUNG_TAG + "".join(initials[offset:]), offset))
+            keys.append((JAMO_TAG + "".join(jamo[offset:])[:MAX_JAMO_KEY_LENGTH], offset))
+    return keys
+
+
+def query_keys(prefix):
+    """검색어로 찾을 키 목록 (자음만이면 초성 키, 한글이 섞였으면 자모 키도 - 입력 중인 음절도 일치)"""
+    key = suggest_key(prefix)
+    if not key:
+        return []
+    if is_chosung_query(key):
+        return [key, CHOSUNG_TAG + key]
+    if has_hangul(key):
+        return [key, JAMO_TAG + decompose(key)[:MAX_JAMO_KEY_LENGTH]]
+    return [key]
+
+
+def load_regions():
+    """지역/지역구 {(대상, ID): (인기도, {언어: 이름})} (지역 인기도는 지역구 즐겨찾기 수 합)"""
+    popularity = defaultdict(int)
+    for subregion_id, region_id, favorite_count in SubRegion.objects.order_by().values_list(
+        "id", "region_id", "favorite_count"
+    ):
+        popularity[(SUBREGION, subregion_id)] = favorite_count
+        popularity[(REGION, region_id)] += favorite_count
+
+    names = defaultdict(dict)
+    for region_id, lang, name in RegionTranslation.objects.order_by().values_list("region_id", "lang", "name"):
+        names[(REGION, region_id)][lang] = name
+    for subregion_id, lang, name in SubRegionTranslation.objects.order_by().values_list(
+        "sub_region_id", "lang", "name"
+    ):
+        names[(SUBREGION, subregion_id)][lang] = name
+    return {ref: (popularity[ref], by_lang) for ref, by_lang in names.items()}
+
+
+def load_places(place_ids=None):
+    """대표 관광지 {(대상, ID): (즐겨찾기 수, {언어: 이름})} (place_ids를 주면 그 관광지만)"""
+    places = Place.objects.canonical().order_by()
+    translations = PlaceTranslation.objects.filter(place__canonical_id__isnull=True).order_by()
+    if place_ids is not None:
+        places = places.filter(id__in=place_ids)
+        translations = translations.filter(place_id__in=place_ids)
+
+    favorite_counts = dict(places.values_list("id", "favorite_count"))
+    names = defaultdict(dict)
+    for place_id, lang, name in translations.values_list("place_id", "lang", "name").iterator():
+        names[place_id][lang] = name
+    return {
+        (PLACE, place_id): (favorite_counts[place_id], by_lang)
+        for place_id, by_lang in names.items() if place_id in favorite_counts
+    }
+
+
+def short_prefixes(key):
+    """상위 목록을 미리 계산해 둘 키의 짧은 접두어들 (태그를 뺀 길이 SHORT_PREFIX_LENGTHS까지)"""
+    tag = key[0] if key[0] in (CHOSUNG_TAG, JAMO_TAG) else ""
+    return [key[:length] for length in range(len(tag) + 1, min(len(key), len(tag) + SHORT_PREFIX_LENGTHS[tag]) + 1)]
+
+
+def is_short(query_key):
+    tag = query_key[0] if query_key[0] in (CHOSUNG_TAG, JAMO_TAG) else ""
+    return len(query_key) - len(tag) <= SHORT_PREFIX_LENGTHS[tag]
+
+
+def scan(lang_keys, query_key):
+    """query_key로 시작하는 키의 (중간 일치 여부, (대상, ID)) - bisect로 첫 위치를 찾고 일치하는 구간만 훑음"""
+    for index in range(bisect.bisect_left(lang_keys, (query_key,)), len(lang_keys)):
+        key, entity, entity_id, offset = lang_keys[index]
+        if not key.startswith(query_key):
+            break
+        yield offset > 0, (entity, entity_id)
+
+
+def rank(entries, ref):
+    return -entries[ref][0], ENTITY_ORDER[ref[0]], ref[1]
+
+
+def best(matches, entries, limit):
+    """{(대상, ID): 중간 일치 여부} 중 앞부분 일치 → 중간 일치 순, 같으면 인기순 최대 limit개"""
+    return heapq.nsmallest(limit, matches, key=lambda ref: (matches[ref], *rank(entries, ref)))
+
+
+def build_top(lang_keys, entries):
+    """{짧은 접두어: [(중간 일치 여부, (대상, ID))]} 순위순 최대 TOP_K개
+
+    정렬된 배열을 짧은 접두어가 모두 같은 구간으로 나눠서 구간마다 한 번만 순위를 매기고 접두어별로 합침
+    (구간별 상위를 합친 것 안에 접두어 전체의 상위가 모두 있음)
+    """
+    # 순위를 정수 하나로 (중간 일치면 항목 수만큼 뒤로) - 한 항목은 앞부분/중간 일치로 최대 두 번 나오므로 두 배를 뽑음
+    refs = sorted(entries, key=lambda ref: rank(entries, ref))
+    order = {ref: position for position, ref in enumerate(refs)}
+    size = len(refs)
+    scores = defaultdict(set)
+    index = 0
+    while index < len(lang_keys):
+        key = lang_keys[index][0]
+        prefixes = short_prefixes(key)
+        # 가장 긴 접두어보다 긴 키들, 또는 가장 긴 접두어와 같은 키들
+        bound = prefixes[-1] + MAX_CHAR if len(key) > len(prefixes[-1]) else key + "\x00"
+        end = bisect.bisect_left(lang_keys, (bound,), index)
+        group = heapq.nsmallest(2 * TOP_K, {
+            order[(entity, entity_id)] + (size if offset else 0)
+            for _, entity, entity_id, offset in lang_keys[index:end]
+        })
+        for prefix in prefixes:
+            scores[prefix].update(group)
+        index = end
+
+    top = {}
+    for prefix, prefix_scores in scores.items():
+        matches = {}
+        for score in heapq.nsmallest(2 * TOP_K, prefix_scores):
+            matches.setdefault(refs[score % size], score >= size)
+        top[prefix] = [(infix, ref) for ref, infix in matches.items()][:TOP_K]
+    return top
+
+
+class SuggestSnapshot:
+    """조회용 인덱스 한 벌 (바꾸지 않고 새로 만들어 통째로 교체하므로 조회는 잠금 없이 읽음)"""
+
+    def __init__(self, entries, keys, top):
+        # {(대상, ID): (인기도, {언어: 이름})}
+        self.entries = entries
+        # 언어별 [(키, 대상, ID, 시작 음절 위치)] 키 순 정렬
+        self.keys = keys
+        # 언어별 {짧은 접두어: [(중간 일치 여부, (대상, ID))]} 순위순 최대 TOP_K개
+        self.top = top
+        # 이 인덱스로 찾은 접두어별 결과 (인덱스를 교체하면 함께 버려짐)
+        self.results = {}
+
+    def lookup(self, prefix, lang="ko", limit=10):
+        """이름 앞부분 일치 → 중간 음절부터 일치 순, 같으면 인기순
+
+        짧은 검색어 키는 미리 계산한 상위 목록만, 긴 키는 그 키로 시작하는 항목만 훑음
+        (키마다 상위 limit개를 합친 것 안에 전체 상위 limit개가 모두 있음)
+        """
+        lang_keys = self.keys.get(lang, [])
+        lang_top = self.top.get(lang, {})
+        matches = {}
+        for query_key in query_keys(prefix):
+            if limit <= TOP_K and is_short(query_key):
+                found = lang_top.get(query_key, ())
+            else:
+                found = scan(lang_keys, query_key)
+            for infix, ref in found:
+                matches[ref] = infix and matches.get(ref, True)
+
+        return [
+            {"type": entity, "id": entity_id, "name": self.entries[(entity, entity_id)][1][lang]}
+            for entity, entity_id in best(matches, self.entries, limit)
+        ]
+
+
+class SuggestIndex:
+    """지역/지역구/관광지 이름 자동완성 인덱스 (워커 프로세스 메모리, 언어별 정렬 배열 + bisect)
+
+    한글 이름은 초성/자모 키도 함께 저장해서 "ㄱㄴㄱ", "강ㄴ", "남구" 같은 입력도 찾음
+    "ㄱ", "가"처럼 카탈로그 대부분과 일치하는 짧은 키는 접두어별 상위 TOP_K개를 미리 계산해 둠
+    처음 조회할 때 빌드하고, 이후에는 CHECK_INTERVAL마다 버전만 확인해서
+    바뀌었으면 그동안 처리된 변경 기록의 대상만 다시 읽어 새 인덱스로 교체 (조회는 DB도 잠금도 보지 않음)
+    """
+
+    def __init__(self, version_cache=suggest_cache, check_interval=CHECK_INTERVAL):
+        self.version_cache = version_cache
+        self.check_interval = check_interval
+        # 빌드/갱신만 잠금 (조회는 그동안 이전 인덱스를 읽음)
+        self._lock = threading.RLock()
+        self._loaded = False
+        self._version = None
+        self._checked_at = 0.0
+        # 마지막으로 변경 기록을 읽은 시간
+        self._synced_at = None
+        self._snapshot = SuggestSnapshot({}, {lang: [] for lang in LANGUAGES}, {lang: {} for lang in LANGUAGES})
+
+    def __len__(self):
+        return sum(len(lang_keys) for lang_keys in self._snapshot.keys.values())
+
+    def load(self, entries):
+        """{(대상, ID): (인기도, {언어: 이름})}로 배열을 새로 만들어서 교체"""
+        keys = {lang: [] for lang in LANGUAGES}
+        for (entity, entity_id), (_, names) in entries.items():
+            for lang, name in names.items():
+                if lang in keys:
+                    keys[lang].extend((key, entity, entity_id, offset) for key, offset in index_keys(name))
+        for lang_keys in keys.values():
+            lang_keys.sort()
+        top = {lang: build_top(lang_keys, entries) for lang, lang_keys in keys.items()}
+        self._snapshot = SuggestSnapshot(entries, keys, top)
+
+    def build(self):
+        """전체 다시 빌드 (빌드 중 바뀐 것은 다음 갱신 때 다시 읽도록 버전/시간을 먼저 기록)"""
+        version = self.version_cache.get_version()
+        synced_at = timezone.now()
+        self.load({**load_regions(), **load_places()})
+        with self._lock:
+            self._version = version
+            self._synced_at = synced_at
+            self._checked_at = time.monotonic()
+            self._loaded = True
+
+    @staticmethod
+    def _entry_keys(ref, entry):
+        """항목의 {언어: [(키, 대상, ID, 시작 음절 위치)]}"""
+        keys = defaultdict(list)
+        for lang, name in entry[1].items():
+            keys[lang].extend((key, *ref, offset) for key, offset in index_keys(name))
+        return keys
+
+    def _replace(self, removed, updated):
+        """지울 항목/바뀐 항목을 반영한 새 인덱스로 교체 (바뀐 언어의 배열/상위 목록만 복사해서 고침)
+
+        바뀐 키가 적은 언어는 bisect로 넣고 빼고, 많은 언어는 지울 키를 걸러내고 새 키와 한 번에 정렬
+        """
+        old = self._snapshot
+        entries = dict(old.entries)
+        changed = removed | set(updated)
+        removed_keys = defaultdict(set)
+        added_keys = defaultdict(list)
+        for ref in changed:
+            entry = entries.pop(ref, None)
+            if entry is not None:
+                for lang, keys in self._entry_keys(ref, entry).items():
+                    removed_keys[lang].update(keys)
+        for ref, entry in updated.items():
+            entries[ref] = entry
+            for lang, keys in self._entry_keys(ref, entry).items():
+                added_keys[lang].extend(keys)
+
+        keys = dict(old.keys)
+        top = dict(old.top)
+        for lang, lang_keys in old.keys.items():
+            if not removed_keys[lang] and not added_keys[lang]:
+                continue
+            if len(removed_keys[lang]) + len(added_keys[lang]) <= INSORT_MAX_KEYS:
+                lang_keys = list(lang_keys)
+                for item in removed_keys[lang]:
+                    index = bisect.bisect_left(lang_keys, item)
+                    if index < len(lang_keys) and lang_keys[index] == item:
+                        del lang_keys[index]
+                for item in added_keys[lang]:
+                    bisect.insort(lang_keys, item)
+            else:
+                kept = [item for item in lang_keys if item not in removed_keys[lang]]
+                # 정렬된 두 구간을 이어 붙인 정렬은 Timsort가 병합만 함 (C 구현이라 heapq.merge보다 빠름)
+                lang_keys = sorted(kept + added_keys[lang])
+            keys[lang] = lang_keys
+            top[lang] = self._replace_top(
+                old.top[lang], lang_keys, old.entries, entries, changed, removed_keys[lang], added_keys[lang]
+            )
+        self._snapshot = SuggestSnapshot(entries, keys, top)
+
+    @staticmethod
+    def _replace_top(lang_top, lang_keys, old_entries, entries, changed, removed_keys, added_keys):
+        """바뀐 키의 짧은 접두어만 상위 목록을 다시 계산 (바뀐 항목을 빼고 새 키를 합침)"""
+        added = defaultdict(dict)
+        for key, entity, entity_id, offset in added_keys:
+            for prefix in short_prefixes(key):
+                added[prefix][(entity, entity_id)] = offset > 0 and added[prefix].get((entity, entity_id), True)
+        prefixes = set(added).union(*(short_prefixes(item[0]) for item in removed_keys))
+
+        lang_top = dict(lang_top)
+        for prefix in prefixes:
+            current = lang_top.get(prefix, [])
+            matches = {ref: infix for infix, ref in current if ref not in changed}
+            matches.update(added[prefix])
+            ranked = best(matches, entries, TOP_K)
+            # 목록이 꽉 차 있었으면 목록 밖 항목은 모두 마지막 항목보다 뒤 - 그보다 앞선 TOP_K개가 모이지 않으면 다시 훑음
+            if len(current) == TOP_K:
+                last_infix, last_ref = current[-1]
+                threshold = (last_infix, *rank(old_entries, last_ref))
+                if len(ranked) < TOP_K or (matches[ranked[-1]], *rank(entries, ranked[-1])) > threshold:
+                    matches = {}
+                    for infix, ref in scan(lang_keys, prefix):
+                        matches[ref] = infix and matches.get(ref, True)
+                    ranked = best(matches, entries, TOP_K)
+            if ranked:
+                lang_top[prefix] = [(matches[ref], ref) for ref in ranked]
+            else:
+                lang_top.pop(prefix, None)
+        return lang_top
+
+    def apply_changes(self):
+        """마지막으로 읽은 뒤 처리된 변경 기록의 대상만 다시 읽어서 반영"""
+        retention = timedelta(days=settings.CATALOG_OUTBOX_RETENTION_DAYS)
+        synced_at = timezone.now()
+        # 변경 기록이 이미 지워졌을 수 있으면 다시 빌드
+        if synced_at - self._synced_at > retention - CHANGE_OVERLAP:
+            return self.build()
+
+        changed = set(CatalogChange.objects.filter(
+            processed_at__gte=self._synced_at - CHANGE_OVERLAP,
+            entity__in=[REGION, SUBREGION, PLACE]
+        ).order_by().values_list("entity", "entity_id").distinct())
+        place_ids = {entity_id for entity, entity_id in changed if entity == PLACE}
+        if len(place_ids) > REBUILD_THRESHOLD:
+            return self.build()
+
+        entries = self._snapshot.entries
+        updated = {}
+        removed = set()
+        # 지역/지역구는 수가 적고 지역 인기도가 지역구에 따라 바뀌어서 통째로 다시 읽음
+        if any(entity != PLACE for entity, _ in changed):
+            updated.update(load_regions())
+            removed |= {ref for ref in entries if ref[0] != PLACE and ref not in updated}
+        if place_ids:
+            places = load_places(place_ids)
+            updated.update(places)
+            removed |= {(PLACE, place_id) for place_id in place_ids} - set(places)
+
+        self._replace(
+            {ref for ref in removed if ref in entries},
+            {ref: entry for ref, entry in updated.items() if entries.get(ref) != entry}
+        )
+        self._synced_at = synced_at
+
+    def refresh(self):
+        """처음이면 빌드, 아니면 CHECK_INTERVAL마다 버전을 확인해서 바뀐 것만 반영"""
+        if self._loaded and time.monotonic() - self._checked_at < self.check_interval:
+            return
+        # 처음 빌드가 아니면 다른 스레드가 갱신하는 동안 기다리지 않고 이전 인덱스로 조회
+        if not self._lock.acquire(blocking=not self._loaded):
+            return
+        try:
+            if not self._loaded:
+                self.build()
+                return
+            if time.monotonic() - self._checked_at < self.check_interval:
+                return
+            self._checked_at = time.monotonic()
+            version = self.version_cache.get_version()
+            if version != self._version:
+                self.apply_changes()
+                self._version = version
+        finally:
+            self._lock.release()
+
+    def suggest(self, prefix, lang="ko", limit=10):
+        """입력한 앞부분과 일치하는 이름을 최대 limit개 [{"type", "id", "name"}] 반환 (같은 입력은 결과 캐시)"""
+        self.refresh()
+        snapshot = self._snapshot
+        cache_key = (lang, suggest_key(prefix), limit)
+        results = snapshot.results.get(cache_key)
+        if results is None:
+            results = snapshot.lookup(prefix, lang, limit)
+            if len(snapshot.results) >= RESULT_CACHE_SIZE:
+                snapshot.results.clear()
+            snapshot.results[cache_key] = results
+        return results
+
+    def lookup(self, prefix, lang="ko", limit=10):
+        """지금 인덱스로 조회 (갱신/캐시 없이)"""
+        return self._snapshot.lookup(prefix, lang, limit)
+
+
+suggest_index = SuggestIndex()
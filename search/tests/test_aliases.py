@@ -0,0 +1,125 @@
+from io import StringIO
+from django.core.cache import cache
+from django.core.management import call_command
+from rest_framework import status
+from rest_framework.test import APITestCase
+from categories.models import Category, CategoryTranslation
+from outbox.consumer import OutboxConsumer
+from outbox.models import CatalogChange
+from places.models import Place, PlaceTranslation
+from regions.models import Region, RegionTranslation, SubRegion, SubRegionTranslation
+from search.aliases import alias_keys, resolve_alias
+from search.models import EntityAlias
+
+
+def resolved(results):
+    return [(result["type"], result["id"], result["name"]) for result in results]
+
+
+# 별칭 테스트 (변경 기록 처리로 별칭 갱신)
+class AliasTest(APITestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.seoul = Region.objects.create()
+        for lang, name in [("ko", "서울특별시"), ("en", "Seoul"), ("cn", "首尔特别市")]:
+            RegionTranslation.objects.create(region=self.seoul, lang=lang, name=name)
+        self.gangnam = SubRegion.objects.create(region=self.seoul)
+        for lang, name in [("ko", "강남구"), ("en", "Gangnam-gu"), ("jp", "江南区"), ("cn", "江南区")]:
+            SubRegionTranslation.objects.create(sub_region=self.gangnam, lang=lang, name=name)
+        self.food = Category.objects.create()
+        for lang, name in [("ko", "음식점"), ("en", "Restaurant")]:
+            CategoryTranslation.objects.create(category=self.food, lang=lang, name=name)
+        self.palace = Place.objects.create(content_id="1")
+        for lang, name in [("ko", "경복궁"), ("en", "Gyeongbokgung Palace")]:
+            PlaceTranslation.objects.create(place=self.palace, lang=lang, name=name)
+        self.drain_outbox()
+
+    def drain_outbox(self):
+        OutboxConsumer().drain()
+
+    def test_alias_keys(self):
+        self.assertEqual(alias_keys("subregion", "Gangnam-gu"), {"gangnamgu", "gangnam"})
+        self.assertEqual(alias_keys("region", "서울특별시"), {"서울특별시", "서울"})
+        self.assertEqual(alias_keys("subregion", "中区"), {"中区"})
+        # 관광지 이름은 그대로 ("경복궁"의 "궁"이나 "...시장"을 떼지 않음)
+        self.assertEqual(alias_keys("place", "남대문시장"), {"남대문시장"})
+        self.assertEqual(alias_keys("place", "  "), set())
+
+    # 별칭 컬럼보다 긴 이름도 변경 기록 처리를 막지 않음 (NFKC로 길어지는 "㎞"는 잘라서 저장)
+    def test_long_names_should_fit_alias_column(self):
+        max_length = EntityAlias._meta.get_field("alias").max_length
+        long_name = "가" * 150
+        place = Place.objects.create(content_id="2")
+        PlaceTranslation.objects.create(place=place, lang="ko", name=long_name)
+        PlaceTranslation.objects.create(place=place, lang="en", name="㎞" * 200)
+        self.drain_outbox()
+
+        self.assertFalse(CatalogChange.objects.pending().exists())
+        self.assertTrue(all(len(alias) <= max_length for alias in EntityAlias.objects.values_list("alias", flat=True)))
+        self.assertEqual(resolved(resolve_alias(long_name, "ko")), [("place", place.id, long_name)])
+        self.assertEqual(len(resolve_alias("㎞" * 200, "ko")), 1)
+
+    # 어느 언어로 검색해도 요청한 언어 이름으로
+    def test_any_language_should_resolve_in_requested_language(self):
+        for query in ["강남", "江南", "江南区", "gangnam", "Gangnam-gu", "강남구"]:
+            self.assertEqual(
+                resolved(resolve_alias(query, "en")), [("subregion", self.gangnam.id, "Gangnam-gu")], query
+            )
+        self.assertEqual(resolved(resolve_alias("Seoul", "cn")), [("region", self.seoul.id, "首尔特别市")])
+        self.assertEqual(resolved(resolve_alias("Restaurant", "ko")), [("category", self.food.id, "음식점")])
+        self.assertEqual(resolve_alias("강", "en"), [])
+
+    # lang 번역이 없으면 한국어 이름
+    def test_missing_translation_should_fall_back_to_korean(self):
+        self.assertEqual(resolved(resolve_alias("경복궁", "jp")), [("place", self.palace.id, "경복궁")])
+
+    # 별칭 1번 + 찾은 대상 종류별 이름 1번
+    def test_resolve_should_not_fan_out_per_language(self):
+        with self.assertNumQueries(2):
+            resolve_alias("江南", "en")
+
+    def test_changed_names_should_update_aliases(self):
+        translation = PlaceTranslation.objects.get(place=self.palace, lang="en")
+        translation.name = "Gyeongbok Palace"
+        translation.save()
+        self.drain_outbox()
+
+        self.assertEqual(resolve_alias("Gyeongbokgung Palace", "ko"), [])
+        self.assertEqual(resolved(resolve_alias("Gyeongbok Palace", "ko")), [("place", self.palace.id, "경복궁")])
+
+    def test_deleted_and_duplicate_places_should_be_removed(self):
+        duplicate = Place.objects.create(content_id="2")
+        PlaceTranslation.objects.create(place=duplicate, lang="ko", name="경복궁")
+        self.drain_outbox()
+        self.assertEqual(len(resolve_alias("경복궁")), 2)
+
+        Place.objects.filter(id=duplicate.id).update(canonical_id=self.palace.id)
+        CatalogChange.objects.create(entity=CatalogChange.ENTITY_PLACE, entity_id=duplicate.id)
+        self.gangnam.delete()
+        self.drain_outbox()
+
+        self.assertEqual(resolved(resolve_alias("경복궁")), [("place", self.palace.id, "경복궁")])
+        self.assertEqual(resolve_alias("강남"), [])
+        self.assertFalse(EntityAlias.objects.filter(entity="subregion").exists())
+
+    def test_rebuild_aliases_command(self):
+        EntityAlias.objects.all().delete()
+        out = StringIO()
+        call_command("rebuild_aliases", stdout=out)
+
+        self.assertIn("subregion: 별칭 6개", out.getvalue())
+        self.assertEqual(len(resolve_alias("江南", "en")), 1)
+
+    def test_resolve_api(self):
+        response = self.client.get("/api/search/resolve/?q=江南&lang=en")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["results"], [
+            {"type": "subregion", "id": self.gangnam.id, "name": "Gangnam-gu"}
+        ])
+
+    def test_resolve_api_should_validate_params(self):
+        for query in ["q=&lang=en", f"q={'가' * 101}", "q=강남&lang=xx", "q=강남&limit=0", "q=강남&limit=abc"]:
+            response = self.client.get(f"/api/search/resolve/?{query}")
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST, query)
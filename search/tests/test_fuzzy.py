@@ -0,0 +1,79 @@
+from django.core.cache import cache
+from django.test import SimpleTestCase
+from rest_framework import status
+from rest_framework.test import APITestCase
+from places.models import Place, PlaceTranslation
+from regions.models import Region, RegionTranslation, SubRegion, SubRegionTranslation
+from search.fuzzy import TrigramIndex, fuzzy_search, similarity, trigrams
+
+
+class TrigramTest(SimpleTestCase):
+
+    # pg_trgm과 같은 결과 (show_trgm('Cat'), similarity('gangnum', 'Gangnam-gu') = 5/13)
+    def test_trigrams_should_match_pg_trgm(self):
+        self.assertEqual(trigrams("Cat"), {"  c", " ca", "cat", "at "})
+        self.assertEqual(trigrams("a-b"), {"  a", " a ", "  b", " b "})
+        self.assertEqual(trigrams("!!"), set())
+        self.assertAlmostEqual(similarity("gangnum", "Gangnam-gu"), 5 / 13)
+        self.assertEqual(similarity("seoul", "SEOUL"), 1.0)
+
+    # 트라이그램이 겹치지 않는 이름은 보지 않음
+    def test_index_should_only_score_shared_trigrams(self):
+        index = TrigramIndex()
+        index.add("gangnam", "Gangnam-gu")
+        index.add("busan", "Busan")
+        index.add("empty", "!!")
+
+        self.assertEqual(index.search("Busna", threshold=0), [("busan", similarity("Busna", "Busan"))])
+        self.assertEqual([ref for ref, _ in index.search("Gangnum")], ["gangnam"])
+        self.assertEqual(index.search("Gangnum", threshold=0.5), [])
+
+
+# 오타 검색 테스트 (SQLite에서는 메모리 트라이그램 인덱스)
+class FuzzySearchTest(APITestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.seoul = Region.objects.create()
+        RegionTranslation.objects.create(region=self.seoul, lang="en", name="Seoul")
+        self.gangnam = SubRegion.objects.create(region=self.seoul)
+        SubRegionTranslation.objects.create(sub_region=self.gangnam, lang="en", name="Gangnam-gu")
+        SubRegionTranslation.objects.create(sub_region=self.gangnam, lang="ko", name="강남구")
+        self.station = Place.objects.create(content_id="1")
+        PlaceTranslation.objects.create(place=self.station, lang="en", name="Gangnam Station")
+        self.beach = Place.objects.create(content_id="2")
+        PlaceTranslation.objects.create(place=self.beach, lang="en", name="Haeundae Beach")
+
+    def found(self, query, lang="en"):
+        return [(result["type"], result["id"]) for result in fuzzy_search(query, lang)]
+
+    def test_misspelled_names_should_be_found(self):
+        self.assertEqual(self.found("Gangnum"), [("subregion", self.gangnam.id)])
+        self.assertEqual(self.found("Gangnum Staton"), [("place", self.station.id)])
+        self.assertEqual(self.found("Haeundea"), [("place", self.beach.id)])
+        self.assertEqual(self.found("Soeul"), [])
+        self.assertEqual(self.found("Seoull"), [("region", self.seoul.id)])
+
+    def test_search_should_use_requested_language(self):
+        self.assertEqual(self.found("강남구", "ko"), [("subregion", self.gangnam.id)])
+        self.assertEqual(self.found("Gangnum", "ko"), [])
+        self.assertEqual(self.found("!!"), [])
+
+    def test_duplicates_should_be_excluded(self):
+        duplicate = Place.objects.create(content_id="3", canonical_id=self.station.id)
+        PlaceTranslation.objects.create(place=duplicate, lang="en", name="Gangnam Stn")
+        self.assertNotIn(("place", duplicate.id), self.found("Gangnam Stn"))
+
+    def test_fuzzy_api(self):
+        response = self.client.get("/api/search/fuzzy/?q=Gangnum&lang=en&limit=1")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        results = response.data["results"]
+        self.assertEqual(len(results), 1)
+        self.assertEqual(results[0]["name"], "Gangnam-gu")
+        self.assertAlmostEqual(results[0]["score"], 5 / 13)
+
+    def test_fuzzy_api_should_validate_params(self):
+        for query in ["q=&lang=en", f"q={'a' * 51}", "q=seoul&lang=xx", "q=seoul&limit=0", "q=seoul&limit=abc"]:
+            response = self.client.get(f"/api/search/fuzzy/?{query}")
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST, query)
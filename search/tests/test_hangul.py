@@ -0,0 +1,80 @@
+from io import StringIO
+from django.core.management import call_command
+from django.test import SimpleTestCase
+from search.hangul import chosung, decompose, is_chosung_query, normalize
+from search.suggest import SuggestIndex, index_keys, query_keys
+
+
+class HangulTest(SimpleTestCase):
+
+    def test_decompose(self):
+        self.assertEqual(decompose("강남"), "ㄱㅏㅇㄴㅏㅁ")
+        # 겹모음/겹받침은 입력 순서대로
+        self.assertEqual(decompose("광"), "ㄱㅗㅏㅇ")
+        self.assertEqual(decompose("닭a"), "ㄷㅏㄹㄱa")
+
+    def test_chosung(self):
+        self.assertEqual(chosung("강남구"), "ㄱㄴㄱ")
+        self.assertEqual(chosung("N서울 타워ㅋ"), "ㅅㅇㅌㅇㅋ")
+
+    def test_normalize_should_keep_compatibility_jamo(self):
+        self.assertEqual(normalize("ㄱㄴＡ"), "ㄱㄴA")
+        self.assertTrue(is_chosung_query("ㄱㄴㄱ"))
+        self.assertFalse(is_chosung_query("ㄱㅏ"))
+        self.assertFalse(is_chosung_query(""))
+
+    def test_query_keys(self):
+        self.assertEqual(query_keys("ㄱㄴ"), ["ㄱㄴ", "\x01ㄱㄴ"])
+        self.assertEqual(query_keys("강ㄴ"), ["강ㄴ", "\x02ㄱㅏㅇㄴ"])
+        self.assertEqual(query_keys("Seoul"), ["seoul"])
+
+    def test_index_keys_should_skip_offsets_on_non_hangul(self):
+        offsets = {offset for _, offset in index_keys("N서울타워")}
+        self.assertEqual(offsets, {0, 1, 2, 3, 4})
+        self.assertEqual(index_keys("Seoul"), [("seoul", 0)])
+
+
+# 초성/자모 검색 테스트 (DB 없이 인덱스에 직접 적재)
+class HangulSuggestTest(SimpleTestCase):
+
+    def setUp(self):
+        self.index = SuggestIndex()
+        self.index.load({
+            ("subregion", 1): (10, {"ko": "강남구"}),
+            ("place", 2): (100, {"ko": "강남역"}),
+            ("place", 3): (50, {"ko": "남산공원"}),
+            ("place", 4): (1, {"ko": "광화문"}),
+        })
+
+    def found(self, prefix):
+        return [(result["type"], result["id"]) for result in self.index.lookup(prefix, "ko")]
+
+    def test_chosung_query(self):
+        self.assertEqual(self.found("ㄱㄴㄱ"), [("subregion", 1)])
+        self.assertEqual(self.found("ㄱㄴ"), [("place", 2), ("subregion", 1)])
+
+    # 입력 중인 음절도 일치 ("강ㄴ", "강나", "고" → 광화문)
+    def test_partial_syllable_query(self):
+        self.assertEqual(self.found("강ㄴ"), [("place", 2), ("subregion", 1)])
+        self.assertEqual(self.found("강나"), [("place", 2), ("subregion", 1)])
+        # 남산공원은 중간의 "공"과 일치해서 뒤로
+        self.assertEqual(self.found("고"), [("place", 4), ("place", 3)])
+
+    # 앞부분 일치가 중간 일치보다 위 (인기도와 무관)
+    def test_prefix_should_rank_above_infix(self):
+        self.assertEqual(self.found("남"), [("place", 3), ("place", 2), ("subregion", 1)])
+        self.assertEqual(self.found("남구"), [("subregion", 1)])
+        self.assertEqual(self.found("ㄴㄱ"), [("subregion", 1)])
+
+
+class BenchmarkSuggestCommandTest(SimpleTestCase):
+
+    def test_benchmark_should_report_each_size(self):
+        out = StringIO()
+        call_command("benchmark_suggest", sizes="50,100", queries=10, stdout=out)
+        output = out.getvalue()
+        self.assertIn("이름 50개", output)
+        self.assertIn("이름 100개", output)
+        self.assertIn("초성", output)
+        self.assertIn("초성 1자", output)
+        self.assertIn("첫 글자", output)
@@ -0,0 +1,203 @@
+from unittest import mock
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase
+from rest_framework import status
+from rest_framework.test import APITestCase
+from outbox.changes import record
+from outbox.consumer import OutboxConsumer
+from outbox.models import CatalogChange
+from places.models import Place, PlaceTranslation
+from regions.models import Region, RegionTranslation, SubRegion, SubRegionTranslation
+from search.suggest import SuggestIndex, suggest_index, suggest_key
+
+
+def create_catalog(test):
+    test.seoul = Region.objects.create()
+    RegionTranslation.objects.create(region=test.seoul, lang="ko", name="서울")
+    RegionTranslation.objects.create(region=test.seoul, lang="en", name="Seoul")
+    test.gangnam = SubRegion.objects.create(region=test.seoul, favorite_count=10)
+    SubRegionTranslation.objects.create(sub_region=test.gangnam, lang="ko", name="강남구")
+    SubRegionTranslation.objects.create(sub_region=test.gangnam, lang="en", name="Gangnam-gu")
+    test.seocho = SubRegion.objects.create(region=test.seoul, favorite_count=5)
+    SubRegionTranslation.objects.create(sub_region=test.seocho, lang="ko", name="서초구")
+
+    test.forest = Place.objects.create(content_id="1", favorite_count=3)
+    PlaceTranslation.objects.create(place=test.forest, lang="ko", name="서울숲")
+    test.station = Place.objects.create(content_id="2", favorite_count=100)
+    PlaceTranslation.objects.create(place=test.station, lang="ko", name="강남역")
+    PlaceTranslation.objects.create(place=test.station, lang="en", name="Gangnam Station")
+
+
+def suggested(results):
+    return [(result["type"], result["id"]) for result in results]
+
+
+# 자동완성 인덱스 테스트
+class SuggestIndexTest(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        create_catalog(self)
+        CatalogChange.objects.all().delete()
+        self.index = SuggestIndex(check_interval=0)
+        self.index.build()
+
+    def drain_outbox(self):
+        OutboxConsumer().drain()
+
+    def test_suggest_key(self):
+        self.assertEqual(suggest_key(" Gangnam-gu "), "gangnamgu")
+        self.assertEqual(suggest_key("ＳＥＯＵＬ 숲"), "seoul숲")
+
+    # 지역 인기도는 지역구 즐겨찾기 수 합
+    def test_prefix_should_be_ranked_by_popularity(self):
+        self.assertEqual(suggested(self.index.suggest("서", "ko")), [
+            ("region", self.seoul.id), ("subregion", self.seocho.id), ("place", self.forest.id)
+        ])
+        self.assertEqual(suggested(self.index.suggest("서울", "ko", limit=1)), [("region", self.seoul.id)])
+        self.assertEqual(self.index.suggest("서울", "ko")[1]["name"], "서울숲")
+
+    def test_suggest_should_use_requested_language(self):
+        self.assertEqual(suggested(self.index.suggest("gang nam", "en")), [
+            ("place", self.station.id), ("subregion", self.gangnam.id)
+        ])
+        self.assertEqual(self.index.suggest("gang", "ko"), [])
+        self.assertEqual(self.index.suggest("  ", "ko"), [])
+
+    # 버전 확인 간격 안의 조회는 DB를 보지 않음
+    def test_lookup_should_not_query_database(self):
+        index = SuggestIndex(check_interval=60)
+        index.build()
+        with self.assertNumQueries(0):
+            for prefix in ["서", "서울", "강", "없는이름"]:
+                index.suggest(prefix, "ko")
+
+    # 처리된 변경 기록의 관광지만 다시 읽음
+    def test_changed_places_should_be_applied_incrementally(self):
+        tower = Place.objects.create(content_id="3", favorite_count=50)
+        PlaceTranslation.objects.create(place=tower, lang="ko", name="서울타워")
+        self.drain_outbox()
+
+        # 변경 기록 1번 + 관광지 2번
+        with self.assertNumQueries(3):
+            results = self.index.suggest("서울", "ko")
+        self.assertEqual(suggested(results), [
+            ("place", tower.id), ("region", self.seoul.id), ("place", self.forest.id)
+        ])
+
+    def test_deleted_and_duplicate_places_should_be_removed(self):
+        Place.objects.filter(id=self.station.id).update(canonical_id=self.forest.id)
+        record(CatalogChange.ENTITY_PLACE, [self.station.id])
+        self.drain_outbox()
+
+        self.assertEqual(self.index.suggest("강남역", "ko"), [])
+
+        # 대표가 삭제되면 중복이었던 관광지가 다시 나옴
+        self.forest.delete()
+        self.drain_outbox()
+
+        self.assertEqual(suggested(self.index.suggest("강남역", "ko")), [("place", self.station.id)])
+        self.assertEqual(suggested(self.index.suggest("서", "ko")), [
+            ("region", self.seoul.id), ("subregion", self.seocho.id)
+        ])
+
+    def test_renamed_subregion_should_be_applied(self):
+        translation = SubRegionTranslation.objects.get(sub_region=self.seocho, lang="ko")
+        translation.name = "양재동"
+        translation.save()
+        self.drain_outbox()
+
+        self.assertEqual(suggested(self.index.suggest("양재", "ko")), [("subregion", self.seocho.id)])
+        self.assertEqual(suggested(self.index.suggest("서초", "ko")), [])
+
+    # 버전이 그대로면 변경 기록을 읽지 않음
+    def test_unchanged_version_should_skip_change_log(self):
+        self.index.suggest("서", "ko")
+        with self.assertNumQueries(0):
+            self.index.suggest("강", "ko")
+
+
+# 부분 갱신은 새로 빌드한 것과 같은 배열
+class SuggestIndexMergeTest(SimpleTestCase):
+
+    # 바뀐 키가 적으면 bisect, 많으면 전체 정렬 - 어느 쪽이든 결과가 같아야 함
+    def test_replace_should_match_full_load(self):
+        for insort_max_keys in (0, 10 ** 6):
+            with mock.patch("search.suggest.INSORT_MAX_KEYS", insort_max_keys):
+                self.check_replace()
+
+    def check_replace(self):
+        before = {("place", place_id): (place_id, {"ko": f"강남{place_id}번지", "en": f"Gangnam {place_id}"})
+                  for place_id in range(50)}
+        after = dict(before)
+        for place_id in range(0, 50, 3):
+            after[("place", place_id)] = (place_id, {"ko": f"서초{place_id}번지"})
+        for place_id in range(1, 50, 7):
+            after.pop(("place", place_id))
+        after[("region", 1)] = (0, {"ko": "서울", "en": "Seoul"})
+
+        index = SuggestIndex()
+        index.load(dict(before))
+        index._replace(
+            set(before) - set(after),
+            {ref: entry for ref, entry in after.items() if before.get(ref) != entry}
+        )
+        expected = SuggestIndex()
+        expected.load(after)
+
+        self.assertEqual(index._snapshot.keys, expected._snapshot.keys)
+        self.assertEqual(index._snapshot.entries, expected._snapshot.entries)
+        self.assertEqual(index._snapshot.top, expected._snapshot.top)
+
+    # 상위 목록이 꽉 찬 접두어에서 목록 안의 항목이 빠지거나 밀려나도 새로 빌드한 것과 같아야 함
+    def test_replace_should_refill_full_top(self):
+        before = {("place", place_id): (place_id, {"ko": f"강남{place_id}"}) for place_id in range(60)}
+        after = {ref: entry for ref, entry in before.items() if ref[1] % 5}
+        after[("place", 58)] = (0, {"ko": "강남58"})
+        after[("place", 100)] = (30, {"ko": "가로수길"})
+
+        index = SuggestIndex()
+        index.load(dict(before))
+        index._replace(
+            set(before) - set(after),
+            {ref: entry for ref, entry in after.items() if before.get(ref) != entry}
+        )
+        expected = SuggestIndex()
+        expected.load(after)
+
+        self.assertEqual(index._snapshot.top, expected._snapshot.top)
+
+    # 짧은 검색어는 미리 계산한 상위 목록, limit이 크면 전체를 훑음 - 결과는 같아야 함
+    def test_short_prefix_top_should_match_scan(self):
+        entries = {("place", place_id): (place_id % 7, {"ko": f"{'강남서초'[place_id % 4]}{place_id}가"})
+                   for place_id in range(100)}
+        index = SuggestIndex()
+        index.load(entries)
+
+        for prefix in ("ㄱ", "ㄱㄴ", "가", "강", "서", "ㅅ"):
+            with mock.patch("search.suggest.TOP_K", 0):
+                scanned = index.lookup(prefix, "ko", 10)
+            self.assertEqual(index.lookup(prefix, "ko", 10), scanned)
+
+
+# 자동완성 API 테스트
+class SuggestAPITest(APITestCase):
+
+    def setUp(self):
+        cache.clear()
+        create_catalog(self)
+        suggest_index.build()
+
+    def test_suggest_api(self):
+        response = self.client.get("/api/search/suggest/?prefix=강남&lang=ko")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["suggestions"], [
+            {"type": "place", "id": self.station.id, "name": "강남역"},
+            {"type": "subregion", "id": self.gangnam.id, "name": "강남구"},
+        ])
+
+    def test_suggest_api_should_validate_params(self):
+        for query in ["prefix=서&lang=xx", "prefix=서&limit=0", "prefix=서&limit=abc", f"prefix={'가' * 51}"]:
+            response = self.client.get(f"/api/search/suggest/?{query}")
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST, query)
@@ -0,0 +1,10 @@
+from django.urls import path
+from search.views import FuzzySearchAPI, ResolveAPI, SuggestAPI
+
+app_name = "search"
+
+urlpatterns = [
+    path("suggest/", SuggestAPI.as_view(), name="suggest"),
+    path("fuzzy/", FuzzySearchAPI.as_view(), name="fuzzy"),
+    path("resolve/", ResolveAPI.as_view(), name="resolve"),
+]
@@ -0,0 +1,151 @@
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework import status
+from rest_framework.permissions import AllowAny
+from search.aliases import resolve_alias
+from search.fuzzy import fuzzy_search
+from search.suggest import suggest_index
+
+SUGGEST_DEFAULT_LIMIT = 10
+SUGGEST_MAX_LIMIT = 20
+SUGGEST_MAX_PREFIX_LENGTH = 50
+
+FUZZY_DEFAULT_LIMIT = 10
+FUZZY_MAX_LIMIT = 20
+FUZZY_MAX_QUERY_LENGTH = 50
+
+RESOLVE_DEFAULT_LIMIT = 10
+RESOLVE_MAX_LIMIT = 20
+RESOLVE_MAX_QUERY_LENGTH = 100
+
+
+class SuggestAPI(APIView):
+    # 입력할 때마다 호출되는 자동완성 (워커 메모리 인덱스만 조회)
+    permission_classes = [AllowAny]
+
+    def get(self, request):
+        lang = request.query_params.get("lang", "ko")
+
+        supported_languages = ["ko", "en", "jp", "cn"]
+        if lang not in supported_languages:
+            return Response(
+                {"error": f"지원하지 않는 언어입니다. 지원 언어: {', '.join(supported_languages)}"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        prefix = request.query_params.get("prefix", "")
+        if len(prefix) > SUGGEST_MAX_PREFIX_LENGTH:
+            return Response(
+                {"error": f"prefix는 {SUGGEST_MAX_PREFIX_LENGTH}자 이하여야 합니다."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        try:
+            limit = int(request.query_params.get("limit") or SUGGEST_DEFAULT_LIMIT)
+            if not 1 <= limit <= SUGGEST_MAX_LIMIT:
+                raise ValueError
+        except ValueError:
+            return Response(
+                {"error": f"limit은 1~{SUGGEST_MAX_LIMIT} 사이의 숫자여야 합니다."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        try:
+            return Response(
+                {"suggestions": suggest_index.suggest(prefix, lang, limit)},
+                status=status.HTTP_200_OK
+            )
+
+        except Exception as e:
+            return Response(
+                {"error": "자동완성 조회 중 오류가 발생했습니다."},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+
+class FuzzySearchAPI(APIView):
+    # 오타가 있는 이름 검색 ("Gangnum" → Gangnam-gu, 트라이그램 유사도 순)
+    permission_classes = [AllowAny]
+
+    def get(self, request):
+        lang = request.query_params.get("lang", "ko")
+
+        supported_languages = ["ko", "en", "jp", "cn"]
+        if lang not in supported_languages:
+            return Response(
+                {"error": f"지원하지 않는 언어입니다. 지원 언어: {', '.join(supported_languages)}"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        query = request.query_params.get("q", "").strip()
+        if not query or len(query) > FUZZY_MAX_QUERY_LENGTH:
+            return Response(
+                {"error": f"q는 1~{FUZZY_MAX_QUERY_LENGTH}자의 검색어여야 합니다."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        try:
+            limit = int(request.query_params.get("limit") or FUZZY_DEFAULT_LIMIT)
+            if not 1 <= limit <= FUZZY_MAX_LIMIT:
+                raise ValueError
+        except ValueError:
+            return Response(
+                {"error": f"limit은 1~{FUZZY_MAX_LIMIT} 사이의 숫자여야 합니다."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        try:
+            return Response(
+                {"results": fuzzy_search(query, lang, limit)},
+                status=status.HTTP_200_OK
+            )
+
+        except Exception as e:
+            return Response(
+                {"error": "이름 검색 중 오류가 발생했습니다."},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+
+class ResolveAPI(APIView):
+    # 어느 언어의 이름으로 검색해도 요청한 언어 이름으로 ("江南" + lang=en → Gangnam-gu)
+    permission_classes = [AllowAny]
+
+    def get(self, request):
+        lang = request.query_params.get("lang", "ko")
+
+        supported_languages = ["ko", "en", "jp", "cn"]
+        if lang not in supported_languages:
+            return Response(
+                {"error": f"지원하지 않는 언어입니다. 지원 언어: {', '.join(supported_languages)}"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        query = request.query_params.get("q", "").strip()
+        if not query or len(query) > RESOLVE_MAX_QUERY_LENGTH:
+            return Response(
+                {"error": f"q는 1~{RESOLVE_MAX_QUERY_LENGTH}자의 검색어여야 합니다."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        try:
+            limit = int(request.query_params.get("limit") or RESOLVE_DEFAULT_LIMIT)
+            if not 1 <= limit <= RESOLVE_MAX_LIMIT:
+                raise ValueError
+        except ValueError:
+            return Response(
+                {"error": f"limit은 1~{RESOLVE_MAX_LIMIT} 사이의 숫자여야 합니다."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        try:
+            return Response(
+                {"results": resolve_alias(query, lang, limit)},
+                status=status.HTTP_200_OK
+            )
+
+        except Exception as e:
+            return Response(
+                {"error": "별칭 조회 중 오류가 발생했습니다."},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )